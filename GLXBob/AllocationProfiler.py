@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gc
+import tracemalloc
+from collections import deque
+from GLXBob.EventBusMetrics import EventBusMetrics
+from GLXBob.EventBusMetrics import LATENCY_BUCKETS
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# The allocations of the profiler and of tracemalloc are not allocation sites of the application
+_IGNORED_FILES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+class AllocationProfiler(EventBusMetrics):
+    """
+    :Description:
+
+    The :class:`AllocationProfiler <GLXBob.AllocationProfiler.AllocationProfiler>` object measure with
+    :py:mod:`tracemalloc` the memory allocated by each frame of a :class:`MainLoop <GLXBob.MainLoop.MainLoop>`, and
+    by each signal and handler of it :class:`EventBus <GLXBob.EventBus.EventBus>`. It is a
+    :class:`EventBusMetrics <GLXBob.EventBusMetrics.EventBusMetrics>`, the counters and the latency histograms are
+    kept.
+
+    Measures:
+       * per frame: ``net`` bytes still allocated at the end of the frame, ``peak`` bytes allocated over the memory
+         of the frame start, and ``collections`` run by the garbage collector during the frame
+       * per signal and per handler: calls, ``net`` and ``peak`` bytes of the invocations
+       * every ``sample_interval`` frames: a snapshot is compared to the previous one, the allocation sites it
+         grow the most and the number of allocated blocks by frame are reported
+
+    Tracing the allocations slow down the program, the profiler is opt-in. It measure the whole process, the
+    allocations of the other threads during a frame or a handler are counted with it.
+
+    .. code-block:: python
+
+       profiler = AllocationProfiler(sample_interval=60)
+       mainloop.set_allocation_profiler(profiler)
+       ...
+       print(profiler.report())
+    """
+    def __init__(self, nframes=1, sample_interval=60, top=10, history=600, buckets=LATENCY_BUCKETS):
+        """
+        :param nframes: number of frames of the traceback stored by :py:mod:`tracemalloc` for each allocation
+        :param sample_interval: number of frames between two snapshots, ``0`` for never take a snapshot
+        :param top: number of allocation sites kept by a snapshot comparison
+        :param history: number of frames kept
+        :param buckets: sorted upper bounds in seconds of the latency histograms buckets
+        :type nframes: int
+        :type sample_interval: int
+        :type top: int
+        :type history: int
+        :type buckets: tuple
+        :raise TypeError: if ``nframes``, ``sample_interval``, ``top`` or ``history`` parameter is not a
+           :py:data:`int` type
+        """
+        for name, value in (('nframes', nframes), ('sample_interval', sample_interval), ('top', top),
+                            ('history', history)):
+            if type(value) != int:
+                raise TypeError(u'>' + name + u'< parameter must be a int')
+        super(AllocationProfiler, self).__init__(buckets)
+        self.__nframes = max(nframes, 1)
+        self.__sample_interval = max(sample_interval, 0)
+        self.__top = top
+        self.__frames = deque(maxlen=max(history, 1))
+        self.__started = False
+        self.__was_tracing = False
+        self.__frame = 0
+        self.__frame_start = None
+        self.__frame_peak = 0
+        self.__collections = 0
+        self.__snapshot = None
+        self.__snapshot_frame = 0
+        self.__top_sites = list()
+        self.__allocations = dict()
+
+    def start(self):
+        """
+        Start to trace the allocations, a :class:`MainLoop <GLXBob.MainLoop.MainLoop>` call it when it run.
+        """
+        if self.__started:
+            return
+        self.__was_tracing = tracemalloc.is_tracing()
+        if not self.__was_tracing:
+            tracemalloc.start(self.__nframes)
+        gc.callbacks.append(self._on_collection)
+        self.__snapshot = None
+        self.__started = True
+
+    def stop(self):
+        """
+        Stop to trace the allocations, unless they was traced before
+        :func:`AllocationProfiler.start() <GLXBob.AllocationProfiler.AllocationProfiler.start()>`. The measures are
+        kept.
+        """
+        if not self.__started:
+            return
+        gc.callbacks.remove(self._on_collection)
+        if not self.__was_tracing:
+            tracemalloc.stop()
+        self.__snapshot = None
+        self.__frame_start = None
+        self.__started = False
+
+    def is_started(self):
+        """
+        Get the state of the profiler.
+
+        :return: :py:obj:`True` if the allocations are traced
+        :rtype: bool
+        """
+        return self.__started
+
+    def begin_frame(self):
+        """
+        Mark the start of a frame.
+        """
+        if not self.__started:
+            return
+        self.__frame_start = tracemalloc.get_traced_memory()[0]
+        self.__frame_peak = self.__frame_start
+        self.__collections = 0
+        tracemalloc.reset_peak()
+
+    def end_frame(self):
+        """
+        Mark the end of a frame and store it measures.
+
+        :return: the measures of the frame, or :py:obj:`None` if no frame is started
+        :rtype: dict or None
+        """
+        if self.__frame_start is None:
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        self.__frame += 1
+        infos = {
+            'frame': self.__frame,
+            'net': current - self.__frame_start,
+            'peak': max(peak, self.__frame_peak) - self.__frame_start,
+            'collections': self.__collections,
+            'blocks': None
+        }
+        self.__frame_start = None
+        if self.__sample_interval and self.__frame % self.__sample_interval == 0:
+            infos['blocks'] = self._sample()
+        self.__frames.append(infos)
+        return infos
+
+    def get_frames(self):
+        """
+        Get the measures of the last frames.
+
+        :return: a dictionary by frame, oldest first, with ``frame``, ``net``, ``peak``, ``collections`` and
+           ``blocks`` (allocated blocks by frame since the previous snapshot, :py:obj:`None` when the frame have no
+           snapshot) entries
+        :rtype: list
+        """
+        return list(self.__frames)
+
+    def get_top_sites(self):
+        """
+        Get the allocation sites it grow the most between the two last snapshots.
+
+        :return: ``(site, size_diff, count_diff)`` tuples, largest first, ``site`` is ``'file:line'``
+        :rtype: list
+        """
+        return list(self.__top_sites)
+
+    def get_allocations(self):
+        """
+        Get the allocations of the handlers invocations.
+
+        :return: a dictionary with a ``signals`` entry, the allocations by signal name, and a ``handlers`` entry,
+           the allocations by handler identifier. A allocation is a ``calls``, ``net`` and ``peak`` dictionary.
+        :rtype: dict
+        """
+        signals = dict()
+        handlers = dict()
+        for handler_id, (detailed_signal, name, totals) in list(self.__allocations.items()):
+            if not totals[0]:
+                continue
+            handlers[handler_id] = {
+                'signal': detailed_signal,
+                'handler': name,
+                'calls': totals[0],
+                'net': totals[1],
+                'peak': totals[2]
+            }
+            infos = signals.setdefault(detailed_signal, {'calls': 0, 'net': 0, 'peak': 0})
+            infos['calls'] += totals[0]
+            infos['net'] += totals[1]
+            infos['peak'] += totals[2]
+        return {'signals': signals, 'handlers': handlers}
+
+    def report(self, limit=10):
+        """
+        Format the measures for a human.
+
+        :param limit: maximum number of lines by section
+        :type limit: int
+        :return: the report text
+        :rtype: str
+        """
+        lines = list()
+        frames = self.get_frames()
+        if frames:
+            lines.append('Frames: {0}, mean net {1:.0f} B, mean peak {2:.0f} B, collections {3}'.format(
+                len(frames),
+                sum(infos['net'] for infos in frames) / float(len(frames)),
+                sum(infos['peak'] for infos in frames) / float(len(frames)),
+                sum(infos['collections'] for infos in frames)
+            ))
+        allocations = self.get_allocations()
+        handlers = sorted(allocations['handlers'].items(), key=lambda item: item[1]['peak'], reverse=True)
+        if handlers:
+            lines.append('Handlers by peak bytes:')
+        for handler_id, infos in handlers[:limit]:
+            lines.append('  {0:>12} B peak {1:>12} B net {2:>8} calls  {3} ({4}, #{5})'.format(
+                infos['peak'], infos['net'], infos['calls'], infos['handler'], infos['signal'], handler_id
+            ))
+        if self.__top_sites:
+            lines.append('Allocation sites:')
+        for site, size_diff, count_diff in self.__top_sites[:limit]:
+            lines.append('  {0:>+12} B {1:>+8} blocks  {2}'.format(size_diff, count_diff, site))
+        return '\n'.join(lines) + '\n'
+
+    def invoke(self, counters, handler_id, detailed_signal, handler, args):
+        """
+        Invoke a handler for the :class:`EventBus <GLXBob.EventBus.EventBus>`, measure it latency and it
+        allocations.
+
+        :param counters: the counters list of the signal
+        :param handler_id: a integer handler identifier
+        :param detailed_signal: a string containing the signal name
+        :param handler: the invoked function or method
+        :param args: parameters of the handler
+        :return: the handler return value
+        """
+        if not self.__started:
+            return super(AllocationProfiler, self).invoke(counters, handler_id, detailed_signal, handler, args)
+        before, peak = tracemalloc.get_traced_memory()
+        # The peak of the frame is kept before it is reset for the handler
+        if peak > self.__frame_peak:
+            self.__frame_peak = peak
+        tracemalloc.reset_peak()
+        try:
+            return super(AllocationProfiler, self).invoke(counters, handler_id, detailed_signal, handler, args)
+        finally:
+            after, peak = tracemalloc.get_traced_memory()
+            if peak > self.__frame_peak:
+                self.__frame_peak = peak
+            entry = self.__allocations.get(handler_id)
+            if entry is not None:
+                totals = entry[2]
+                totals[0] += 1
+                totals[1] += after - before
+                totals[2] += peak - before
+
+    def add_handler(self, handler_id, detailed_signal, handler):
+        """
+        Create the latency histogram and the allocations of a handler.
+
+        :param handler_id: a integer handler identifier
+        :param detailed_signal: a string containing the signal name
+        :param handler: the connected function or method
+        """
+        self.__allocations.setdefault(handler_id, (
+            detailed_signal,
+            getattr(handler, '__qualname__', repr(handler)),
+            [0, 0, 0]
+        ))
+        super(AllocationProfiler, self).add_handler(handler_id, detailed_signal, handler)
+
+    def remove_handler(self, handler_id):
+        """
+        Forget the latency histogram and the allocations of a handler.
+
+        :param handler_id: a integer handler identifier
+        :return: :py:obj:`True` if the handler had a histogram
+        :rtype: bool
+        """
+        self.__allocations.pop(handler_id, None)
+        return super(AllocationProfiler, self).remove_handler(handler_id)
+
+    def reset(self):
+        """
+        Clear every counters, histograms and allocation measures.
+        """
+        super(AllocationProfiler, self).reset()
+        self.__allocations = dict(
+            (handler_id, (detailed_signal, name, [0, 0, 0]))
+            for handler_id, (detailed_signal, name, _) in self.__allocations.items()
+        )
+        self.__frames.clear()
+        self.__top_sites = list()
+        self.__snapshot = None
+
+    # Internal Method's
+    def _sample(self):
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_FILES)
+        previous, previous_frame = self.__snapshot, self.__snapshot_frame
+        self.__snapshot, self.__snapshot_frame = snapshot, self.__frame
+        if previous is None:
+            return None
+        statistics = snapshot.compare_to(previous, 'lineno')
+        self.__top_sites = [
+            ('{0}:{1}'.format(statistic.traceback[0].filename, statistic.traceback[0].lineno),
+             statistic.size_diff,
+             statistic.count_diff)
+            for statistic in sorted(statistics, key=lambda item: item.size_diff, reverse=True)[:self.__top]
+            if statistic.size_diff > 0
+        ]
+        return sum(statistic.count_diff for statistic in statistics) / float(self.__frame - previous_frame)
+
+    def _on_collection(self, phase, info):
+        if phase == 'start':
+            self.__collections += 1
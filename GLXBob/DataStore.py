@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+
+class DataStore(object):
+    """
+    :Description:
+
+    The :class:`DataStore <GLXBob.DataStore.DataStore>` object is a key / value store with optional bounds,
+    it is used behind :func:`EventBus.set_data() <GLXBob.EventBus.EventBus.set_data()>` and
+    :func:`EventBus.get_data() <GLXBob.EventBus.EventBus.get_data()>`.
+
+    Policies:
+       * **capacity**: maximum number of entries, the least recently used entry is evicted in O(1)
+       * **max_size**: maximum memory size in bytes of the stored values, measured by ``sizeof``
+       * **ttl**: time to live in seconds, a expired entry is removed when it is accessed or by
+         :func:`DataStore.sweep() <GLXBob.DataStore.DataStore.sweep()>`
+
+    Every policy is disabled by default, then the store is unbounded.
+    """
+    def __init__(self, capacity=None, ttl=None, max_size=None, clock=monotonic, sizeof=sys.getsizeof):
+        """
+        :param capacity: maximum number of entries or :py:obj:`None` for no limit
+        :param ttl: time to live of a entry in seconds or :py:obj:`None` for never expire
+        :param max_size: maximum size of the values in bytes or :py:obj:`None` for no limit
+        :param clock: the time source of the ttl policy
+        :param sizeof: a callable it return the size of a value in bytes, by default the shallow
+           :py:func:`sys.getsizeof`
+        :type capacity: int or None
+        :type ttl: float or None
+        :type max_size: int or None
+        :type clock: callable
+        :type sizeof: callable
+        """
+        self.__entries = OrderedDict()
+        self.__expirations = list()
+        # Tie breaker of the heap, the keys are never compared
+        self.__sequence = itertools.count()
+        self.__capacity = None
+        self.__ttl = None
+        self.__max_size = None
+        self.__size = 0
+        self.__clock = clock
+        self.__sizeof = sizeof
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations_count = 0
+        self.__last_sweep = None
+        self.__lock = threading.Lock()
+        self.set_capacity(capacity)
+        self.set_ttl(ttl)
+        self.set_max_size(max_size)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        with self.__lock:
+            return self._get_entry(key) is not None
+
+    def set_capacity(self, capacity=None):
+        """
+        Set the maximum number of entries, the least recently used entries are evicted when it is reach.
+
+        :param capacity: maximum number of entries or :py:obj:`None` for no limit
+        :type capacity: int or None
+        :raise TypeError: if ``capacity`` parameter is not a :py:data:`int` or :py:obj:`None`
+        """
+        if type(capacity) == int or capacity is None:
+            with self.__lock:
+                self.__capacity = capacity
+                self._evict()
+        else:
+            raise TypeError(u'>capacity< parameter must be a int or None')
+
+    def get_capacity(self):
+        """
+        Get the maximum number of entries.
+
+        :return: maximum number of entries or :py:obj:`None`
+        :rtype: int or None
+        """
+        return self.__capacity
+
+    def set_ttl(self, ttl=None):
+        """
+        Set the default time to live of the entries, it apply to the next stored entries.
+
+        :param ttl: time to live in seconds or :py:obj:`None` for never expire
+        :type ttl: float or None
+        :raise TypeError: if ``ttl`` parameter is not a :py:data:`float` or :py:obj:`None`
+        """
+        if type(ttl) == float or ttl is None:
+            self.__ttl = ttl
+        else:
+            raise TypeError(u'>ttl< parameter must be a float or None')
+
+    def get_ttl(self):
+        """
+        Get the default time to live of the entries.
+
+        :return: time to live in seconds or :py:obj:`None`
+        :rtype: float or None
+        """
+        return self.__ttl
+
+    def set_max_size(self, max_size=None):
+        """
+        Set the maximum memory size of the stored values, the least recently used entries are evicted when it
+        is reach.
+
+        :param max_size: maximum size in bytes or :py:obj:`None` for no limit
+        :type max_size: int or None
+        :raise TypeError: if ``max_size`` parameter is not a :py:data:`int` or :py:obj:`None`
+        """
+        if type(max_size) == int or max_size is None:
+            with self.__lock:
+                self.__max_size = max_size
+                self._evict()
+        else:
+            raise TypeError(u'>max_size< parameter must be a int or None')
+
+    def get_max_size(self):
+        """
+        Get the maximum memory size of the stored values.
+
+        :return: maximum size in bytes or :py:obj:`None`
+        :rtype: int or None
+        """
+        return self.__max_size
+
+    def get_size(self):
+        """
+        Get the memory size of the stored values, as measured by ``sizeof``.
+
+        :return: size in bytes
+        :rtype: int
+        """
+        return self.__size
+
+    def get(self, key, default=None):
+        """
+        Return the value associated with the key, and mark it as the most recently used.
+
+        :param key: the key
+        :param default: returned value when the key is missing or expired
+        :return: the value associated with the key or ``default``
+        """
+        with self.__lock:
+            entry = self._get_entry(key)
+            if entry is None:
+                self.__misses += 1
+                return default
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, ttl=None):
+        """
+        Associate the value with the key, then evict the least recently used entries out of the bounds.
+
+        :param key: the key
+        :param value: a Python object
+        :param ttl: time to live of this entry in seconds, :py:obj:`None` for the default time to live
+        :type ttl: float or None
+        """
+        if ttl is None:
+            ttl = self.__ttl
+        size = self.__sizeof(value)
+        with self.__lock:
+            self._remove(key)
+            expire = None
+            if ttl is not None:
+                expire = self.__clock() + ttl
+                heapq.heappush(self.__expirations, (expire, next(self.__sequence), key))
+            self.__entries[key] = (value, expire, size)
+            self.__size += size
+            self._evict()
+
+    def delete(self, key):
+        """
+        Remove the key and it value.
+
+        :param key: the key
+        :return: :py:obj:`True` if the key was stored
+        :rtype: bool
+        """
+        with self.__lock:
+            return self._remove(key)
+
+    def clear(self):
+        """
+        Remove every entries, the counters are not reset.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__expirations = list()
+            self.__size = 0
+
+    def sweep(self):
+        """
+        Remove the expired entries. The expiration dates are stored in a heap, the cost depend of the number of
+        expired entries, not of the store size.
+
+        :return: number of removed entries
+        :rtype: int
+        """
+        now = self.__clock()
+        count = 0
+        with self.__lock:
+            while self.__expirations and self.__expirations[0][0] <= now:
+                expire, _, key = heapq.heappop(self.__expirations)
+                entry = self.__entries.get(key)
+                # The heap keep the dates of replaced entries, they are ignored
+                if entry is not None and entry[1] == expire:
+                    self._remove(key)
+                    self.__expirations_count += 1
+                    count += 1
+            self.__last_sweep = now
+        return count
+
+    def attach(self, mainloop, interval=1.0):
+        """
+        Sweep the expired entries periodically from a :class:`MainLoop <GLXBob.MainLoop.MainLoop>`.
+
+        :param mainloop: the loop
+        :param interval: minimal time between two sweeps in seconds
+        :type mainloop: GLXBob.MainLoop
+        :type interval: float
+        :return: a integer source identifier
+        :rtype: int
+        :raise TypeError: if ``interval`` parameter is not a :py:data:`float` type
+        """
+        if type(interval) != float:
+            raise TypeError(u'>interval< parameter must be a float')
+        return mainloop.idle_add(self._sweep_frame, interval)
+
+    def get_stats(self):
+        """
+        Get the counters of the store.
+
+        :return: ``hits``, ``misses``, ``evictions``, ``expirations``, ``entries`` and ``size`` counters
+        :rtype: dict
+        """
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'evictions': self.__evictions,
+            'expirations': self.__expirations_count,
+            'entries': len(self.__entries),
+            'size': self.__size
+        }
+
+    # Internal Method's
+    def _get_entry(self, key):
+        # Lazy expiry, a expired entry is removed when it is accessed
+        entry = self.__entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= self.__clock():
+            self._remove(key)
+            self.__expirations_count += 1
+            return None
+        return entry
+
+    def _remove(self, key):
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return False
+        self.__size -= entry[2]
+        return True
+
+    def _evict(self):
+        while self.__entries and (
+                (self.__capacity is not None and len(self.__entries) > self.__capacity) or
+                (self.__max_size is not None and self.__size > self.__max_size)):
+            _, entry = self.__entries.popitem(last=False)
+            self.__size -= entry[2]
+            self.__evictions += 1
+        # The heap must not grow with the dates of removed entries
+        if len(self.__expirations) > 2 * len(self.__entries) + 64:
+            self.__expirations = [
+                item for item in self.__expirations
+                if item[2] in self.__entries and self.__entries[item[2]][1] == item[0]
+            ]
+            heapq.heapify(self.__expirations)
+
+    def _sweep_frame(self, interval):
+        if self.__last_sweep is None or self.__clock() - self.__last_sweep >= interval:
+            self.sweep()
+        return True
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+
+class DeliveryPolicy(object):
+    """
+    :Description:
+
+    A delivery policy decide when the emissions of a signal are delivered to the handlers, it is set with
+    :func:`EventBus.set_signal_policy() <GLXBob.EventBus.EventBus.set_signal_policy()>`.
+
+    :func:`DeliveryPolicy.offer() <GLXBob.DeliveryPolicy.DeliveryPolicy.offer()>` is called by each emission,
+    it deliver the emission now or keep it for later. The kept emissions are returned by
+    :func:`DeliveryPolicy.flush() <GLXBob.DeliveryPolicy.DeliveryPolicy.flush()>`, called by
+    :func:`EventBus.dispatch_pending() <GLXBob.EventBus.EventBus.dispatch_pending()>` at the end of each
+    :class:`MainLoop <GLXBob.MainLoop.MainLoop>` frame.
+
+    The policy is thread-safe, the emissions can come from many threads.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.__offered = 0
+        self.__delivered = 0
+
+    def offer(self, args, now):
+        """
+        Offer a emission to the policy.
+
+        :param args: the emitted parameters
+        :param now: the bus clock time
+        :type args: tuple
+        :type now: float
+        :return: the parameters to deliver now, or :py:obj:`None` if the emission is kept or dropped
+        :rtype: tuple or None
+        """
+        with self._lock:
+            self.__offered += 1
+            args = self._offer(args, now)
+            if args is not None:
+                self.__delivered += 1
+            return args
+
+    def flush(self, now):
+        """
+        Return the kept emissions they must be delivered now.
+
+        :param now: the bus clock time
+        :type now: float
+        :return: list of parameters tuples
+        :rtype: list
+        """
+        with self._lock:
+            delivered = self._flush(now)
+            self.__delivered += len(delivered)
+            return delivered
+
+    def get_offered(self):
+        """
+        Get the number of emissions offered to the policy.
+
+        :return: offered emissions
+        :rtype: int
+        """
+        return self.__offered
+
+    def get_delivered(self):
+        """
+        Get the number of emissions delivered to the handlers.
+
+        :return: delivered emissions
+        :rtype: int
+        """
+        return self.__delivered
+
+    # Internal Method's, called with the lock
+    def _offer(self, args, now):
+        return args
+
+    def _flush(self, now):
+        return []
+
+
+class Throttle(DeliveryPolicy):
+    """
+    :Description:
+
+    Deliver at most ``hz`` emissions by second. A emission is delivered immediately if the interval since the
+    last delivery is elapsed, else it replace the kept emission, the last kept emission is delivered when the
+    interval is elapsed.
+    """
+    def __init__(self, hz):
+        """
+        :param hz: maximum deliveries by second
+        :type hz: float
+        :raise TypeError: if ``hz`` parameter is not a :py:data:`float` type
+        :raise ValueError: if ``hz`` parameter is not positive
+        """
+        if type(hz) != float:
+            raise TypeError(u'>hz< parameter must be a float')
+        if hz <= 0.0:
+            raise ValueError(u'>hz< parameter must be positive')
+        DeliveryPolicy.__init__(self)
+        self.__interval = 1.0 / hz
+        self.__last = None
+        self.__pending = None
+
+    def _offer(self, args, now):
+        if self.__last is None or now - self.__last >= self.__interval:
+            self.__last = now
+            self.__pending = None
+            return args
+        self.__pending = args
+        return None
+
+    def _flush(self, now):
+        if self.__pending is not None and now - self.__last >= self.__interval:
+            args = self.__pending
+            self.__last = now
+            self.__pending = None
+            return [args]
+        return []
+
+
+class Debounce(DeliveryPolicy):
+    """
+    :Description:
+
+    Deliver the last emission once the signal have not been emitted during ``delay`` seconds.
+    """
+    def __init__(self, delay):
+        """
+        :param delay: quiet time in seconds before the delivery
+        :type delay: float
+        :raise TypeError: if ``delay`` parameter is not a :py:data:`float` type
+        """
+        if type(delay) != float:
+            raise TypeError(u'>delay< parameter must be a float')
+        DeliveryPolicy.__init__(self)
+        self.__delay = delay
+        self.__deadline = None
+        self.__pending = None
+
+    def _offer(self, args, now):
+        self.__pending = args
+        self.__deadline = now + self.__delay
+        return None
+
+    def _flush(self, now):
+        if self.__pending is not None and now >= self.__deadline:
+            args = self.__pending
+            self.__pending = None
+            return [args]
+        return []
+
+
+class Coalesce(DeliveryPolicy):
+    """
+    :Description:
+
+    Keep the last emission by key during a frame, then deliver them at the end of the frame. The key is computed
+    from the emitted parameters, without key function every emission of the frame have the same key.
+
+    .. code-block:: python
+
+       # One 'progress' delivery by job and by frame
+       event_bus.set_signal_policy('progress', Coalesce(key=lambda job, percent: job))
+    """
+    def __init__(self, key=None):
+        """
+        :param key: a callable it receive the emitted parameters and return the key
+        :type key: callable or None
+        """
+        DeliveryPolicy.__init__(self)
+        self.__key = key
+        self.__pending = dict()
+
+    def _offer(self, args, now):
+        key = None
+        if self.__key is not None:
+            key = self.__key(*args)
+        # Last value wins, but the key keep it first emission position
+        self.__pending[key] = args
+        return None
+
+    def _flush(self, now):
+        delivered = list(self.__pending.values())
+        self.__pending.clear()
+        return delivered
@@ -1,78 +1,504 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import uuid
+import weakref
+import itertools
 import logging
+import threading
+from bisect import bisect_right
+from time import monotonic
+from GLXBob.EventBusMetrics import EMITS, BLOCKED, DELIVERIES
 
 # It script it publish under GNU GENERAL PUBLIC LICENSE
 # http://www.gnu.org/licenses/gpl-3.0.en.html
 # Author: Tuuux <tuxa at rtnp dot org> all rights reserved
 
+# Flag of the code objects of the coroutine functions, see inspect.CO_COROUTINE
+CO_COROUTINE = 0x0080
+
+# Handler priorities, like GLib a lower value is invoked first
+PRIORITY_HIGH = -100
+PRIORITY_DEFAULT = 0
+PRIORITY_LOW = 300
+
+
+class _EventStop(object):
+    def __repr__(self):
+        return 'EVENT_STOP'
+
+
+# Values a handler can return, EVENT_STOP prevent the invocation of the next handlers
+EVENT_PROPAGATE = None
+EVENT_STOP = _EventStop()
+
+
+class Subscription(object):
+    """
+    :Description:
+
+    A handler connected to a signal of a :class:`EventBus <GLXBob.EventBus.EventBus>`.
+
+    The record use ``__slots__``, it have no ``__dict__``, a bus can store millions of them.
+    """
+    __slots__ = ('handler_id', 'handler', 'argvs', 'priority', 'weak', 'coroutine', 'executor')
+
+    def __init__(self, handler_id, handler, argvs, priority, weak, coroutine, executor=None):
+        self.handler_id = handler_id
+        self.handler = handler
+        self.argvs = argvs
+        self.priority = priority
+        self.weak = weak
+        self.coroutine = coroutine
+        self.executor = executor
+
+    def __repr__(self):
+        return '{0}(handler_id={1}, handler={2!r}, argvs={3!r}, priority={4})'.format(
+            self.__class__.__name__,
+            self.handler_id,
+            self.handler,
+            self.argvs,
+            self.priority
+        )
+
 
 class EventBus(object):
-    def __init__(self):
+    """
+    :Description:
+
+    The :class:`EventBus <GLXBob.EventBus.EventBus>` object dispatch emitted signals to the connected handlers.
+
+    The bus can be used by concurrent producers and subscribers threads. The dispatch tables are copy-on-write:
+    :func:`EventBus.emit() <GLXBob.EventBus.EventBus.emit()>` read a immutable tuple of subscriptions without
+    locking, when the writers (connect, disconnect, block ...) build a new tuple then swap it under a lock.
+    A emission in progress continue with the handlers it was see at its start.
+    """
+    __slots__ = (
+        'signal_handlers',
+        'handlers_index',
+        'blocked_handler',
+        'blocked_function',
+        'emission_hooks',
+        'data',
+        'asyncio_loop',
+        'metrics',
+        'signal_policies',
+        'signal_queues',
+        'queue_scheduler',
+        'process_executor',
+        'clock',
+        'lock',
+        'weak',
+        'ids',
+        '__weakref__'
+    )
+
+    def __init__(self, weak=False):
+        """
+        :param weak: default value of the ``weak`` parameter of
+           :func:`EventBus.connect() <GLXBob.EventBus.EventBus.connect()>`
+        :type weak: bool
+        """
         self.signal_handlers = dict()
-        self.blocked_handler = list()
-        self.blocked_function = list()
-        self.data = dict()
+        self.handlers_index = dict()
+        # The blocked identifiers are a set updated in place under the lock, the dispatch only test the membership:
+        # a handler_block() is O(1) whatever the number of blocked handlers. The blocked callables are a
+        # copy-on-write frozenset.
+        self.blocked_handler = set()
+        self.blocked_function = frozenset()
+        self.emission_hooks = tuple()
+        # Created on the first use, a bus without data don't import the store
+        self.data = None
+        self.asyncio_loop = None
+        self.metrics = None
+        self.signal_policies = dict()
+        self.signal_queues = dict()
+        self.queue_scheduler = None
+        self.process_executor = None
+        self.clock = monotonic
+        # Handlers and hooks identifiers, next() on a count is atomic
+        self.ids = itertools.count(1)
+        # Reentrant, a weak reference finalizer can be call by the garbage collector inside a locked section
+        self.lock = threading.RLock()
+        self.weak = False
+        self.set_weak(weak)
+
+    def set_weak(self, weak=False):
+        """
+        Set the bus-wide default for weak references subscriptions.
+
+        :param weak: :py:obj:`True` if handlers must be connected with a weak reference by default
+        :type weak: bool
+        :raise TypeError: if ``weak`` parameter is not a :py:data:`bool` type
+        """
+        if type(weak) == bool:
+            if self.get_weak() != weak:
+                self.weak = weak
+        else:
+            raise TypeError(u'>weak< parameter must be a bool type')
+
+    def get_weak(self):
+        """
+        Get the bus-wide default for weak references subscriptions.
+
+        :return: :py:obj:`True` if handlers are connected with a weak reference by default
+        :rtype: bool
+        """
+        return self.weak
+
+    def set_asyncio_loop(self, asyncio_loop=None):
+        """
+        Set the :py:mod:`asyncio` event loop where the coroutine handlers are scheduled.
+
+        A :class:`MainLoop <GLXBob.MainLoop.MainLoop>` set it own asyncio loop on it bus when it start to run.
+
+        :param asyncio_loop: a event loop or :py:obj:`None` for use the running loop of the emitting thread
+        :type asyncio_loop: asyncio.AbstractEventLoop or None
+        """
+        self.asyncio_loop = asyncio_loop
+
+    def get_asyncio_loop(self):
+        """
+        Get the :py:mod:`asyncio` event loop where the coroutine handlers are scheduled.
+
+        :return: a event loop or :py:obj:`None`
+        :rtype: asyncio.AbstractEventLoop or None
+        """
+        return self.asyncio_loop
+
+    def set_clock(self, clock=monotonic):
+        """
+        Set the time source of the delivery policies.
+
+        A :class:`MainLoop <GLXBob.MainLoop.MainLoop>` set the :func:`Timer.get_time()
+        <GLXBob.Timer.Timer.get_time()>` of it timer on it bus when it start to run.
+
+        :param clock: a callable it return the time in seconds
+        :type clock: callable
+        """
+        self.clock = clock
+
+    def get_clock(self):
+        """
+        Get the time source of the delivery policies.
+
+        :return: a callable it return the time in seconds
+        :rtype: callable
+        """
+        return self.clock
+
+    def set_signal_policy(self, detailed_signal, policy=None):
+        """
+        Set the delivery policy of a signal: :class:`Throttle <GLXBob.DeliveryPolicy.Throttle>`,
+        :class:`Debounce <GLXBob.DeliveryPolicy.Debounce>`, :class:`Coalesce <GLXBob.DeliveryPolicy.Coalesce>`
+        or your own :class:`DeliveryPolicy <GLXBob.DeliveryPolicy.DeliveryPolicy>`.
+
+        The emissions kept by the policy are delivered by
+        :func:`EventBus.dispatch_pending() <GLXBob.EventBus.EventBus.dispatch_pending()>`.
+
+        .. code-block:: python
+
+           event_bus.set_signal_policy('resize', Coalesce())
+           event_bus.set_signal_policy('progress', Throttle(10.0))
+
+        :param detailed_signal: a string containing the signal name
+        :param policy: the delivery policy or :py:obj:`None` for deliver every emission immediately
+        :type policy: GLXBob.DeliveryPolicy or None
+        """
+        with self.lock:
+            if policy is None:
+                self.signal_policies.pop(detailed_signal, None)
+            else:
+                self.signal_policies[detailed_signal] = policy
+
+    def get_signal_policy(self, detailed_signal):
+        """
+        Get the delivery policy of a signal.
+
+        :param detailed_signal: a string containing the signal name
+        :return: the delivery policy or :py:obj:`None`
+        :rtype: GLXBob.DeliveryPolicy or None
+        """
+        return self.signal_policies.get(detailed_signal)
+
+    def set_signal_queue(self, detailed_signal, event_queue=None):
+        """
+        Set the bounded queue of a signal, it receive the emissions of
+        :func:`EventBus.emit_queued() <GLXBob.EventBus.EventBus.emit_queued()>`.
+
+        The queued emissions of a replaced queue are lost, it is cleared: the producers blocked on it are woken.
+
+        :param detailed_signal: a string containing the signal name
+        :param event_queue: the queue or :py:obj:`None` for remove it
+        :type event_queue: GLXBob.EventQueue or None
+        """
+        with self.lock:
+            if event_queue is None:
+                replaced = self.signal_queues.pop(detailed_signal, None)
+            else:
+                replaced = self.signal_queues.get(detailed_signal)
+                self.signal_queues[detailed_signal] = event_queue
+        # Outside of the bus lock, the on_low callback can use the bus
+        if replaced is not None and replaced is not event_queue:
+            replaced.clear()
+
+    def get_signal_queue(self, detailed_signal):
+        """
+        Get the bounded queue of a signal.
+
+        :param detailed_signal: a string containing the signal name
+        :return: the queue or :py:obj:`None`
+        :rtype: GLXBob.EventQueue or None
+        """
+        return self.signal_queues.get(detailed_signal)
+
+    def set_queue_scheduler(self, queue_scheduler=None):
+        """
+        Set the object it decide the delivery order of the queued emissions, like a
+        :class:`FairScheduler <GLXBob.FairScheduler.FairScheduler>` it share the frame between classes of signals.
+
+        :param queue_scheduler: the scheduler or :py:obj:`None` for drain every queue one after the other
+        :type queue_scheduler: GLXBob.FairScheduler or None
+        """
+        self.queue_scheduler = queue_scheduler
+
+    def get_queue_scheduler(self):
+        """
+        Get the object it decide the delivery order of the queued emissions.
+
+        :return: the scheduler or :py:obj:`None`
+        :rtype: GLXBob.FairScheduler or None
+        """
+        return self.queue_scheduler
+
+    def dispatch_pending(self, skipped=()):
+        """
+        Deliver the queued emissions, then the emissions kept by the signals delivery policies they time have come.
+
+        A :class:`MainLoop <GLXBob.MainLoop.MainLoop>` call it at the end of each frame. The emissions queued by
+        the handlers during the dispatch are delivered on the next call. With a queue scheduler the queued emissions
+        are delivered in it order, up to it budget. A exception raised by a handler is logged, the next emissions
+        are delivered.
+
+        :param skipped: signal names they queued emissions stay in they queue
+        :type skipped: frozenset or tuple
+        :return: number of delivered emissions
+        :rtype: int
+        """
+        count = 0
+        if self.queue_scheduler is not None:
+            for detailed_signal, args in self.queue_scheduler.schedule(dict(self.signal_queues), skipped):
+                self._deliver_pending(self._dispatch, detailed_signal, args)
+                count += 1
+        else:
+            for detailed_signal, event_queue in list(self.signal_queues.items()):
+                if detailed_signal in skipped:
+                    continue
+                for args in event_queue.drain():
+                    self._deliver_pending(self._dispatch, detailed_signal, args)
+                    count += 1
+        if not self.signal_policies:
+            return count
+        now = self.get_clock()()
+        for detailed_signal, policy in list(self.signal_policies.items()):
+            for args in policy.flush(now):
+                self._deliver_pending(self._deliver, detailed_signal, args)
+                count += 1
+        return count
+
+    def set_process_executor(self, process_executor=None):
+        """
+        Set the pool of worker processes of the handlers connected with ``executor='process'``.
+
+        :param process_executor: the pool or :py:obj:`None` for a default pool created on the first use
+        :type process_executor: GLXBob.ProcessExecutor or None
+        """
+        self.process_executor = process_executor
+
+    def get_process_executor(self):
+        """
+        Get the pool of worker processes of the handlers connected with ``executor='process'``, a default
+        :class:`ProcessExecutor <GLXBob.ProcessExecutor.ProcessExecutor>` is created on the first call.
+
+        :return: the pool
+        :rtype: GLXBob.ProcessExecutor
+        """
+        if self.process_executor is None:
+            with self.lock:
+                if self.process_executor is None:
+                    # Imported on demand, multiprocessing and concurrent.futures are slow to import
+                    from GLXBob.ProcessExecutor import ProcessExecutor
+                    self.process_executor = ProcessExecutor()
+        return self.process_executor
+
+    def set_metrics(self, metrics=None):
+        """
+        Set the object it count the emissions, deliveries, blocked skips and exceptions by signal, and the handlers
+        latency.
+
+        :param metrics: the metrics or :py:obj:`None` for disable them
+        :type metrics: GLXBob.EventBusMetrics or None
+        """
+        with self.lock:
+            self.metrics = metrics
+            if metrics is None:
+                return
+            # The histograms of the connected handlers are created now, not by they invocation
+            for detailed_signal, handlers in self._get_signal_handlers_dict().items():
+                for subscription in handlers:
+                    if subscription.coroutine or subscription.executor is not None:
+                        continue
+                    handler = subscription.handler() if subscription.weak else subscription.handler
+                    if handler is not None:
+                        metrics.add_handler(subscription.handler_id, detailed_signal, handler)
+
+    def get_metrics(self):
+        """
+        Get the object it count the bus activity.
+
+        :return: the metrics or :py:obj:`None`
+        :rtype: GLXBob.EventBusMetrics or None
+        """
+        return self.metrics
 
     def get_data(self, key):
         """
         The get_data() method returns the Python object associated with the specified key or
-        None if there is no data associated with the key or if there is no key associated with the object.
-
+        None if there is no data associated with the key, or if the data have been evicted or is expired.
 
         :param key: a string used as the key
         :return: a Python object that is the value to be associated with the key
         """
-        if key not in self._get_data_dict():
-            return None
-        elif not len(self._get_data_dict()[key]):
-            return None
-        else:
-            return self._get_data_dict()[key]
+        return self.get_data_store().get(key)
 
     def set_data(self, key, data):
         """
         The set_data() method associates the specified Python object (data) with key.
 
+        The capacity, size and time to live policies can be set on the
+        :func:`EventBus.get_data_store() <GLXBob.EventBus.EventBus.get_data_store()>` return.
+
         :param key: a string used as the key
         :param data: a Python object that is the value to be associated with the key
         :type key: str
         """
-        self._get_data_dict()[key] = data
+        self.get_data_store().set(key, data)
 
-    def connect(self, detailed_signal, handler, *args):
+    def get_data_store(self):
         """
-        The connect() method adds a function or method (handler)to the end of the list of signal handlers
-        for the named detailed_signal but before the default class signal handler.
+        Return the store behind :func:`EventBus.set_data() <GLXBob.EventBus.EventBus.set_data()>` and
+        :func:`EventBus.get_data() <GLXBob.EventBus.EventBus.get_data()>`.
+
+        .. code-block:: python
+
+           event_bus.get_data_store().set_capacity(10000)
+           event_bus.get_data_store().set_ttl(30.0)
+           event_bus.get_data_store().attach(mainloop)
+
+        :return: the data store
+        :rtype: GLXBob.DataStore
+        """
+        if self.data is None:
+            with self.lock:
+                if self.data is None:
+                    from GLXBob.DataStore import DataStore
+                    self.data = DataStore()
+        return self.data
+
+    def connect(self, detailed_signal, handler, *args, priority=PRIORITY_DEFAULT, weak=None, executor=None):
+        """
+        The connect() method adds a function or method (handler) to the list of signal handlers
+        for the named detailed_signal, after every handler connected with a lower or equal priority.
         An optional set of parameters may be specified after the handler parameter.
-        These will all be passed to the signal handler when invoked.
+        These will all be passed to the signal handler when invoked, after the emitted parameters.
+
+        The handler can return :py:data:`EVENT_STOP` for stop the propagation of the signal to the next handlers.
+
+        A coroutine function (``async def``) handler is not awaited by the emission, it is scheduled on the
+        asyncio loop then the next handlers are invoked, the coroutine handlers of a emission run concurrently.
+        See :func:`EventBus.emit_and_wait() <GLXBob.EventBus.EventBus.emit_and_wait()>` for wait them.
+
+        A weak subscription do not keep the handler alive, when the handler (or the object of a method) is
+        garbage collected the subscription is automatically disconnected. It cost like a
+        :func:`EventBus.disconnect() <GLXBob.EventBus.EventBus.disconnect()>`: the signal is found in O(1), then
+        the dispatch table of the signal is copied without the handler, in O(handlers of the signal).
+
+        With ``executor='process'`` the handler run in a worker process of the
+        :func:`EventBus.get_process_executor() <GLXBob.EventBus.EventBus.get_process_executor()>` pool, the large
+        buffers are passed by shared memory. The emission do not wait it, it can't stop the propagation, and it is
+        always connected with a strong reference. The handler must be picklable.
 
         :param detailed_signal: a string containing the signal name
         :param handler: function or method
         :param *args: additional parameters arg1, arg2
+        :param priority: invocation order of the handler, lower value is invoked first
+        :param weak: :py:obj:`True` for keep only a weak reference to the handler, :py:obj:`None` for use
+           the bus-wide default set by :func:`EventBus.set_weak() <GLXBob.EventBus.EventBus.set_weak()>`
+        :param executor: :py:obj:`None` for invoke the handler in the emitting thread, ``'process'`` for run it
+           in a worker process
+        :type priority: int
+        :type weak: bool or None
+        :type executor: str or None
+        :return: a integer handler identifier
+        :rtype: int
+        :raise TypeError: if a weak reference to ``handler`` can't be created
+        :raise ValueError: if ``executor`` is not :py:obj:`None` or ``'process'``, or a coroutine function handler
+           use the ``'process'`` executor
         """
-        if detailed_signal not in self._get_signal_handlers_dict():
-            self._get_signal_handlers_dict()[detailed_signal] = {}
+        coroutine = _is_coroutine_function(handler)
+        if executor is not None:
+            if executor != 'process':
+                raise ValueError(u'>executor< parameter must be None or \'process\'')
+            if coroutine:
+                raise ValueError(u'a coroutine function handler can\'t use the \'process\' executor')
+            weak = False
+        if weak is None:
+            weak = self.get_weak()
+        handler_id = next(self.ids)
+        function = handler
 
-        subscription = {
-            'handler': handler,
-            'argvs': args
-        }
-        handler_id = uuid.uuid1().int
-        self._get_signal_handlers_dict()[detailed_signal][handler_id] = subscription
-        logging.info(self.__class__.__name__ + ': ' + str(self._get_signal_handlers_dict()[detailed_signal][handler_id]))
+        if weak:
+            finalizer = self._make_finalizer(handler_id)
+            if hasattr(handler, '__self__') and hasattr(handler, '__func__'):
+                handler = weakref.WeakMethod(handler, finalizer)
+            else:
+                handler = weakref.ref(handler, finalizer)
+
+        subscription = Subscription(handler_id, handler, args, priority, weak, coroutine, executor)
+
+        with self.lock:
+            handlers = self._get_signal_handlers_dict().get(detailed_signal, ())
+            # The dispatch table is keep sorted at insert time, then emit() never have to sort it
+            if handlers and priority < handlers[-1].priority:
+                position = bisect_right([infos.priority for infos in handlers], priority)
+                handlers = handlers[:position] + (subscription,) + handlers[position:]
+            else:
+                handlers = handlers + (subscription,)
+            self._get_signal_handlers_dict()[detailed_signal] = handlers
+            self._get_handlers_index()[handler_id] = detailed_signal
+            if self.metrics is not None and not coroutine and executor is None:
+                self.metrics.add_handler(handler_id, detailed_signal, function)
+
+        logging.info(self.__class__.__name__ + ': ' + str(subscription))
         return handler_id
 
+    def connect_after(self, detailed_signal, handler, *args):
+        """
+        The connect_after() method is similar to the :func:`EventBus.connect() <GLXBob.EventBus.EventBus.connect()>`
+        method except the handler is connected with :py:data:`PRIORITY_LOW` priority, it will be invoked after
+        the handlers connected with the default priority.
+
+        :param detailed_signal: a string containing the signal name
+        :param handler: function or method
+        :param *args: additional parameters arg1, arg2
+        :return: a integer handler identifier
+        :rtype: int
+        """
+        return self.connect(detailed_signal, handler, *args, priority=PRIORITY_LOW)
+
     # The disconnect() method removes the signal handler with the specified handler_id
     # from the list of signal handlers for the object.
     # handler_id: an integer handler identifier
     def disconnect(self, handler_id):
-        for detailed_signal, infos in self._get_signal_handlers_dict().iteritems():
-            for id, infos2 in infos.iteritems():
-                if id == handler_id:
-                    del self._get_signal_handlers_dict()[detailed_signal][handler_id]
-                    break
+        self._remove_subscription(handler_id)
 
     # The handler_disconnect() method removes the signal handler with the specified handler_id
     # from the list of signal handlers for the object.
@@ -83,73 +509,282 @@ class EventBus(object):
     # The handler_is_connected() method returns True
     # if the signal handler with the specified handler_id is connected to the object.
     def handler_is_connected(self, handler_id):
-        for detailed_signal, infos in self._get_signal_handlers_dict().iteritems():
-            for id, infos in infos.iteritems():
-                if id == handler_id:
-                    return True
-        return False
+        return handler_id in self._get_handlers_index()
 
     # The handler_block() method blocks the signal handler with the specified handler_id
     # from being invoked until it is unblocked.
     # handler_id: an integer handler identifier
     def handler_block(self, handler_id):
-        if handler_id not in self.blocked_handler:
-            self._get_blocked_handler().append(handler_id)
-        else:
-            pass
+        with self.lock:
+            self._get_blocked_handler().add(handler_id)
 
     # handler_id: an integer handler identifier
     def handler_unblock(self, handler_id):
-        # noinspection PyBroadException
-        try:
-            self._get_blocked_handler().pop(self._get_blocked_handler().index(handler_id))
-        except:
-            pass
+        with self.lock:
+            self._get_blocked_handler().discard(handler_id)
 
     # The handler_block_by_func() method blocks
     # the all signal handler connected to a specific callable from being invoked until the callable is unblocked.
     # callable : a callable python object
     def handler_block_by_func(self, callable):
-        if callable not in self.blocked_handler:
-            self._get_blocked_function().append(callable)
-        else:
-            pass
+        with self.lock:
+            if callable not in self._get_blocked_function():
+                self.blocked_function = self._get_blocked_function() | {callable}
 
     # The handler_unblock_by_func() method unblocks all signal handler connected to a specified callable there
     # by allowing it to be invoked when the associated signals are emitted.
     # callback : a callable python object
     def handler_unblock_by_func(self, callback):
-        # noinspection PyBroadException
-        try:
-            self._get_blocked_function().pop(self._get_blocked_function().index(callback))
-        except:
-            pass
+        with self.lock:
+            if callback in self._get_blocked_function():
+                self.blocked_function = self._get_blocked_function() - {callback}
+
+    def add_emission_hook(self, hook, *args):
+        """
+        The add_emission_hook() method adds a function or method (hook) invoked by every emission of any signal,
+        before the signal handlers and even if the signal have no handler.
+
+        The hook is invoked with the ``detailed_signal`` name, the emitted parameters as a :py:data:`tuple`,
+        then the optional set of parameters specified after the hook parameter.
+
+        :param hook: function or method
+        :param *args: additional parameters arg1, arg2
+        :return: a integer hook identifier
+        :rtype: int
+        """
+        hook_id = next(self.ids)
+        with self.lock:
+            self.emission_hooks = self.emission_hooks + ({'hook_id': hook_id, 'hook': hook, 'argvs': args},)
+        return hook_id
+
+    def remove_emission_hook(self, hook_id):
+        """
+        The remove_emission_hook() method removes a hook added with
+        :func:`EventBus.add_emission_hook() <GLXBob.EventBus.EventBus.add_emission_hook()>`.
+
+        :param hook_id: a integer hook identifier
+        :type hook_id: int
+        """
+        with self.lock:
+            self.emission_hooks = tuple(infos for infos in self.emission_hooks if infos['hook_id'] != hook_id)
 
-    # detailed_signal: a string containing the signal name
-    # *args: additional parameters arg1, arg2
     def emit(self, detailed_signal, *args):
-        for subscription, infos in self._get_signal_handlers_dict().iteritems():
-            if subscription == detailed_signal:
-                for id, infos in infos.iteritems():
-                    if id not in self._get_blocked_handler():
-                        if id not in self._get_blocked_handler():
-                            self._get_signal_handlers_dict()[subscription][id]['handler'](*args)
-                        logging.info(self.__class__.__name__ + ': ' + str(
-                            self._get_signal_handlers_dict()[subscription][id]))
+        """
+        The emit() method invoke the not blocked handlers of the named detailed_signal by priority order,
+        until a handler return :py:data:`EVENT_STOP`.
+
+        The coroutine handlers are scheduled on the asyncio loop, they can't stop the propagation.
+
+        When the signal have a delivery policy, the emission can be delivered later by
+        :func:`EventBus.dispatch_pending() <GLXBob.EventBus.EventBus.dispatch_pending()>`, or never if a next
+        emission replace it.
+
+        :param detailed_signal: a string containing the signal name
+        :param *args: additional parameters arg1, arg2
+        :return: :py:obj:`True` if a handler have stop the propagation
+        :rtype: bool
+        :raise RuntimeError: if a coroutine handler is connected and there is no asyncio loop
+        """
+        return self._dispatch(detailed_signal, args, None)
+
+    def emit_queued(self, detailed_signal, *args):
+        """
+        The emit_queued() method put the emission in the bounded queue of the signal, it is delivered like
+        :func:`EventBus.emit() <GLXBob.EventBus.EventBus.emit()>` by
+        :func:`EventBus.dispatch_pending() <GLXBob.EventBus.EventBus.dispatch_pending()>`, in the thread of the
+        :class:`MainLoop <GLXBob.MainLoop.MainLoop>`.
+
+        A signal without queue get a default :class:`EventQueue <GLXBob.EventQueue.EventQueue>`, it raise
+        :py:exc:`queue.Full` after 1024 pending emissions.
+
+        :param detailed_signal: a string containing the signal name
+        :param *args: additional parameters arg1, arg2
+        :return: :py:obj:`True` if the emission is queued, :py:obj:`False` if the queue have drop it
+        :rtype: bool
+        :raise queue.Full: when the queue is full and it overflow policy is ``raise`` or ``block``
+        """
+        event_queue = self.signal_queues.get(detailed_signal)
+        if event_queue is None:
+            # Imported on the first queued emission, queue and threading conditions are not needed before
+            from GLXBob.EventQueue import EventQueue
+            with self.lock:
+                event_queue = self.signal_queues.setdefault(detailed_signal, EventQueue())
+        return event_queue.put(args)
+
+    async def emit_and_wait(self, detailed_signal, *args, timeout=None):
+        """
+        The emit_and_wait() coroutine invoke the handlers like
+        :func:`EventBus.emit() <GLXBob.EventBus.EventBus.emit()>`, then wait the coroutine handlers of the emission,
+        they are awaited concurrently.
+
+        .. code-block:: python
+
+           await event_bus.emit_and_wait('saved', path, timeout=2.0)
+
+        :param detailed_signal: a string containing the signal name
+        :param *args: additional parameters arg1, arg2
+        :param timeout: maximum time to wait in seconds, :py:obj:`None` for no limit
+        :type timeout: float or None
+        :return: :py:obj:`True` if a handler have stop the propagation
+        :rtype: bool
+        :raise asyncio.TimeoutError: if the coroutine handlers are not finished after ``timeout``, they are cancelled
+        """
+        import asyncio
+        coroutines = list()
+        stopped = self._dispatch(detailed_signal, args, coroutines)
+        if coroutines:
+            await asyncio.wait_for(asyncio.gather(*coroutines), timeout)
+        return stopped
 
     # Internal Function
+    def _dispatch(self, detailed_signal, args, coroutines):
+        # The coroutines are appended to the ``coroutines`` list, or scheduled when it is None
+        for hook in self.emission_hooks:
+            hook['hook'](detailed_signal, args, *hook['argvs'])
+
+        # Counted before the delivery policy, a emission dropped or merged by it is still a emission
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.get_counters(detailed_signal)[EMITS] += 1
+
+        policy = self.signal_policies.get(detailed_signal)
+        if policy is not None:
+            args = policy.offer(args, self.get_clock()())
+            if args is None:
+                return False
+        return self._deliver(detailed_signal, args, coroutines)
+
+    def _deliver(self, detailed_signal, args, coroutines):
+        metrics = self.metrics
+        if metrics is not None:
+            counters = metrics.get_counters(detailed_signal)
+
+        # Snapshot of the copy-on-write tables, a concurrent writer never modify them. The blocked identifiers set
+        # is not a snapshot, a handler blocked during the emission is not invoked.
+        handlers = self._get_signal_handlers_dict().get(detailed_signal)
+        if not handlers:
+            return False
+        blocked_handler = self._get_blocked_handler()
+        blocked_function = self._get_blocked_function()
+        for subscription in handlers:
+            if subscription.handler_id in blocked_handler:
+                if metrics is not None:
+                    counters[BLOCKED] += 1
+                continue
+            handler = subscription.handler
+            if subscription.weak:
+                handler = handler()
+                if handler is None:
+                    continue
+            if handler in blocked_function:
+                if metrics is not None:
+                    counters[BLOCKED] += 1
+                continue
+            # Lazy formatting, the subscription is not converted to a string when INFO level is disabled
+            logging.info('%s: %s', self.__class__.__name__, subscription)
+            if subscription.coroutine:
+                if metrics is not None:
+                    counters[DELIVERIES] += 1
+                if coroutines is None:
+                    self._schedule(handler(*(args + subscription.argvs)))
+                else:
+                    coroutines.append(handler(*(args + subscription.argvs)))
+            elif subscription.executor is not None:
+                if metrics is not None:
+                    counters[DELIVERIES] += 1
+                future = self.get_process_executor().submit(handler, args + subscription.argvs)
+                if coroutines is None:
+                    future.add_done_callback(self._log_future_error)
+                else:
+                    import asyncio
+                    coroutines.append(asyncio.wrap_future(future))
+            elif metrics is None:
+                if handler(*(args + subscription.argvs)) is EVENT_STOP:
+                    return True
+            elif metrics.invoke(counters, subscription.handler_id, detailed_signal, handler,
+                                args + subscription.argvs) is EVENT_STOP:
+                return True
+        return False
+
+    def _deliver_pending(self, deliver, detailed_signal, args):
+        # The emissions are already out of the queue, a failing handler must not lose the rest of the batch
+        try:
+            deliver(detailed_signal, args, None)
+        except Exception as error:
+            logging.error('%s: %s handler failed: %r', self.__class__.__name__, detailed_signal, error)
+
+    def _schedule(self, coroutine):
+        # asyncio is imported by the code it create the coroutines, the import is free here
+        import asyncio
+        asyncio_loop = self.get_asyncio_loop()
+        if asyncio_loop is None:
+            try:
+                asyncio_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                coroutine.close()
+                raise RuntimeError(u'a coroutine handler require a asyncio loop, see EventBus.set_asyncio_loop()')
+        # Thread-safe, the emission can come from a other thread than the asyncio loop one
+        asyncio.run_coroutine_threadsafe(coroutine, asyncio_loop).add_done_callback(self._log_future_error)
+
+    def _log_future_error(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            logging.error('%s: handler failed: %r', self.__class__.__name__, future.exception())
+
     def _reset(self):
         # All subscribers will be cleared.
-        self.signal_handlers = dict()
-        self.blocked_handler = list()
-        self.blocked_function = list()
-        self.data = dict()
+        with self.lock:
+            if self.metrics is not None:
+                for handler_id in self.handlers_index:
+                    self.metrics.remove_handler(handler_id)
+            self.signal_handlers = dict()
+            self.handlers_index = dict()
+            self.blocked_handler = set()
+            self.blocked_function = frozenset()
+            self.emission_hooks = tuple()
+            self.signal_policies = dict()
+            self.queue_scheduler = None
+            event_queues = list(self.signal_queues.values())
+            self.signal_queues = dict()
+            if self.data is not None:
+                self.data.clear()
+        for event_queue in event_queues:
+            event_queue.clear()
+
+    def _make_finalizer(self, handler_id):
+        # The finalizer must not keep the bus alive
+        bus_ref = weakref.ref(self)
+
+        def finalizer(_):
+            bus = bus_ref()
+            if bus is not None:
+                bus._remove_subscription(handler_id)
+
+        return finalizer
+
+    def _remove_subscription(self, handler_id):
+        # The index give the signal in O(1), the copy-on-write tuple of the signal is rebuilt in O(handlers of the
+        # signal), the other signals are not touched
+        with self.lock:
+            detailed_signal = self._get_handlers_index().pop(handler_id, None)
+            if detailed_signal is None:
+                return
+            if self.metrics is not None:
+                self.metrics.remove_handler(handler_id)
+            self._get_blocked_handler().discard(handler_id)
+            handlers = tuple(
+                infos for infos in self._get_signal_handlers_dict()[detailed_signal]
+                if infos.handler_id != handler_id
+            )
+            if handlers:
+                self._get_signal_handlers_dict()[detailed_signal] = handlers
+            else:
+                del self._get_signal_handlers_dict()[detailed_signal]
 
     def _get_signal_handlers_dict(self):
         return self.signal_handlers
 
-    def _get_data_dict(self):
-        return self.data
+    def _get_handlers_index(self):
+        return self.handlers_index
 
     def _get_blocked_handler(self):
         return self.blocked_handler
@@ -172,3 +807,11 @@ def print_hello3(text=None):
     if text:
         print (text)
 
+
+def _is_coroutine_function(handler):
+    # Functions and methods are checked without import inspect, it cost more than the rest of the package
+    code = getattr(getattr(handler, '__func__', handler), '__code__', None)
+    if code is not None:
+        return bool(code.co_flags & CO_COROUTINE)
+    import inspect
+    return inspect.iscoroutinefunction(handler)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import socket
+import struct
+import marshal
+import logging
+import selectors
+import threading
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# A frame is a payload length (unsigned 32 bits, network order) followed by the payload
+FRAME_HEADER = struct.Struct('!I')
+# The payload is a sequence of entries, a entry length followed by a marshal ``(detailed_signal, args)``
+ENTRY_HEADER = FRAME_HEADER
+
+
+class EventBusBridge(object):
+    """
+    :Description:
+
+    The :class:`EventBusBridge <GLXBob.EventBusBridge.EventBusBridge>` object forward selected signals of a
+    :class:`EventBus <GLXBob.EventBus.EventBus>` to the peer processes over Unix domain sockets, and emit on
+    the local bus the signals received from the peers.
+
+    Emissions are batched: the forwarded signals are accumulated then written as a single frame, a frame is a
+    length prefix followed by the length prefixed :py:mod:`marshal` ``(detailed_signal, args)`` entries of the
+    batch. The signals arguments must be supported by :py:mod:`marshal` (None, bool, int, float, str, bytes,
+    tuple, list, dict, set ...), else the emission is not forwarded and counted as skipped.
+
+    The receiving side use a :py:mod:`selectors` selector, the sockets never block the caller. The signals can be
+    emitted from any thread: the pending emissions, the sockets and the selector are protected by a lock, and the
+    received signals are emitted on the local bus without it.
+
+    .. code-block:: python
+
+       # Process A
+       bridge = EventBusBridge(event_bus)
+       bridge.listen('/tmp/glxbob.sock')
+       bridge.attach(mainloop)
+
+       # Process B
+       bridge = EventBusBridge(event_bus, signals=['resize'])
+       bridge.connect_peer('/tmp/glxbob.sock')
+       bridge.attach(mainloop)
+    """
+    def __init__(self, event_bus, signals=None, batch_size=1024):
+        """
+        :param event_bus: the local bus
+        :param signals: names of the signals forwarded to the peers
+        :param batch_size: number of pending emissions it force a write before the next
+           :func:`EventBusBridge.flush() <GLXBob.EventBusBridge.EventBusBridge.flush()>`
+        :type event_bus: GLXBob.EventBus
+        :type signals: list of str or None
+        :type batch_size: int
+        :raise TypeError: if ``batch_size`` parameter is not a :py:data:`int` type
+        """
+        if type(batch_size) != int:
+            raise TypeError(u'>batch_size< parameter must be a int')
+        self.__event_bus = event_bus
+        self.__batch_size = batch_size
+        self.__selector = selectors.DefaultSelector()
+        self.__listener = None
+        self.__path = None
+        self.__peers = list()
+        self.__pending = bytearray()
+        self.__pending_count = 0
+        self.__skipped = 0
+        # Protect the pending emissions, the sockets and the selector
+        self.__lock = threading.Lock()
+        # Only the thread it emit the received signals don't forward them
+        self.__receiving = threading.local()
+        self.__handler_ids = list()
+        for detailed_signal in signals or ():
+            self.forward(detailed_signal)
+
+    def forward(self, detailed_signal):
+        """
+        Forward the emissions of ``detailed_signal`` on the local bus to the peers.
+
+        :param detailed_signal: a string containing the signal name
+        :type detailed_signal: str
+        """
+        self.__handler_ids.append(self.__event_bus.connect(detailed_signal, self._make_forwarder(detailed_signal)))
+
+    def listen(self, path):
+        """
+        Accept the peers connections on a Unix domain socket.
+
+        :param path: file system path of the socket, a existing file is replaced
+        :type path: str
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        self.__listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__listener.bind(path)
+        self.__listener.listen(16)
+        self.__listener.setblocking(False)
+        self.__path = path
+        self.__selector.register(self.__listener, selectors.EVENT_READ, self._accept)
+
+    def connect_peer(self, path):
+        """
+        Connect to a peer listening on a Unix domain socket, the forwarded signals will be send to it.
+
+        :param path: file system path of the peer socket
+        :type path: str
+        """
+        peer = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        peer.connect(path)
+        self._add_connection(peer)
+        self.__peers.append(peer)
+
+    def get_skipped(self):
+        """
+        Get the number of emissions not forwarded because they parameters are not serialisable.
+
+        :return: skipped emissions
+        :rtype: int
+        """
+        return self.__skipped
+
+    def flush(self):
+        """
+        Write the pending emissions as one frame to every peer.
+        """
+        with self.__lock:
+            self._flush()
+
+    def process(self, timeout=0.0):
+        """
+        Flush the pending emissions, then wait up to ``timeout`` seconds for the sockets activity and emit the
+        received signals on the local bus.
+
+        :param timeout: seconds to wait, 0.0 for never block
+        :type timeout: float
+        :return: :py:obj:`True` for stay attached to a :class:`MainLoop <GLXBob.MainLoop.MainLoop>`
+        :rtype: bool
+        """
+        emissions = list()
+        with self.__lock:
+            self._flush()
+            for key, events in self.__selector.select(timeout):
+                if key.fileobj is self.__listener:
+                    self._accept()
+                    continue
+                if events & selectors.EVENT_WRITE:
+                    self._write(key.fileobj)
+                if events & selectors.EVENT_READ:
+                    emissions += self._read(key.fileobj)
+
+        # Emitted without the lock, a handler can emit a forwarded signal
+        self.__receiving.active = True
+        try:
+            for detailed_signal, args in emissions:
+                self.__event_bus.emit(detailed_signal, *args)
+        finally:
+            self.__receiving.active = False
+        return True
+
+    def attach(self, mainloop):
+        """
+        Process the bridge on each frame of a :class:`MainLoop <GLXBob.MainLoop.MainLoop>`.
+
+        :param mainloop: the loop
+        :type mainloop: GLXBob.MainLoop
+        :return: a integer source identifier
+        :rtype: int
+        """
+        return mainloop.idle_add(self.process)
+
+    def close(self):
+        """
+        Disconnect the forwarders from the local bus, write the pending emissions then close every socket.
+        """
+        for handler_id in self.__handler_ids:
+            self.__event_bus.disconnect(handler_id)
+        self.__handler_ids = list()
+        with self.__lock:
+            self._flush()
+            for peer in self.__peers:
+                outgoing = self.__selector.get_key(peer).data['outgoing']
+                if outgoing:
+                    peer.setblocking(True)
+                    try:
+                        peer.sendall(outgoing)
+                    except OSError:
+                        pass
+            for key in list(self.__selector.get_map().values()):
+                self.__selector.unregister(key.fileobj)
+                key.fileobj.close()
+            self.__peers = list()
+            if self.__path is not None and os.path.exists(self.__path):
+                os.unlink(self.__path)
+            self.__listener = None
+            self.__path = None
+
+    # Internal Method's
+    def _make_forwarder(self, detailed_signal):
+        def forwarder(*args):
+            # Signals received from a peer are not send back
+            if getattr(self.__receiving, 'active', False):
+                return
+            # Serialized now, a not serialisable emission can't break the next frames
+            try:
+                entry = marshal.dumps((detailed_signal, args))
+            except ValueError:
+                with self.__lock:
+                    self.__skipped += 1
+                logging.info('%s: %s not serialisable, skipped', self.__class__.__name__, detailed_signal)
+                return
+            # The header and the entry are always in the same frame
+            with self.__lock:
+                self.__pending += ENTRY_HEADER.pack(len(entry)) + entry
+                self.__pending_count += 1
+                if self.__pending_count >= self.__batch_size:
+                    self._flush()
+
+        return forwarder
+
+    # The caller hold the lock
+    def _flush(self):
+        if not self.__pending:
+            return
+        frame = FRAME_HEADER.pack(len(self.__pending)) + self.__pending
+        self.__pending = bytearray()
+        self.__pending_count = 0
+        for peer in self.__peers:
+            outgoing = self.__selector.get_key(peer).data['outgoing']
+            waiting = bool(outgoing)
+            outgoing += frame
+            # A peer with pending bytes is already waiting to be writable
+            if not waiting:
+                self._write(peer)
+
+    def _add_connection(self, connection):
+        connection.setblocking(False)
+        self.__selector.register(connection, selectors.EVENT_READ, {
+            'incoming': bytearray(),
+            'outgoing': bytearray()
+        })
+
+    def _accept(self):
+        connection, _ = self.__listener.accept()
+        self._add_connection(connection)
+
+    def _drop(self, connection):
+        logging.info(self.__class__.__name__ + ': peer disconnected')
+        self.__selector.unregister(connection)
+        if connection in self.__peers:
+            self.__peers.remove(connection)
+        connection.close()
+
+    def _write(self, connection):
+        buffers = self.__selector.get_key(connection).data
+        try:
+            sent = connection.send(buffers['outgoing'])
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self._drop(connection)
+            return
+        del buffers['outgoing'][:sent]
+        # Wait the socket to be writable only when a part of the frame stay pending
+        events = selectors.EVENT_READ
+        if buffers['outgoing']:
+            events |= selectors.EVENT_WRITE
+        self.__selector.modify(connection, events, buffers)
+
+    def _read(self, connection):
+        key = self.__selector.get_map().get(connection)
+        # The connection can have been dropped by a failed write
+        if key is None:
+            return []
+        incoming = key.data['incoming']
+        try:
+            chunk = connection.recv(262144)
+        except BlockingIOError:
+            return []
+        except OSError:
+            chunk = b''
+        if not chunk:
+            self._drop(connection)
+            return []
+        incoming += chunk
+
+        view = memoryview(incoming)
+        consumed = 0
+        emissions = list()
+        while len(incoming) - consumed >= FRAME_HEADER.size:
+            size, = FRAME_HEADER.unpack_from(incoming, consumed)
+            if len(incoming) - consumed - FRAME_HEADER.size < size:
+                break
+            start = consumed + FRAME_HEADER.size
+            end = start + size
+            while start < end:
+                entry_size, = ENTRY_HEADER.unpack_from(incoming, start)
+                start += ENTRY_HEADER.size
+                emissions.append(marshal.loads(view[start:start + entry_size]))
+                start += entry_size
+            consumed = end
+        view.release()
+        del incoming[:consumed]
+        return emissions
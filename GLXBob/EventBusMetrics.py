@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# Upper bounds in seconds of the handlers latency histograms buckets, the last bucket is +Inf
+LATENCY_BUCKETS = (
+    0.000001, 0.0000025, 0.000005,
+    0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0
+)
+
+# Index of the per signal counters
+EMITS = 0
+DELIVERIES = 1
+BLOCKED = 2
+EXCEPTIONS = 3
+
+
+class Histogram(object):
+    """
+    :Description:
+
+    A fixed buckets histogram, like the Prometheus one.
+    """
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        :param buckets: sorted upper bounds of the buckets
+        :type buckets: tuple
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """
+        Add a value to the histogram.
+
+        :param value: the observed value
+        :type value: float
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def get_cumulative(self):
+        """
+        Get the cumulative counts of the buckets.
+
+        :return: ``(upper_bound, count)`` tuples, the last upper bound is ``float('inf')``
+        :rtype: list
+        """
+        cumulative = list()
+        total = 0
+        for upper_bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            cumulative.append((upper_bound, total))
+        return cumulative
+
+
+class EventBusMetrics(object):
+    """
+    :Description:
+
+    The :class:`EventBusMetrics <GLXBob.EventBusMetrics.EventBusMetrics>` object count the activity of a
+    :class:`EventBus <GLXBob.EventBus.EventBus>`:
+
+       * per signal: emissions, deliveries to handlers, blocked handlers skipped, handlers exceptions
+       * per handler: latency histogram of the invocations
+
+    The counters are plain integers updated without lock, concurrent emissions from many threads can rarely
+    lose a increment. A bus without metrics pay only one test by emission.
+
+    .. code-block:: python
+
+       metrics = EventBusMetrics()
+       event_bus.set_metrics(metrics)
+       ...
+       metrics.write_prometheus('/var/lib/node_exporter/glxbob.prom')
+    """
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        :param buckets: sorted upper bounds in seconds of the latency histograms buckets
+        :type buckets: tuple
+        """
+        self.__buckets = tuple(buckets)
+        self.__signals = dict()
+        self.__handlers = dict()
+        self.__lock = threading.Lock()
+
+    def get_counters(self, detailed_signal):
+        """
+        Get the counters list of a signal, it is created on the first call.
+
+        :param detailed_signal: a string containing the signal name
+        :return: the ``[emits, deliveries, blocked, exceptions]`` counters
+        :rtype: list
+        """
+        counters = self.__signals.get(detailed_signal)
+        if counters is None:
+            with self.__lock:
+                counters = self.__signals.setdefault(detailed_signal, [0, 0, 0, 0])
+        return counters
+
+    def invoke(self, counters, handler_id, detailed_signal, handler, args):
+        """
+        Invoke a handler for the :class:`EventBus <GLXBob.EventBus.EventBus>`, measure it latency and count it
+        exceptions.
+
+        :param counters: the counters list of the signal
+        :param handler_id: a integer handler identifier
+        :param detailed_signal: a string containing the signal name
+        :param handler: the invoked function or method
+        :param args: parameters of the handler
+        :return: the handler return value
+        """
+        counters[DELIVERIES] += 1
+        starting_time = perf_counter()
+        try:
+            return handler(*args)
+        except Exception:
+            counters[EXCEPTIONS] += 1
+            raise
+        finally:
+            elapsed = perf_counter() - starting_time
+            # The histogram is created by add_handler(), a handler it disconnect itself have no more histogram
+            entry = self.__handlers.get(handler_id)
+            if entry is not None:
+                entry[2].observe(elapsed)
+
+    def add_handler(self, handler_id, detailed_signal, handler):
+        """
+        Create the latency histogram of a handler, the :class:`EventBus <GLXBob.EventBus.EventBus>` call it when
+        the handler is connected. A handler without invocation is not in the snapshot.
+
+        :param handler_id: a integer handler identifier
+        :param detailed_signal: a string containing the signal name
+        :param handler: the connected function or method
+        """
+        with self.__lock:
+            self.__handlers.setdefault(handler_id, (
+                detailed_signal,
+                getattr(handler, '__qualname__', repr(handler)),
+                Histogram(self.__buckets)
+            ))
+
+    def remove_handler(self, handler_id):
+        """
+        Forget the latency histogram of a handler, the :class:`EventBus <GLXBob.EventBus.EventBus>` call it when
+        the handler is disconnected, a long-running process don't keep the histograms of it old subscriptions.
+
+        :param handler_id: a integer handler identifier
+        :return: :py:obj:`True` if the handler had a histogram
+        :rtype: bool
+        """
+        with self.__lock:
+            return self.__handlers.pop(handler_id, None) is not None
+
+    def reset(self):
+        """
+        Clear every counters and histograms, the connected handlers keep a empty histogram.
+        """
+        with self.__lock:
+            self.__signals = dict()
+            self.__handlers = dict(
+                (handler_id, (detailed_signal, name, Histogram(self.__buckets)))
+                for handler_id, (detailed_signal, name, _) in self.__handlers.items()
+            )
+
+    def snapshot(self):
+        """
+        Get a copy of the counters and histograms.
+
+        :return: a dictionary with a ``signals`` entry, the counters by signal name, and a ``handlers`` entry,
+           the latency by handler identifier
+        :rtype: dict
+        """
+        signals = dict()
+        for detailed_signal, counters in list(self.__signals.items()):
+            signals[detailed_signal] = {
+                'emits': counters[EMITS],
+                'deliveries': counters[DELIVERIES],
+                'blocked': counters[BLOCKED],
+                'exceptions': counters[EXCEPTIONS]
+            }
+        handlers = dict()
+        for handler_id, (detailed_signal, name, histogram) in list(self.__handlers.items()):
+            if not histogram.count:
+                continue
+            handlers[handler_id] = {
+                'signal': detailed_signal,
+                'handler': name,
+                'count': histogram.count,
+                'sum': histogram.sum,
+                'buckets': histogram.get_cumulative()
+            }
+        return {'signals': signals, 'handlers': handlers}
+
+    def to_prometheus(self):
+        """
+        Format a snapshot with the Prometheus text exposition format.
+
+        :return: the exposition text
+        :rtype: str
+        """
+        snapshot = self.snapshot()
+        lines = list()
+        for name, key, description in (
+                ('glxbob_eventbus_emits_total', 'emits', 'Signal emissions'),
+                ('glxbob_eventbus_deliveries_total', 'deliveries', 'Handlers invocations'),
+                ('glxbob_eventbus_blocked_total', 'blocked', 'Blocked handlers skipped'),
+                ('glxbob_eventbus_exceptions_total', 'exceptions', 'Exceptions raised by handlers')):
+            lines.append('# HELP {0} {1}'.format(name, description))
+            lines.append('# TYPE {0} counter'.format(name))
+            for detailed_signal, counters in sorted(snapshot['signals'].items()):
+                lines.append('{0}{{signal="{1}"}} {2}'.format(name, _escape(detailed_signal), counters[key]))
+
+        name = 'glxbob_eventbus_handler_latency_seconds'
+        lines.append('# HELP {0} Handlers invocation latency'.format(name))
+        lines.append('# TYPE {0} histogram'.format(name))
+        for handler_id, infos in sorted(snapshot['handlers'].items()):
+            labels = 'signal="{0}",handler="{1}",handler_id="{2}"'.format(
+                _escape(infos['signal']),
+                _escape(infos['handler']),
+                handler_id
+            )
+            for upper_bound, count in infos['buckets']:
+                lines.append('{0}_bucket{{{1},le="{2}"}} {3}'.format(name, labels, _format_bound(upper_bound), count))
+            lines.append('{0}_sum{{{1}}} {2!r}'.format(name, labels, infos['sum']))
+            lines.append('{0}_count{{{1}}} {2}'.format(name, labels, infos['count']))
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, destination):
+        """
+        Write the Prometheus text exposition to a file or a socket.
+
+        A file is replaced atomically, it can be read by the node_exporter textfile collector.
+
+        :param destination: a file system path, or a connected socket
+        :type destination: str or socket.socket
+        """
+        text = self.to_prometheus().encode('utf-8')
+        if isinstance(destination, str):
+            temporary = '{0}.{1}.tmp'.format(destination, os.getpid())
+            with open(temporary, 'wb') as exposition:
+                exposition.write(text)
+            os.replace(temporary, destination)
+        else:
+            destination.sendall(text)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value)
@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import mmap
+import struct
+import marshal
+import logging
+import threading
+from bisect import bisect_left
+from time import monotonic, perf_counter
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# File layout:
+#   header: magic, version, reserved, committed length, offset of the last index block
+#   records: kind, timestamp, payload length, then the payload
+# A EVENT payload is a marshal of (detailed_signal, args).
+# A INDEX payload is the offset of the previous index block, a count, then (timestamp, offset) of each
+# event record written since the previous index block.
+JOURNAL_MAGIC = b'GLXJ'
+JOURNAL_VERSION = 1
+HEADER = struct.Struct('<4sHHQQ')
+RECORD = struct.Struct('<BdI')
+INDEX_HEADER = struct.Struct('<QI')
+INDEX_ENTRY = struct.Struct('<dQ')
+
+RECORD_EVENT = 1
+RECORD_INDEX = 2
+
+
+class EventRecorder(object):
+    """
+    :Description:
+
+    The :class:`EventRecorder <GLXBob.EventJournal.EventRecorder>` object append every emission of a
+    :class:`EventBus <GLXBob.EventBus.EventBus>` to a append-only, memory-mapped journal file.
+
+    Each record contain the timestamp, the signal name and the emitted parameters, the parameters must be supported
+    by :py:mod:`marshal`, else the emission is not recorded and counted as skipped.
+    A index block is written each ``index_interval`` records, it permit to
+    :func:`EventReplayer.seek() <GLXBob.EventJournal.EventReplayer.seek()>` without read the whole journal.
+
+    .. code-block:: python
+
+       recorder = EventRecorder(event_bus, '/tmp/production.journal')
+       mainloop.run()
+       recorder.close()
+    """
+    def __init__(self, event_bus, path, index_interval=1024, clock=monotonic, chunk_size=1048576):
+        """
+        :param event_bus: the recorded bus
+        :param path: file system path of the journal, a existing file is replaced
+        :param index_interval: number of records between two index blocks
+        :param clock: the time source of the timestamps
+        :param chunk_size: the file grow by chunk of this size in bytes
+        :type event_bus: GLXBob.EventBus
+        :type path: str
+        :type index_interval: int
+        :type clock: callable
+        :type chunk_size: int
+        :raise TypeError: if ``index_interval`` or ``chunk_size`` parameter is not a :py:data:`int` type
+        """
+        if type(index_interval) != int:
+            raise TypeError(u'>index_interval< parameter must be a int')
+        if type(chunk_size) != int:
+            raise TypeError(u'>chunk_size< parameter must be a int')
+        self.__event_bus = event_bus
+        self.__index_interval = index_interval
+        self.__clock = clock
+        self.__chunk_size = max(chunk_size, mmap.PAGESIZE)
+        self.__index = list()
+        self.__last_index = 0
+        self.__recorded = 0
+        self.__skipped = 0
+        # The emissions can come from many threads
+        self.__lock = threading.Lock()
+
+        self.__file = open(path, 'w+b')
+        self.__file.truncate(self.__chunk_size)
+        self.__mmap = mmap.mmap(self.__file.fileno(), self.__chunk_size)
+        self.__length = HEADER.size
+        self._commit()
+        self.__hook_id = event_bus.add_emission_hook(self._record)
+
+    def get_recorded(self):
+        """
+        Get the number of recorded emissions.
+
+        :return: recorded emissions
+        :rtype: int
+        """
+        return self.__recorded
+
+    def get_skipped(self):
+        """
+        Get the number of emissions not recorded because they parameters are not serialisable.
+
+        :return: skipped emissions
+        :rtype: int
+        """
+        return self.__skipped
+
+    def flush(self):
+        """
+        Flush the memory-mapped journal to the disk.
+        """
+        self.__mmap.flush()
+
+    def close(self):
+        """
+        Stop the recording, write the last index block then truncate the journal to it real size.
+        """
+        if self.__mmap is None:
+            return
+        self.__event_bus.remove_emission_hook(self.__hook_id)
+        # A emission in progress can have take the hook before it removal, it must see the mapping closed
+        with self.__lock:
+            if self.__mmap is None:
+                return
+            self._write_index()
+            self.__mmap.flush()
+            self.__mmap.close()
+            self.__mmap = None
+            self.__file.truncate(self.__length)
+            self.__file.close()
+
+    # Internal Method's
+    def _record(self, detailed_signal, args):
+        try:
+            payload = marshal.dumps((detailed_signal, args))
+        except ValueError:
+            self.__skipped += 1
+            logging.info('%s: %s not serialisable, skipped', self.__class__.__name__, detailed_signal)
+            return
+        with self.__lock:
+            if self.__mmap is None:
+                return
+            timestamp = self.__clock()
+            self.__index.append((timestamp, self.__length))
+            self._append(RECORD_EVENT, timestamp, payload)
+            self.__recorded += 1
+            if len(self.__index) >= self.__index_interval:
+                self._write_index()
+            self._commit()
+
+    def _write_index(self):
+        if not self.__index:
+            return
+        payload = INDEX_HEADER.pack(self.__last_index, len(self.__index))
+        payload += b''.join(INDEX_ENTRY.pack(timestamp, offset) for timestamp, offset in self.__index)
+        self.__last_index = self.__length
+        self._append(RECORD_INDEX, self.__index[-1][0], payload)
+        self.__index = list()
+        self._commit()
+
+    def _append(self, kind, timestamp, payload):
+        size = RECORD.size + len(payload)
+        if self.__length + size > len(self.__mmap):
+            self._grow(self.__length + size)
+        RECORD.pack_into(self.__mmap, self.__length, kind, timestamp, len(payload))
+        self.__mmap[self.__length + RECORD.size:self.__length + size] = payload
+        self.__length += size
+
+    def _grow(self, minimal_size):
+        size = len(self.__mmap)
+        while size < minimal_size:
+            size += max(size, self.__chunk_size)
+        self.__mmap.flush()
+        self.__mmap.close()
+        self.__file.truncate(size)
+        self.__mmap = mmap.mmap(self.__file.fileno(), size)
+
+    def _commit(self):
+        # The committed length permit to read a journal still recorded
+        HEADER.pack_into(self.__mmap, 0, JOURNAL_MAGIC, JOURNAL_VERSION, 0, self.__length, self.__last_index)
+
+
+class EventReplayer(object):
+    """
+    :Description:
+
+    The :class:`EventReplayer <GLXBob.EventJournal.EventReplayer>` object re-emit on a
+    :class:`EventBus <GLXBob.EventBus.EventBus>` the emissions recorded by a
+    :class:`EventRecorder <GLXBob.EventJournal.EventRecorder>`.
+
+    Through a :class:`MainLoop <GLXBob.MainLoop.MainLoop>` the journal is replayed at the recorded rate
+    multiplied by ``speed``, a infinite speed replay as much emissions as the frame time permit.
+
+    .. code-block:: python
+
+       replayer = EventReplayer('/tmp/production.journal')
+       replayer.attach(mainloop, event_bus, speed=4.0)
+       mainloop.run()
+    """
+    def __init__(self, path):
+        """
+        :param path: file system path of the journal
+        :type path: str
+        :raise ValueError: if the file is not a journal
+        """
+        self.__file = open(path, 'rb')
+        self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, _, _ = HEADER.unpack_from(self.__mmap, 0)
+        if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+            self.close()
+            raise ValueError(u'>path< is not a GLXBob journal version {0}'.format(JOURNAL_VERSION))
+        self.__offset = HEADER.size
+        self.__emitted = 0
+        self.__elapsed = 0.0
+
+    def __iter__(self):
+        """
+        Iterate over the recorded emissions from the current position.
+
+        :return: ``(timestamp, detailed_signal, args)`` tuples
+        """
+        while True:
+            record = self._read()
+            if record is None:
+                return
+            yield record
+
+    def seek(self, timestamp):
+        """
+        Move the current position to the first recorded emission at or after ``timestamp``, the index blocks are
+        followed backward from the last one.
+
+        :param timestamp: a timestamp of the recorder clock
+        :type timestamp: float
+        """
+        self.__offset = HEADER.size
+        index_offset = self._get_header()[4]
+        while index_offset:
+            _, _, size = RECORD.unpack_from(self.__mmap, index_offset)
+            start = index_offset + RECORD.size
+            previous, count = INDEX_HEADER.unpack_from(self.__mmap, start)
+            start += INDEX_HEADER.size
+            entries = list(INDEX_ENTRY.iter_unpack(self.__mmap[start:start + count * INDEX_ENTRY.size]))
+            if entries[0][0] <= timestamp:
+                position = bisect_left([entry[0] for entry in entries], timestamp)
+                if position < count:
+                    self.__offset = entries[position][1]
+                else:
+                    self.__offset = index_offset + RECORD.size + size
+                break
+            index_offset = previous
+        # The records after the last index block are not indexed
+        while True:
+            offset = self.__offset
+            record = self._read()
+            if record is None or record[0] >= timestamp:
+                self.__offset = offset
+                return
+
+    def rewind(self):
+        """
+        Move the current position to the first recorded emission.
+        """
+        self.__offset = HEADER.size
+
+    def replay(self, event_bus):
+        """
+        Re-emit every remaining emission as fast as possible, without a :class:`MainLoop <GLXBob.MainLoop.MainLoop>`.
+
+        :param event_bus: the bus where emit the recorded signals
+        :type event_bus: GLXBob.EventBus
+        :return: number of emitted signals
+        :rtype: int
+        """
+        starting_time = perf_counter()
+        count = 0
+        for _, detailed_signal, args in self:
+            event_bus.emit(detailed_signal, *args)
+            count += 1
+        self.__emitted += count
+        self.__elapsed += perf_counter() - starting_time
+        return count
+
+    def attach(self, mainloop, event_bus, speed=1.0, callback=None):
+        """
+        Replay the remaining emissions through a :class:`MainLoop <GLXBob.MainLoop.MainLoop>`, each frame
+        emit the recorded signals it time have come.
+
+        :param mainloop: the loop
+        :param event_bus: the bus where emit the recorded signals
+        :param speed: replay speed multiplier, 1.0 for real time, ``float('inf')`` for max speed
+        :param callback: a callable invoked without parameter at the end of the journal
+        :type mainloop: GLXBob.MainLoop
+        :type event_bus: GLXBob.EventBus
+        :type speed: float
+        :return: a integer source identifier
+        :rtype: int
+        :raise TypeError: if ``speed`` parameter is not a :py:data:`float` type
+        :raise ValueError: if ``speed`` parameter is not positive
+        """
+        if type(speed) != float:
+            raise TypeError(u'>speed< parameter must be a float')
+        if speed <= 0.0:
+            raise ValueError(u'>speed< parameter must be positive')
+        state = {
+            'event_bus': event_bus,
+            'timer': mainloop.get_timer(),
+            'speed': speed,
+            'callback': callback,
+            'origin': None,
+            'starting_time': None
+        }
+        return mainloop.idle_add(self._replay_frame, state)
+
+    def get_emitted(self):
+        """
+        Get the number of replayed emissions.
+
+        :return: replayed emissions
+        :rtype: int
+        """
+        return self.__emitted
+
+    def get_throughput(self):
+        """
+        Get the sustained replay throughput, the replayed emissions divided by the time spent to emit them.
+
+        :return: replayed emissions per second
+        :rtype: float
+        """
+        if not self.__elapsed:
+            return 0.0
+        return self.__emitted / self.__elapsed
+
+    def close(self):
+        """
+        Close the journal.
+        """
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+        self.__file.close()
+
+    # Internal Method's
+    def _get_header(self):
+        return HEADER.unpack_from(self.__mmap, 0)
+
+    def _read(self):
+        # Return the next event record, or None at the end of the committed journal
+        length = min(self._get_header()[3], len(self.__mmap))
+        while self.__offset + RECORD.size <= length:
+            kind, timestamp, size = RECORD.unpack_from(self.__mmap, self.__offset)
+            start = self.__offset + RECORD.size
+            self.__offset = start + size
+            if kind == RECORD_EVENT:
+                detailed_signal, args = marshal.loads(self.__mmap[start:start + size])
+                return timestamp, detailed_signal, args
+        return None
+
+    def _replay_frame(self, state):
+        starting_time = perf_counter()
+        if state['starting_time'] is None:
+            state['starting_time'] = state['timer'].get_time()
+        speed = state['speed']
+        if speed == float('inf'):
+            # Max speed, emit until the frame time is spent
+            deadline = starting_time + 1.0 / state['timer'].get_fps()
+        else:
+            deadline = None
+            now = (state['timer'].get_time() - state['starting_time']) * speed
+        count = 0
+        finished = False
+        while True:
+            offset = self.__offset
+            record = self._read()
+            if record is None:
+                finished = True
+                break
+            timestamp, detailed_signal, args = record
+            if state['origin'] is None:
+                state['origin'] = timestamp
+            if deadline is None and timestamp - state['origin'] > now:
+                # Not yet, it will be emitted on a next frame
+                self.__offset = offset
+                break
+            state['event_bus'].emit(detailed_signal, *args)
+            count += 1
+            if deadline is not None and perf_counter() >= deadline:
+                break
+        self.__emitted += count
+        self.__elapsed += perf_counter() - starting_time
+        if finished and state['callback'] is not None:
+            state['callback']()
+        return not finished
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import deque
+from queue import Full
+from time import monotonic
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# Overflow policies of a full queue
+OVERFLOW_DROP_OLDEST = 'drop-oldest'
+OVERFLOW_DROP_NEWEST = 'drop-newest'
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_RAISE = 'raise'
+
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST, OVERFLOW_BLOCK, OVERFLOW_RAISE)
+
+
+class EventQueue(object):
+    """
+    :Description:
+
+    The :class:`EventQueue <GLXBob.EventQueue.EventQueue>` object is a bounded FIFO of emissions, it is set on a
+    signal with :func:`EventBus.set_signal_queue() <GLXBob.EventBus.EventBus.set_signal_queue()>` and filled by
+    :func:`EventBus.emit_queued() <GLXBob.EventBus.EventBus.emit_queued()>`.
+
+    Overflow policies, when the queue is full:
+       * **drop-oldest**: the oldest emission is dropped for the new one
+       * **drop-newest**: the new emission is dropped
+       * **block**: the producer wait up to ``timeout`` seconds a free place, then :py:exc:`queue.Full` is raised.
+         A producer running in the thread of the :class:`MainLoop <GLXBob.MainLoop.MainLoop>` must not use it, the
+         queue is drained by that thread.
+       * **raise**: :py:exc:`queue.Full` is raised
+
+    The ``on_high`` callback is called when the queue length reach ``high_watermark``, then ``on_low`` is called
+    when it go back down to ``low_watermark``. They receive the queue and are called outside of the queue lock,
+    the producers can use them to slow down.
+
+    .. code-block:: python
+
+       event_queue = EventQueue(maxsize=4096, overflow=OVERFLOW_DROP_OLDEST,
+                                high_watermark=3072, on_high=pause_reader,
+                                low_watermark=1024, on_low=resume_reader)
+       event_bus.set_signal_queue('line', event_queue)
+    """
+    def __init__(self, maxsize=1024, overflow=OVERFLOW_RAISE, timeout=None,
+                 high_watermark=None, low_watermark=None, on_high=None, on_low=None):
+        """
+        :param maxsize: maximum number of queued emissions
+        :param overflow: ``drop-oldest``, ``drop-newest``, ``block`` or ``raise``
+        :param timeout: maximum time in seconds a producer is blocked, :py:obj:`None` for no limit
+        :param high_watermark: queue length it call ``on_high``, :py:obj:`None` for ``maxsize``
+        :param low_watermark: queue length it call ``on_low``, :py:obj:`None` for ``0``
+        :param on_high: a callable it receive the queue
+        :param on_low: a callable it receive the queue
+        :type maxsize: int
+        :type overflow: str
+        :type timeout: float or None
+        :type high_watermark: int or None
+        :type low_watermark: int or None
+        :type on_high: callable or None
+        :type on_low: callable or None
+        :raise TypeError: if ``maxsize`` parameter is not a :py:data:`int` type
+        :raise ValueError: if ``maxsize`` is not positive, ``overflow`` is not a policy or the watermarks are not
+           ordered
+        """
+        if type(maxsize) != int:
+            raise TypeError(u'>maxsize< parameter must be a int')
+        if maxsize <= 0:
+            raise ValueError(u'>maxsize< parameter must be positive')
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(u'>overflow< parameter must be one of ' + ', '.join(OVERFLOW_POLICIES))
+        if type(timeout) != float and timeout is not None:
+            raise TypeError(u'>timeout< parameter must be a float or None')
+        if high_watermark is None:
+            high_watermark = maxsize
+        if low_watermark is None:
+            low_watermark = 0
+        if not 0 <= low_watermark < high_watermark <= maxsize:
+            raise ValueError(u'>low_watermark< and >high_watermark< parameters must be 0 <= low < high <= maxsize')
+
+        self.__items = deque()
+        self.__maxsize = maxsize
+        self.__overflow = overflow
+        self.__timeout = timeout
+        self.__high_watermark = high_watermark
+        self.__low_watermark = low_watermark
+        self.__on_high = on_high
+        self.__on_low = on_low
+        self.__high = False
+        self.__enqueued = 0
+        self.__dequeued = 0
+        self.__dropped = 0
+        self.__lock = threading.Lock()
+        self.__not_full = threading.Condition(self.__lock)
+
+    def __len__(self):
+        return len(self.__items)
+
+    def get_maxsize(self):
+        """
+        Get the maximum number of queued emissions.
+
+        :return: maximum number of queued emissions
+        :rtype: int
+        """
+        return self.__maxsize
+
+    def get_overflow(self):
+        """
+        Get the overflow policy.
+
+        :return: ``drop-oldest``, ``drop-newest``, ``block`` or ``raise``
+        :rtype: str
+        """
+        return self.__overflow
+
+    def is_high(self):
+        """
+        Get the watermark state.
+
+        :return: :py:obj:`True` between the ``on_high`` call and the ``on_low`` call
+        :rtype: bool
+        """
+        return self.__high
+
+    def put(self, args):
+        """
+        Queue a emission.
+
+        :param args: the emitted parameters
+        :type args: tuple
+        :return: :py:obj:`True` if the emission is queued, :py:obj:`False` if it is dropped
+        :rtype: bool
+        :raise queue.Full: with the ``raise`` policy, or the ``block`` policy after ``timeout``
+        """
+        crossed = False
+        with self.__lock:
+            if len(self.__items) >= self.__maxsize:
+                if self.__overflow == OVERFLOW_DROP_OLDEST:
+                    self.__items.popleft()
+                    self.__dropped += 1
+                elif self.__overflow == OVERFLOW_DROP_NEWEST:
+                    self.__dropped += 1
+                    return False
+                elif self.__overflow == OVERFLOW_BLOCK:
+                    self._wait_not_full()
+                else:
+                    self.__dropped += 1
+                    raise Full
+            self.__items.append(args)
+            self.__enqueued += 1
+            if not self.__high and len(self.__items) >= self.__high_watermark:
+                self.__high = crossed = True
+        if crossed and self.__on_high is not None:
+            self.__on_high(self)
+        return True
+
+    def drain(self, max_items=None):
+        """
+        Remove the oldest emissions from the queue.
+
+        :param max_items: maximum number of emissions, :py:obj:`None` for every queued emission
+        :type max_items: int or None
+        :return: list of parameters tuples, oldest first
+        :rtype: list
+        """
+        crossed = False
+        with self.__lock:
+            count = len(self.__items)
+            if max_items is not None and max_items < count:
+                count = max_items
+            popleft = self.__items.popleft
+            drained = [popleft() for _ in range(count)]
+            self.__dequeued += count
+            if count:
+                self.__not_full.notify(count)
+            if self.__high and len(self.__items) <= self.__low_watermark:
+                self.__high = False
+                crossed = True
+        if crossed and self.__on_low is not None:
+            self.__on_low(self)
+        return drained
+
+    def clear(self):
+        """
+        Drop every queued emission, they are counted as dropped. The blocked producers are woken, and ``on_low``
+        is called if the queue was over the high watermark.
+        """
+        crossed = False
+        with self.__lock:
+            self.__dropped += len(self.__items)
+            self.__items.clear()
+            if self.__high:
+                self.__high = False
+                crossed = True
+            self.__not_full.notify_all()
+        if crossed and self.__on_low is not None:
+            self.__on_low(self)
+
+    def get_stats(self):
+        """
+        Get the counters of the queue.
+
+        :return: ``enqueued``, ``dequeued``, ``dropped`` and ``size`` counters
+        :rtype: dict
+        """
+        return {
+            'enqueued': self.__enqueued,
+            'dequeued': self.__dequeued,
+            'dropped': self.__dropped,
+            'size': len(self.__items)
+        }
+
+    # Internal Method's, called with the lock
+    def _wait_not_full(self):
+        if self.__timeout is None:
+            while len(self.__items) >= self.__maxsize:
+                self.__not_full.wait()
+            return
+        deadline = monotonic() + self.__timeout
+        while len(self.__items) >= self.__maxsize:
+            remaining = deadline - monotonic()
+            if remaining <= 0.0:
+                self.__dropped += 1
+                raise Full
+            self.__not_full.wait(remaining)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from time import monotonic
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# Class of the signals without class
+DEFAULT_CLASS = 'default'
+
+
+class FairScheduler(object):
+    """
+    :Description:
+
+    The :class:`FairScheduler <GLXBob.FairScheduler.FairScheduler>` object share the delivery of the queued
+    emissions between classes of signals, it is set with
+    :func:`EventBus.set_queue_scheduler() <GLXBob.EventBus.EventBus.set_queue_scheduler()>`. Without it
+    :func:`EventBus.dispatch_pending() <GLXBob.EventBus.EventBus.dispatch_pending()>` drain the queues one after
+    the other, a noisy producer can use all the frame.
+
+    The scheduler is a deficit round robin: each round give to each class with queued emissions a credit of it
+    ``weight`` emissions, the credit not used by a class it still have emissions is kept for the next round. The
+    delivered emissions of the backlogged classes are proportional to they weights, and a emission of a quiet class
+    is delivered in the first round, whatever the backlog of the others classes. The signals of a class are served
+    one emission at a time in round robin.
+
+    With a ``budget`` or a ``time_budget`` a call of
+    :func:`EventBus.dispatch_pending() <GLXBob.EventBus.EventBus.dispatch_pending()>` stop when it is spent, the
+    rest stay in the queues for the next frame and the interrupted class continue the round with it credit.
+
+    .. code-block:: python
+
+       scheduler = FairScheduler(weights={'input': 8, 'telemetry': 1}, budget=2000)
+       scheduler.set_signal_class('key-press', 'input')
+       scheduler.set_signal_class('metric', 'telemetry')
+       event_bus.set_queue_scheduler(scheduler)
+    """
+    def __init__(self, weights=None, classes=None, budget=None, time_budget=None, clock=monotonic):
+        """
+        :param weights: weight of each class, a class without weight have a weight of 1
+        :param classes: class of each signal, a signal without class is in the ``default`` class
+        :param budget: maximum number of emissions delivered by a call, :py:obj:`None` for no limit
+        :param time_budget: maximum time in seconds of a call, :py:obj:`None` for no limit
+        :param clock: the time source of ``time_budget``
+        :type weights: dict or None
+        :type classes: dict or None
+        :type budget: int or None
+        :type time_budget: float or None
+        :type clock: callable
+        :raise TypeError: if ``budget`` parameter is not a :py:data:`int` or :py:obj:`None`, or ``time_budget``
+           is not a :py:data:`float` or :py:obj:`None`
+        """
+        if type(budget) != int and budget is not None:
+            raise TypeError(u'>budget< parameter must be a int or None')
+        if type(time_budget) != float and time_budget is not None:
+            raise TypeError(u'>time_budget< parameter must be a float or None')
+        self.__budget = budget
+        self.__time_budget = time_budget
+        self.__clock = clock
+        self.__weights = dict()
+        self.__classes = dict()
+        # Round robin order of the classes, and unused credit of the backlogged classes
+        self.__order = deque()
+        self.__deficits = dict()
+        # The class interrupted by the budget continue the round without a new credit
+        self.__interrupted = None
+        self.__delivered = dict()
+        for signal_class, weight in (weights or dict()).items():
+            self.set_class_weight(signal_class, weight)
+        for detailed_signal, signal_class in (classes or dict()).items():
+            self.set_signal_class(detailed_signal, signal_class)
+
+    def set_class_weight(self, signal_class, weight=1):
+        """
+        Set the weight of a class: the number of emissions it deliver by round.
+
+        :param signal_class: name of the class
+        :param weight: a positive weight
+        :type signal_class: str
+        :type weight: int
+        :raise TypeError: if ``weight`` parameter is not a :py:data:`int` type
+        :raise ValueError: if ``weight`` is not positive
+        """
+        if type(weight) != int:
+            raise TypeError(u'>weight< parameter must be a int')
+        if weight <= 0:
+            raise ValueError(u'>weight< parameter must be positive')
+        self.__weights[signal_class] = weight
+
+    def get_class_weight(self, signal_class):
+        """
+        Get the weight of a class.
+
+        :param signal_class: name of the class
+        :type signal_class: str
+        :return: the weight
+        :rtype: int
+        """
+        return self.__weights.get(signal_class, 1)
+
+    def set_signal_class(self, detailed_signal, signal_class=None):
+        """
+        Set the class of a signal.
+
+        :param detailed_signal: a string containing the signal name
+        :param signal_class: name of the class, :py:obj:`None` for the ``default`` class
+        :type detailed_signal: str
+        :type signal_class: str or None
+        """
+        if signal_class is None:
+            self.__classes.pop(detailed_signal, None)
+        else:
+            self.__classes[detailed_signal] = signal_class
+
+    def get_signal_class(self, detailed_signal):
+        """
+        Get the class of a signal.
+
+        :param detailed_signal: a string containing the signal name
+        :type detailed_signal: str
+        :return: name of the class
+        :rtype: str
+        """
+        return self.__classes.get(detailed_signal, DEFAULT_CLASS)
+
+    def get_budget(self):
+        """
+        Get the maximum number of emissions delivered by a call.
+
+        :return: the budget or :py:obj:`None`
+        :rtype: int or None
+        """
+        return self.__budget
+
+    def get_time_budget(self):
+        """
+        Get the maximum time of a call.
+
+        :return: seconds or :py:obj:`None`
+        :rtype: float or None
+        """
+        return self.__time_budget
+
+    def get_delivered(self):
+        """
+        Get the number of delivered emissions of each class.
+
+        :return: the counters by class name
+        :rtype: dict
+        """
+        return dict(self.__delivered)
+
+    def schedule(self, signal_queues, skipped=()):
+        """
+        Remove the emissions from the queues in the delivery order, it is called by
+        :func:`EventBus.dispatch_pending() <GLXBob.EventBus.EventBus.dispatch_pending()>`. The emissions queued
+        during the call are delivered on the next call.
+
+        :param signal_queues: the queue of each signal
+        :param skipped: signal names they queued emissions stay in they queue
+        :type signal_queues: dict
+        :type skipped: frozenset or tuple
+        :return: a iterator of ``(detailed_signal, args)`` tuples
+        :rtype: generator
+        """
+        # Each signal is a flow: [signal name, queue, emissions pending at the call]
+        active = dict()
+        for detailed_signal, event_queue in signal_queues.items():
+            if detailed_signal in skipped:
+                continue
+            pending = len(event_queue)
+            if pending:
+                signal_class = self.__classes.get(detailed_signal, DEFAULT_CLASS)
+                active.setdefault(signal_class, deque()).append([detailed_signal, event_queue, pending])
+        # A class without backlog lose it credit
+        for signal_class in list(self.__deficits):
+            if signal_class not in active:
+                del self.__deficits[signal_class]
+        for signal_class in active:
+            if signal_class not in self.__order:
+                self.__order.append(signal_class)
+        if self.__interrupted in active:
+            self.__order.rotate(-self.__order.index(self.__interrupted))
+        else:
+            self.__deficits.pop(self.__interrupted, None)
+        resumed = self.__interrupted
+        self.__interrupted = None
+
+        remaining = self.__budget
+        deadline = None if self.__time_budget is None else self.__clock() + self.__time_budget
+        order = self.__order
+        while active:
+            for _ in range(len(order)):
+                signal_class = order[0]
+                flows = active.get(signal_class)
+                if flows is None:
+                    order.rotate(-1)
+                    continue
+                deficit = self.__deficits.get(signal_class, 0)
+                if signal_class != resumed:
+                    deficit += self.__weights.get(signal_class, 1)
+                resumed = None
+                delivered = 0
+                while deficit >= 1 and flows:
+                    flow = flows[0]
+                    drained = flow[1].drain(1)
+                    flow[2] -= 1
+                    if flow[2] <= 0 or not drained:
+                        flows.popleft()
+                    else:
+                        flows.rotate(-1)
+                    if not drained:
+                        continue
+                    deficit -= 1
+                    delivered += 1
+                    yield flow[0], drained[0]
+                    if remaining is not None:
+                        remaining -= 1
+                    if remaining == 0 or (deadline is not None and self.__clock() >= deadline):
+                        self.__delivered[signal_class] = self.__delivered.get(signal_class, 0) + delivered
+                        if flows:
+                            self.__deficits[signal_class] = deficit
+                        else:
+                            self.__deficits.pop(signal_class, None)
+                        if flows and deficit >= 1:
+                            self.__interrupted = signal_class
+                        else:
+                            order.rotate(-1)
+                        return
+                self.__delivered[signal_class] = self.__delivered.get(signal_class, 0) + delivered
+                if flows:
+                    self.__deficits[signal_class] = deficit
+                else:
+                    self.__deficits.pop(signal_class, None)
+                    del active[signal_class]
+                order.rotate(-1)
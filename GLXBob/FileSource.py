@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import mmap
+import logging
+from time import monotonic
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+
+class FileSource(object):
+    """
+    :Description:
+
+    The :class:`FileSource <GLXBob.FileSource.FileSource>` object stream a file to a
+    :class:`EventBus <GLXBob.EventBus.EventBus>` without read it in memory: the file is memory-mapped, and each
+    chunk is emitted as a :py:class:`memoryview` of the mapping with it offset in the file. A chunk is valid only
+    during the handlers call, a handler it keep the data must copy it with ``bytes(chunk)``.
+
+    The source is added to a :class:`MainLoop <GLXBob.MainLoop.MainLoop>` with
+    :func:`MainLoop.idle_add() <GLXBob.MainLoop.MainLoop.idle_add()>`, each frame emit up to ``frame_budget`` bytes:
+    a multi-gigabyte file never stall a frame.
+
+    With ``follow`` the file is tailed: it size and it inode are polled each ``poll_interval`` seconds when all the
+    data is emitted, like ``tail -F``. A growth is emitted, a truncated file is read again from the start, and a
+    rotated file (a new file at the path) is read from the start once the end of the previous one is emitted.
+
+    .. code-block:: python
+
+       file_source = FileSource(mainloop.get_event_bus(), '/var/log/syslog', separator=b'\\n')
+       mainloop.get_event_bus().connect('file-chunk', lambda chunk, offset: parse(chunk))
+       mainloop.idle_add(file_source.dispatch)
+    """
+    def __init__(self, event_bus, path, detailed_signal='file-chunk', chunk_size=65536, frame_budget=1048576,
+                 separator=None, follow=True, poll_interval=0.25, offset=0):
+        """
+        :param event_bus: the bus it receive the chunks
+        :param path: file system path of the file
+        :param detailed_signal: the signal emitted with ``chunk`` and ``offset`` parameters
+        :param chunk_size: maximum size in bytes of a chunk
+        :param frame_budget: number of bytes emitted by :func:`FileSource.dispatch()
+           <GLXBob.FileSource.FileSource.dispatch()>`, the last chunk can go over it
+        :param separator: a chunk end after the last separator it contain, :py:obj:`None` for cut anywhere
+        :param follow: :py:obj:`True` for wait the growth of the file like ``tail -F``
+        :param poll_interval: seconds between two checks of the file size and inode
+        :param offset: the offset of the first emitted byte
+        :type event_bus: GLXBob.EventBus
+        :type path: str
+        :type detailed_signal: str
+        :type chunk_size: int
+        :type frame_budget: int
+        :type separator: bytes or None
+        :type follow: bool
+        :type poll_interval: float
+        :type offset: int
+        :raise TypeError: if ``chunk_size``, ``frame_budget`` or ``offset`` parameter is not a :py:data:`int` type,
+           or ``separator`` is not a :py:data:`bytes` or :py:obj:`None`
+        """
+        if type(chunk_size) != int:
+            raise TypeError(u'>chunk_size< parameter must be a int')
+        if type(frame_budget) != int:
+            raise TypeError(u'>frame_budget< parameter must be a int')
+        if type(offset) != int:
+            raise TypeError(u'>offset< parameter must be a int')
+        if type(separator) != bytes and separator is not None:
+            raise TypeError(u'>separator< parameter must be a bytes or None')
+        self.__event_bus = event_bus
+        self.__path = path
+        self.__detailed_signal = detailed_signal
+        self.__chunk_size = max(chunk_size, 1)
+        self.__frame_budget = max(frame_budget, 1)
+        self.__separator = separator or None
+        self.__follow = follow
+        self.__poll_interval = poll_interval
+        self.__next_poll = 0.0
+        self.__file = None
+        self.__mapping = None
+        self.__view = None
+        self.__size = 0
+        self.__offset = 0
+        self.__emitted = 0
+        self.__chunks = 0
+        self.__rotations = 0
+        self.__truncations = 0
+        self._open(open(path, 'rb'))
+        self.__offset = min(max(offset, 0), self.__size)
+
+    def get_path(self):
+        """
+        Get the file system path of the file.
+
+        :return: the path
+        :rtype: str
+        """
+        return self.__path
+
+    def get_offset(self):
+        """
+        Get the offset of the next emitted byte in the current file.
+
+        :return: the offset
+        :rtype: int
+        """
+        return self.__offset
+
+    def dispatch(self):
+        """
+        Emit the next chunks of the file, up to ``frame_budget`` bytes. It is the callback of a
+        :func:`MainLoop.idle_add() <GLXBob.MainLoop.MainLoop.idle_add()>` source.
+
+        :return: :py:obj:`True` while the source is alive, :py:obj:`False` at the end of a not followed file
+        :rtype: bool
+        """
+        if self.__file is None:
+            return False
+        sent = 0
+        while sent < self.__frame_budget:
+            if self.__offset >= self.__size and not self._poll():
+                break
+            end = min(self.__offset + self.__chunk_size, self.__size)
+            if self.__separator is not None:
+                position = self.__mapping.rfind(self.__separator, self.__offset, end)
+                if position >= 0:
+                    end = position + len(self.__separator)
+                elif end < self.__offset + self.__chunk_size and self.__follow:
+                    # The last record is not complete, it is emitted when it end or when the chunk is full
+                    if not self._poll():
+                        break
+                    continue
+            sent += self._emit(end)
+        if not self.__follow and self.__offset >= self.__size:
+            self.close()
+            return False
+        return True
+
+    def close(self):
+        """
+        Unmap and close the file.
+        """
+        self._unmap()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def get_stats(self):
+        """
+        Get the counters of the source.
+
+        :return: ``bytes`` and ``chunks`` emitted, ``rotations`` and ``truncations`` of the followed file counters
+        :rtype: dict
+        """
+        return {
+            'bytes': self.__emitted,
+            'chunks': self.__chunks,
+            'rotations': self.__rotations,
+            'truncations': self.__truncations
+        }
+
+    # Internal Method's
+    def _emit(self, end):
+        chunk = self.__view[self.__offset:end]
+        offset = self.__offset
+        self.__offset = end
+        try:
+            self.__event_bus.emit(self.__detailed_signal, chunk, offset)
+        finally:
+            _release(chunk)
+        self.__emitted += end - offset
+        self.__chunks += 1
+        return end - offset
+
+    def _open(self, file):
+        self.__file = file
+        self.__offset = 0
+        self._map()
+
+    def _map(self):
+        self._unmap()
+        self.__size = os.fstat(self.__file.fileno()).st_size
+        if self.__size:
+            self.__mapping = mmap.mmap(self.__file.fileno(), self.__size, access=mmap.ACCESS_READ)
+            self.__view = memoryview(self.__mapping)
+
+    def _unmap(self):
+        if self.__view is not None:
+            _release(self.__view)
+            self.__view = None
+        if self.__mapping is not None:
+            try:
+                self.__mapping.close()
+            except BufferError:
+                # A handler keep a chunk, the mapping is closed by the garbage collector
+                logging.warning('%s: a handler keep a chunk after it return', self.__class__.__name__)
+            self.__mapping = None
+        self.__size = 0
+
+    def _poll(self):
+        # Return True when there is new data to emit
+        if not self.__follow:
+            return False
+        now = monotonic()
+        if now < self.__next_poll:
+            return False
+        self.__next_poll = now + self.__poll_interval
+        current = os.fstat(self.__file.fileno())
+        if current.st_size < self.__offset:
+            self.__truncations += 1
+            logging.info('%s: %s truncated', self.__class__.__name__, self.__path)
+            self._map()
+            self.__offset = 0
+            return self.__size > 0
+        if current.st_size > self.__size:
+            offset = self.__offset
+            self._map()
+            self.__offset = offset
+            return True
+        try:
+            named = os.stat(self.__path)
+        except FileNotFoundError:
+            # Rotated, the new file is not yet created
+            return False
+        if (named.st_ino, named.st_dev) != (current.st_ino, current.st_dev):
+            self.__rotations += 1
+            logging.info('%s: %s rotated', self.__class__.__name__, self.__path)
+            # The last record of the old file will never end, it is emitted without separator
+            offset = self.__offset
+            self._map()
+            self.__offset = offset
+            if self.__offset < self.__size:
+                self._emit(self.__size)
+            self.close()
+            self._open(open(self.__path, 'rb'))
+            return self.__size > 0
+        return False
+
+
+def _release(view):
+    try:
+        view.release()
+    except BufferError:
+        pass
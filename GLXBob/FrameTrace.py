@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import mmap
+import struct
+from GLXBob.Timer import EVENT_NONE, EVENT_GOAL, EVENT_UP, EVENT_DOWN
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# File layout:
+#   header: magic, version, record size
+#   records: time, slack, fps, increment, event, late, padding
+# The records have a fixed width, a trace can be memory-mapped as a array of records.
+TRACE_MAGIC = b'GLXFTRC\x00'
+TRACE_VERSION = 1
+HEADER = struct.Struct('<8sII')
+RECORD = struct.Struct('<dddfBB2x')
+
+
+class FrameTraceWriter(object):
+    """
+    :Description:
+
+    The :class:`FrameTraceWriter <GLXBob.FrameTrace.FrameTraceWriter>` object append a fixed width record by frame of
+    a :class:`Timer <GLXBob.Timer.Timer>` to a binary trace file. It is set with
+    :func:`Timer.set_frame_trace() <GLXBob.Timer.Timer.set_frame_trace()>`, the trace is analysed offline with
+    ``python -m GLXBob.analyze``.
+
+    Record fields:
+       * **time**: :func:`Timer.get_time() <GLXBob.Timer.Timer.get_time()>` when the frame end
+       * **slack**: seconds before the deadline of the frame, negative when the frame is late
+       * **fps**: the frame rate after the adjustment of the frame
+       * **increment**: the fps step applied by the frame
+       * **event**: ``EVENT_GOAL``, ``EVENT_UP`` or ``EVENT_DOWN`` when the frame rate memory is analysed, else
+         ``EVENT_NONE``
+       * **late**: 1 if the frame is late
+
+    .. code-block:: python
+
+       timer.set_frame_trace(FrameTraceWriter('/var/tmp/frames.trace'))
+    """
+    def __init__(self, path, buffer_size=1048576):
+        """
+        :param path: file system path of the trace, a existing file is replaced
+        :param buffer_size: size in bytes of the write buffer
+        :type path: str
+        :type buffer_size: int
+        :raise TypeError: if ``buffer_size`` parameter is not a :py:data:`int` type
+        """
+        if type(buffer_size) != int:
+            raise TypeError(u'>buffer_size< parameter must be a int')
+        self.__file = open(path, 'wb', buffering=max(buffer_size, RECORD.size))
+        self.__file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION, RECORD.size))
+        self.__written = 0
+
+    def write(self, time, slack, fps, increment, event=EVENT_NONE, late=False):
+        """
+        Append the record of a frame.
+
+        :param time: time of the end of the frame in seconds
+        :param slack: seconds before the deadline of the frame
+        :param fps: frame rate
+        :param increment: fps step applied by the frame
+        :param event: ``EVENT_NONE``, ``EVENT_GOAL``, ``EVENT_UP`` or ``EVENT_DOWN``
+        :param late: :py:obj:`True` if the frame is late
+        :type time: float
+        :type slack: float
+        :type fps: float
+        :type increment: float
+        :type event: int
+        :type late: bool
+        """
+        self.__file.write(RECORD.pack(time, slack, fps, increment, event, late))
+        self.__written += 1
+
+    def get_written(self):
+        """
+        Get the number of written records.
+
+        :return: number of records
+        :rtype: int
+        """
+        return self.__written
+
+    def flush(self):
+        """
+        Write the buffered records to the file.
+        """
+        self.__file.flush()
+
+    def close(self):
+        """
+        Flush and close the trace file.
+        """
+        if not self.__file.closed:
+            self.__file.close()
+
+
+def read_frame_trace(path):
+    """
+    Read the records of a trace file, without NumPy. The ``GLXBob.analyze`` module map a large trace as NumPy arrays.
+
+    :param path: file system path of the trace
+    :type path: str
+    :return: ``(time, slack, fps, increment, event, late)`` tuples
+    :rtype: list
+    :raise ValueError: if the file is not a frame trace
+    """
+    with open(path, 'rb') as trace:
+        header = trace.read(HEADER.size)
+        check_header(header)
+        if trace.seek(0, 2) == HEADER.size:
+            return list()
+        with mmap.mmap(trace.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            # A record truncated by a crash is ignored
+            end = HEADER.size + (len(mapping) - HEADER.size) // RECORD.size * RECORD.size
+            return list(RECORD.iter_unpack(mapping[HEADER.size:end]))
+
+
+def check_header(header):
+    """
+    Check the header of a trace file.
+
+    :param header: the first bytes of the file
+    :type header: bytes
+    :raise ValueError: if the header is not a frame trace header of the supported version
+    """
+    if len(header) < HEADER.size:
+        raise ValueError(u'not a frame trace: the file is too short')
+    magic, version, record_size = HEADER.unpack_from(header)
+    if magic != TRACE_MAGIC:
+        raise ValueError(u'not a frame trace: bad magic')
+    if version != TRACE_VERSION or record_size != RECORD.size:
+        raise ValueError(u'unsupported frame trace version {0}'.format(version))
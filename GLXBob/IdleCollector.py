@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gc
+from time import perf_counter
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# A automatic collection threshold it is never reach
+NEVER = 2 ** 31 - 1
+
+
+class IdleCollector(object):
+    """
+    :Description:
+
+    The :class:`IdleCollector <GLXBob.IdleCollector.IdleCollector>` object move the cyclic garbage collections out
+    of the frames work: the automatic collections are disabled, and the due collections are run in the time a
+    :class:`Timer <GLXBob.Timer.Timer>` would sleep at the end of a frame.
+
+    A collection is run only when the slack of the frame is greater than it measured cost, else it is deferred.
+    A collection deferred for ``max_deferred`` frames is forced, the memory can't grow without limit when the
+    frames have no slack.
+
+    Modes:
+       * **generation 2**: only the generation 2 collections are moved, the young generations stay automatic,
+         they are short
+       * **generation 0**: every collection is moved, the collector is disabled with :py:func:`gc.disable`
+
+    .. code-block:: python
+
+       mainloop.set_idle_collector(IdleCollector(generation=2))
+    """
+    def __init__(self, generation=2, max_deferred=600):
+        """
+        :param generation: the youngest generation collected in the slack, 0 or 2
+        :param max_deferred: number of frames a due collection can be deferred before it is forced
+        :type generation: int
+        :type max_deferred: int
+        :raise TypeError: if ``generation`` or ``max_deferred`` parameter is not a :py:data:`int` type
+        :raise ValueError: if ``generation`` is not 0 or 2
+        """
+        if type(generation) != int:
+            raise TypeError(u'>generation< parameter must be a int')
+        if generation not in (0, 2):
+            raise ValueError(u'>generation< parameter must be 0 or 2')
+        if type(max_deferred) != int:
+            raise TypeError(u'>max_deferred< parameter must be a int')
+        self.__generation = generation
+        self.__max_deferred = max_deferred
+        self.__enabled = False
+        self.__collecting = False
+        self.__thresholds = gc.get_threshold()
+        self.__was_enabled = gc.isenabled()
+        # Cost estimate in seconds of each generation collection, None before the first measure
+        self.__costs = [None, None, None]
+        self.__deferred_frames = 0
+        self.__collections = 0
+        self.__deferred = 0
+        self.__forced = 0
+        self.__automatic = 0
+
+    def get_generation(self):
+        """
+        Get the youngest generation collected in the slack.
+
+        :return: 0 or 2
+        :rtype: int
+        """
+        return self.__generation
+
+    def is_enabled(self):
+        """
+        Get the state of the collector.
+
+        :return: :py:obj:`True` if the automatic collections are disabled by the collector
+        :rtype: bool
+        """
+        return self.__enabled
+
+    def enable(self):
+        """
+        Disable the automatic collections moved in the slack, the previous :py:mod:`gc` configuration is saved.
+        """
+        if self.__enabled:
+            return
+        self.__thresholds = gc.get_threshold()
+        self.__was_enabled = gc.isenabled()
+        if self.__generation == 0:
+            gc.disable()
+        else:
+            gc.set_threshold(self.__thresholds[0], self.__thresholds[1], NEVER)
+        gc.callbacks.append(self._on_collection)
+        self.__enabled = True
+
+    def disable(self):
+        """
+        Restore the :py:mod:`gc` configuration saved by
+        :func:`IdleCollector.enable() <GLXBob.IdleCollector.IdleCollector.enable()>`.
+        """
+        if not self.__enabled:
+            return
+        gc.callbacks.remove(self._on_collection)
+        gc.set_threshold(*self.__thresholds)
+        if self.__was_enabled:
+            gc.enable()
+        self.__enabled = False
+
+    def collect(self, slack):
+        """
+        Run the due collection if the slack allow it, a :class:`Timer <GLXBob.Timer.Timer>` call it before it
+        sleep.
+
+        :param slack: seconds before the next frame
+        :type slack: float
+        :return: the collected generation, or :py:obj:`None` if nothing is collected
+        :rtype: int or None
+        """
+        if not self.__enabled:
+            return None
+        generation = self._get_due_generation()
+        if generation is None:
+            self.__deferred_frames = 0
+            return None
+        cost = self.__costs[generation]
+        # A never measured generation is tried when the slack is a least one millisecond
+        if cost is None:
+            cost = 0.001
+        if cost < slack:
+            self._collect(generation)
+            self.__collections += 1
+            return generation
+        self.__deferred_frames += 1
+        if self.__deferred_frames < self.__max_deferred:
+            self.__deferred += 1
+            return None
+        self._collect(generation)
+        self.__forced += 1
+        return generation
+
+    def get_costs(self):
+        """
+        Get the measured cost of each generation collection.
+
+        :return: seconds by generation, :py:obj:`None` for a never measured generation
+        :rtype: list
+        """
+        return list(self.__costs)
+
+    def get_stats(self):
+        """
+        Get the counters of the collector.
+
+        :return: ``collections`` (run in the slack, they are pauses avoided in the frames), ``deferred`` (frames
+           without enough slack), ``forced`` (run after ``max_deferred`` frames) and ``automatic`` (collections
+           triggered by the interpreter during the frames) counters
+        :rtype: dict
+        """
+        return {
+            'collections': self.__collections,
+            'deferred': self.__deferred,
+            'forced': self.__forced,
+            'automatic': self.__automatic
+        }
+
+    # Internal Method's
+    def _get_due_generation(self):
+        # Like the interpreter, the oldest generation over it threshold is collected
+        counts = gc.get_count()
+        for generation in (2, 1, 0):
+            if generation < self.__generation:
+                break
+            # A zero threshold disable the generation, like for the interpreter
+            if self.__thresholds[generation] and counts[generation] >= self.__thresholds[generation]:
+                return generation
+        return None
+
+    def _collect(self, generation):
+        # The own collections are not counted as automatic
+        self.__collecting = True
+        try:
+            starting_time = perf_counter()
+            gc.collect(generation)
+            elapsed = perf_counter() - starting_time
+        finally:
+            self.__collecting = False
+        self.__deferred_frames = 0
+        # Exponential moving average, a outlier is smoothed
+        if self.__costs[generation] is None:
+            self.__costs[generation] = elapsed
+        else:
+            self.__costs[generation] += (elapsed - self.__costs[generation]) / 4.0
+
+    def _on_collection(self, phase, info):
+        if not self.__collecting and phase == 'start' and info['generation'] >= self.__generation:
+            self.__automatic += 1
@@ -2,8 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import logging
-from GLXBob import Timer
-from random import randint
+import itertools
+from bisect import bisect_right
+from GLXBob.Timer import Timer
+from GLXBob.EventBus import EventBus
+from GLXBob.EventBus import PRIORITY_DEFAULT
+from GLXBob.OverloadDetector import OVERLOAD_ENTER, SIGNAL_OVERLOAD_ENTER, SIGNAL_OVERLOAD_EXIT
 from time import sleep
 import sys
 
@@ -11,6 +15,10 @@ import sys
 # http://www.gnu.org/licenses/gpl-3.0.en.html
 # Author: Tuuux <tuxa at rtnp dot org> all rights reserved
 
+# Signals emitted on the EventBus when a task added with MainLoop.add_task() end
+SIGNAL_TASK_DONE = 'task-done'
+SIGNAL_TASK_FAILED = 'task-failed'
+
 
 class Signal(Exception):
     """
@@ -84,6 +92,21 @@ class MainLoop(object):
     """
     # http://code.activestate.com/recipes/579053-high-precision-fps/
     __metaclass__ = Singleton
+    __slots__ = (
+        '__is_running',
+        '__timer',
+        '__event_bus',
+        '__asyncio_loop',
+        '__sources',
+        '__source_ids',
+        '__idle_collector',
+        '__allocation_profiler',
+        '__scheduling_policy',
+        '__overload_detector',
+        '__tasks',
+        '__task_slice',
+        '__weakref__'
+    )
 
     def __init__(self):
         """
@@ -113,9 +136,57 @@ class MainLoop(object):
               | Default value | :py:data:`GLXBob.Timer()`     |
               +---------------+-------------------------------+
 
+        .. py:data:: event_bus
+
+            The GLXBob.EventBus() object of the loop
+
+              +---------------+-------------------------------+
+              | Type          | :py:data:`GLXBob.EventBus()`  |
+              +---------------+-------------------------------+
+              | Flags         | Read / Write                  |
+              +---------------+-------------------------------+
+              | Default value | :py:data:`GLXBob.EventBus()`  |
+              +---------------+-------------------------------+
+
+        .. py:data:: asyncio_loop
+
+            The :py:mod:`asyncio` event loop run a iteration on each frame, it is created on the first
+            :func:`MainLoop.get_asyncio_loop() <GLXBob.MainLoop.MainLoop.get_asyncio_loop()>` call
+
+              +---------------+-------------------------------+
+              | Type          | asyncio.AbstractEventLoop     |
+              +---------------+-------------------------------+
+              | Flags         | Read Only                     |
+              +---------------+-------------------------------+
+              | Default value | :py:obj:`None`                |
+              +---------------+-------------------------------+
+
+        .. py:data:: sources
+
+            The callbacks added with :func:`MainLoop.idle_add() <GLXBob.MainLoop.MainLoop.idle_add()>`, sorted
+            by priority
+
+              +---------------+-------------------------------+
+              | Type          | :py:data:`list`               |
+              +---------------+-------------------------------+
+              | Flags         | Read Only                     |
+              +---------------+-------------------------------+
+              | Default value | Empty :py:data:`list`         |
+              +---------------+-------------------------------+
+
         """
         self.__is_running = False
         self.__timer = Timer()
+        self.__event_bus = EventBus()
+        self.__asyncio_loop = None
+        self.__sources = list()
+        self.__source_ids = itertools.count(1)
+        self.__idle_collector = None
+        self.__allocation_profiler = None
+        self.__scheduling_policy = None
+        self.__overload_detector = None
+        self.__tasks = list()
+        self.__task_slice = 0.5
 
     def is_running(self):
         """
@@ -135,6 +206,27 @@ class MainLoop(object):
         otherwise it will simply wait.
         """
         self._set_is_running(True)
+        # The CPU affinity and the scheduling class of the loop thread
+        if self.get_scheduling_policy() is not None:
+            self.get_scheduling_policy().apply()
+        # The coroutine handlers of the bus are scheduled on the loop asyncio integration
+        if self.get_event_bus().get_asyncio_loop() is None:
+            self.get_event_bus().set_asyncio_loop(self.get_asyncio_loop())
+        # A sleep calibrator without model is calibrated before the first frame
+        sleep_calibrator = self.get_timer().get_sleep_calibrator()
+        if sleep_calibrator is not None and not sleep_calibrator.is_calibrated():
+            sleep_calibrator.calibrate()
+        # The delivery policies of the bus use the loop clock
+        self.get_event_bus().set_clock(self.get_timer().get_time)
+        # The garbage collections are moved in the spare time of the frames
+        if self.get_idle_collector() is not None:
+            self.get_idle_collector().enable()
+            self.get_timer().set_idle_handler(self.get_idle_collector().collect)
+        # The allocations of the frames and of the handlers are traced
+        if self.get_allocation_profiler() is not None:
+            if self.get_event_bus().get_metrics() is None:
+                self.get_event_bus().set_metrics(self.get_allocation_profiler())
+            self.get_allocation_profiler().start()
         logging.info(self.__class__.__name__ + ': Starting ...')
         self._run()
 
@@ -179,8 +271,336 @@ class MainLoop(object):
         """
         return self.__timer
 
+    def set_event_bus(self, event_bus=None):
+        """
+        Set the :py:obj:`event_bus` property.
+
+        :param event_bus: a object initialize by you self or :py:obj:`None` for a self created
+           :class:`EventBus <GLXBob.EventBus.EventBus>`
+        :type event_bus: GLXBob.EventBus
+        """
+        if event_bus is None:
+            event_bus = EventBus()
+        self.__event_bus = event_bus
+
+    def get_event_bus(self):
+        """
+        Return the event_bus property value
+
+        :return: a object :class:`EventBus <GLXBob.EventBus.EventBus>` ready to be requested
+        :rtype: GLXBob.EventBus
+        """
+        return self.__event_bus
+
+    def get_asyncio_loop(self):
+        """
+        Return the :py:mod:`asyncio` event loop integrated to the :class:`MainLoop <GLXBob.MainLoop.MainLoop>`,
+        it is created on the first call. The ready callbacks and the I/O of the asyncio loop are processed on each
+        frame without blocking.
+
+        :return: the asyncio event loop
+        :rtype: asyncio.AbstractEventLoop
+        """
+        if self.__asyncio_loop is None:
+            # Imported on demand, asyncio is the slowest module to import
+            import asyncio
+            self.__asyncio_loop = asyncio.new_event_loop()
+        return self.__asyncio_loop
+
+    def idle_add(self, callback, *args, priority=PRIORITY_DEFAULT):
+        """
+        Add a callback invoked on each frame of the :class:`MainLoop <GLXBob.MainLoop.MainLoop>`, like GLib, the
+        callback is automatically removed when it don't return :py:obj:`True`.
+
+        :param callback: function or method
+        :param *args: parameters passed to the callback
+        :param priority: invocation order of the callback, lower value is invoked first
+        :type priority: int
+        :return: a integer source identifier
+        :rtype: int
+        """
+        source = {
+            'source_id': next(self.__source_ids),
+            'callback': callback,
+            'argvs': args,
+            'priority': priority
+        }
+        position = bisect_right([infos['priority'] for infos in self.__sources], priority)
+        self.__sources.insert(position, source)
+        return source['source_id']
+
+    def source_remove(self, source_id):
+        """
+        Remove a callback added with :func:`MainLoop.idle_add() <GLXBob.MainLoop.MainLoop.idle_add()>`.
+
+        :param source_id: a integer source identifier
+        :type source_id: int
+        :return: :py:obj:`True` if the source was found and removed
+        :rtype: bool
+        """
+        for source in self.__sources:
+            if source['source_id'] == source_id:
+                self.__sources.remove(source)
+                return True
+        return False
+
+    def add_task(self, task, priority=PRIORITY_DEFAULT):
+        """
+        Add a long job cut in steps: a generator, or a coroutine it only await ``asyncio.sleep(0)``. Each frame
+        advance the tasks one step at a time until the task slice of the frame budget is spent, a step must be short
+        compared to a frame.
+
+        The tasks of the lowest priority value are advanced first, the tasks of a same priority are advanced by
+        round-robin. When a task end, ``task-done`` is emitted on the :class:`EventBus <GLXBob.EventBus.EventBus>`
+        with the task identifier and the return value of the task, or ``task-failed`` with the task identifier
+        and the exception.
+
+        .. code-block:: python
+
+           def scan(path):
+               for entry in os.scandir(path):
+                   index(entry)
+                   yield
+               return path
+
+           mainloop.add_task(scan('/srv/data'), priority=PRIORITY_LOW)
+
+        :param task: a generator or a coroutine
+        :param priority: advance order of the task, lower value is advanced first
+        :type priority: int
+        :return: a integer task identifier
+        :rtype: int
+        :raise TypeError: if ``task`` have no ``send()`` method
+        """
+        if not hasattr(task, 'send'):
+            raise TypeError(u'>task< parameter must be a generator or a coroutine')
+        task_infos = {
+            'task_id': next(self.__source_ids),
+            'task': task,
+            'priority': priority
+        }
+        self._insert_task(task_infos)
+        return task_infos['task_id']
+
+    def remove_task(self, task_id):
+        """
+        Remove a task added with :func:`MainLoop.add_task() <GLXBob.MainLoop.MainLoop.add_task()>`, it is closed.
+
+        :param task_id: a integer task identifier
+        :type task_id: int
+        :return: :py:obj:`True` if the task was found and removed
+        :rtype: bool
+        """
+        for task_infos in self.__tasks:
+            if task_infos['task_id'] == task_id:
+                self.__tasks.remove(task_infos)
+                task_infos['task'].close()
+                return True
+        return False
+
+    def get_tasks(self):
+        """
+        Get the identifiers of the running tasks, in advance order.
+
+        :return: the task identifiers
+        :rtype: list
+        """
+        return [task_infos['task_id'] for task_infos in self.__tasks]
+
+    def set_task_slice(self, task_slice=0.5):
+        """
+        Set the part of the frame budget the tasks can use, the frame work before the tasks is counted in it. One
+        step is done by frame even when the slice is already spent, but it is the step of the first task only: the
+        tasks of a same priority advance in turn over the frames, and a task of a higher priority value wait while
+        the tasks before it use all the slice.
+
+        :param task_slice: part of the frame budget, 0.5 is the half of the frame
+        :type task_slice: float
+        :raise TypeError: if ``task_slice`` parameter is not a :py:data:`float` type
+        """
+        if type(task_slice) != float:
+            raise TypeError(u'>task_slice< parameter must be a float')
+        self.__task_slice = task_slice
+
+    def get_task_slice(self):
+        """
+        Get the part of the frame budget the tasks can use.
+
+        :return: part of the frame budget
+        :rtype: float
+        """
+        return self.__task_slice
+
+    def set_idle_collector(self, idle_collector=None):
+        """
+        Set the object it move the garbage collections in the spare time of the frames, it is enabled when the
+        :class:`MainLoop <GLXBob.MainLoop.MainLoop>` run, and disabled when it stop.
+
+        :param idle_collector: the collector or :py:obj:`None` for keep the automatic collections
+        :type idle_collector: GLXBob.IdleCollector or None
+        """
+        if self.get_idle_collector() is not None:
+            self.get_idle_collector().disable()
+            self.get_timer().set_idle_handler()
+        self.__idle_collector = idle_collector
+        if idle_collector is not None and self.is_running():
+            idle_collector.enable()
+            self.get_timer().set_idle_handler(idle_collector.collect)
+
+    def get_idle_collector(self):
+        """
+        Get the object it move the garbage collections in the spare time of the frames.
+
+        :return: the collector or :py:obj:`None`
+        :rtype: GLXBob.IdleCollector or None
+        """
+        return self.__idle_collector
+
+    def set_allocation_profiler(self, allocation_profiler=None):
+        """
+        Set the object it measure the allocations of each frame, it trace the allocations when the
+        :class:`MainLoop <GLXBob.MainLoop.MainLoop>` run. It is set as the metrics of the
+        :class:`EventBus <GLXBob.EventBus.EventBus>` when the bus have none, then the allocations of the handlers are
+        measured too.
+
+        :param allocation_profiler: the profiler or :py:obj:`None` for don't measure the allocations
+        :type allocation_profiler: GLXBob.AllocationProfiler or None
+        """
+        if self.get_allocation_profiler() is not None:
+            self.get_allocation_profiler().stop()
+        self.__allocation_profiler = allocation_profiler
+        if allocation_profiler is not None and self.is_running():
+            allocation_profiler.start()
+
+    def get_allocation_profiler(self):
+        """
+        Get the object it measure the allocations of each frame.
+
+        :return: the profiler or :py:obj:`None`
+        :rtype: GLXBob.AllocationProfiler or None
+        """
+        return self.__allocation_profiler
+
+    def set_scheduling_policy(self, scheduling_policy=None):
+        """
+        Set the CPU affinity, the scheduling class and the niceness applied to the thread of the
+        :class:`MainLoop <GLXBob.MainLoop.MainLoop>` when it run. The worker processes started later inherit them,
+        a :class:`ProcessExecutor <GLXBob.ProcessExecutor.ProcessExecutor>` can set it own.
+
+        :param scheduling_policy: the settings or :py:obj:`None` for keep the scheduling of the thread
+        :type scheduling_policy: GLXBob.SchedulingPolicy or None
+        """
+        self.__scheduling_policy = scheduling_policy
+
+    def get_scheduling_policy(self):
+        """
+        Get the settings applied to the thread of the :class:`MainLoop <GLXBob.MainLoop.MainLoop>` when it run.
+
+        :return: the settings or :py:obj:`None`
+        :rtype: GLXBob.SchedulingPolicy or None
+        """
+        return self.__scheduling_policy
+
+    def set_overload_detector(self, overload_detector=None):
+        """
+        Set the object it detect a sustained overload of the frames. The
+        :class:`MainLoop <GLXBob.MainLoop.MainLoop>` emit ``overload-enter`` and ``overload-exit`` on it
+        :class:`EventBus <GLXBob.EventBus.EventBus>`, and shed the low priority work during the overload.
+
+        :param overload_detector: the detector or :py:obj:`None` for never shed work
+        :type overload_detector: GLXBob.OverloadDetector or None
+        """
+        self.__overload_detector = overload_detector
+
+    def get_overload_detector(self):
+        """
+        Get the object it detect a sustained overload of the frames.
+
+        :return: the detector or :py:obj:`None`
+        :rtype: GLXBob.OverloadDetector or None
+        """
+        return self.__overload_detector
+
+    def io_add_watch(self, fileobj, events, callback, *args):
+        """
+        Watch a file, the callback is called when it is ready during the wait of the frames. Like GLib, the watch
+        is automatically removed when the callback don't return :py:obj:`True`.
+
+        The frames and the I/O are waited together by the :class:`Pacer <GLXBob.Pacer.Pacer>` of the
+        :class:`Timer <GLXBob.Timer.Timer>`, a pacer is set on the timer if it have none.
+
+        :param fileobj: a file object or a file descriptor
+        :param events: :py:data:`selectors.EVENT_READ` and / or :py:data:`selectors.EVENT_WRITE`
+        :param callback: a callable it receive ``fileobj``, the ready events, then ``args``
+        :param *args: additional parameters arg1, arg2
+        :type events: int
+        """
+        if self.get_timer().get_pacer() is None:
+            # Imported on demand, a loop without I/O watch don't load selectors
+            from GLXBob.Pacer import Pacer
+            self.get_timer().set_pacer(Pacer())
+        self.get_timer().get_pacer().register(fileobj, events, callback, *args)
+
+    def io_remove_watch(self, fileobj):
+        """
+        Stop to watch a file added with :func:`MainLoop.io_add_watch() <GLXBob.MainLoop.MainLoop.io_add_watch()>`.
+
+        :param fileobj: a file object or a file descriptor
+        :return: :py:obj:`True` if the file was watched
+        :rtype: bool
+        """
+        if self.get_timer().get_pacer() is None:
+            return False
+        return self.get_timer().get_pacer().unregister(fileobj)
+
     # Internal Method's
 
+    def _run_asyncio(self):
+        # One iteration of the asyncio loop, the stop callback is queued after the ready callbacks
+        if self.__asyncio_loop is not None:
+            self.__asyncio_loop.call_soon(self.__asyncio_loop.stop)
+            self.__asyncio_loop.run_forever()
+
+    def _dispatch_sources(self):
+        # A callback can add or remove sources during the dispatch
+        overload_detector = self.__overload_detector
+        for source in list(self.__sources):
+            if overload_detector is not None and overload_detector.should_shed(source['priority']):
+                continue
+            if source['callback'](*source['argvs']) is not True:
+                self.source_remove(source['source_id'])
+
+    def _insert_task(self, task_infos):
+        # At the end of the tasks of same priority, it make the round-robin
+        position = bisect_right([infos['priority'] for infos in self.__tasks], task_infos['priority'])
+        self.__tasks.insert(position, task_infos)
+
+    def _run_tasks(self, deadline):
+        while self.__tasks:
+            task_infos = self.__tasks.pop(0)
+            try:
+                task_infos['task'].send(None)
+            except StopIteration as stop:
+                self.get_event_bus().emit(SIGNAL_TASK_DONE, task_infos['task_id'], stop.value)
+            except Exception as error:
+                logging.error('%s: task %d failed: %r', self.__class__.__name__, task_infos['task_id'], error)
+                self.get_event_bus().emit(SIGNAL_TASK_FAILED, task_infos['task_id'], error)
+            else:
+                self._insert_task(task_infos)
+            if self.get_timer().get_time() >= deadline:
+                return
+
+    def _update_overload(self, late, usage):
+        transition = self.__overload_detector.update(late, usage)
+        if transition is None:
+            return
+        if transition == OVERLOAD_ENTER:
+            logging.warning('%s: overload, usage %.2f of the frame budget', self.__class__.__name__, usage)
+            self.get_event_bus().emit(SIGNAL_OVERLOAD_ENTER, self.__overload_detector)
+        else:
+            logging.info('%s: overload end', self.__class__.__name__)
+            self.get_event_bus().emit(SIGNAL_OVERLOAD_EXIT, self.__overload_detector)
+
     def _set_is_running(self, boolean):
         """
         Set the __is_running attribute
@@ -206,39 +626,66 @@ class MainLoop(object):
         return self.__is_running
 
     def _run(self):
-        while self.is_running():
-            try:
-                # Must be the first line
-                starting_time = self.get_timer().get_time()
-
-                # Do stuff that might take significant time here
-
-                # sleep_for = 1.0 / randint(1, randint(2, 500))
-                # sleep_for = 1.0 / randint(40, randint(41, 500))
-                # sleep_for = 1.0 / randint(20, 75)
-                # sleep_for = 1.0 / randint(50, 200)
-                # sleep(sleep_for)
-
-                # Timer control
-                if self.get_timer().tick():
-
-                    print('[ OK ]-> {1} fps, iteration take {0} sec'.format(
-                        self.get_timer().get_time() - starting_time,
-                        self.get_timer().get_fps()
-                        ))
-                else:
-
-                    print('[    ]-> {1} fps, iteration take {0} sec'.format(
-                        self.get_timer().get_time() - starting_time,
-                        self.get_timer().get_fps()
-                        ))
-
-            except KeyboardInterrupt:
-                Signal("QUIT", KeyboardInterrupt, self.quit)
-                break
-            except MemoryError:
-                self._set_is_running(False)
-                logging.info(self.__class__.__name__ + ': MemoryError Stopping ...')
-                break
+        try:
+            while self.is_running():
+                try:
+                    # Must be the first line
+                    starting_time = self.get_timer().get_time()
+                    if self.__allocation_profiler is not None:
+                        self.__allocation_profiler.begin_frame()
+
+                    # Do stuff that might take significant time here
+                    self._run_asyncio()
+                    self._dispatch_sources()
+                    if self.__tasks:
+                        self._run_tasks(starting_time + self.__task_slice / self.get_timer().get_fps())
+                    # End of the frame work, deliver what the signals policies have kept
+                    if self.__overload_detector is not None and self.__overload_detector.is_overloaded():
+                        self.get_event_bus().dispatch_pending(self.__overload_detector.get_shed_signals())
+                    else:
+                        self.get_event_bus().dispatch_pending()
+                    # The sleep of the frame is not measured
+                    if self.__allocation_profiler is not None:
+                        self.__allocation_profiler.end_frame()
+
+                    # sleep_for = 1.0 / randint(1, randint(2, 500))
+                    # sleep_for = 1.0 / randint(40, randint(41, 500))
+                    # sleep_for = 1.0 / randint(20, 75)
+                    # sleep_for = 1.0 / randint(50, 200)
+                    # sleep(sleep_for)
+
+                    # The budget usage is measured with the frame rate before the adjustment of the tick
+                    usage = (self.get_timer().get_time() - starting_time) * self.get_timer().get_fps()
+
+                    # Timer control
+                    on_time = self.get_timer().tick()
+                    if self.__overload_detector is not None:
+                        self._update_overload(not on_time, usage)
+                    if on_time:
+
+                        print('[ OK ]-> {1} fps, iteration take {0} sec'.format(
+                            self.get_timer().get_time() - starting_time,
+                            self.get_timer().get_fps()
+                            ))
+                    else:
+
+                        print('[    ]-> {1} fps, iteration take {0} sec'.format(
+                            self.get_timer().get_time() - starting_time,
+                            self.get_timer().get_fps()
+                            ))
+
+                except KeyboardInterrupt:
+                    Signal("QUIT", KeyboardInterrupt, self.quit)
+                    break
+                except MemoryError:
+                    self._set_is_running(False)
+                    logging.info(self.__class__.__name__ + ': MemoryError Stopping ...')
+                    break
+        finally:
+            # A exception of a callback must not leave the automatic garbage collections disabled
+            if self.get_idle_collector() is not None:
+                self.get_idle_collector().disable()
+            if self.get_allocation_profiler() is not None:
+                self.get_allocation_profiler().stop()
         logging.info('All operation is stop')
         raise quit('All operation is stop')
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from GLXBob.EventBus import PRIORITY_DEFAULT
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# Signals emitted on the EventBus of the MainLoop when the overload state change
+SIGNAL_OVERLOAD_ENTER = 'overload-enter'
+SIGNAL_OVERLOAD_EXIT = 'overload-exit'
+
+OVERLOAD_ENTER = 'enter'
+OVERLOAD_EXIT = 'exit'
+
+
+class OverloadDetector(object):
+    """
+    :Description:
+
+    The :class:`OverloadDetector <GLXBob.OverloadDetector.OverloadDetector>` object detect a sustained overload of
+    a :class:`MainLoop <GLXBob.MainLoop.MainLoop>`, a few late frames are not a overload.
+
+    A frame is overloaded when it miss it deadline or when it work use more than ``enter_usage`` of the frame
+    budget, it is healthy when it is on time and use less than ``exit_usage``. The loop enter the overload after
+    ``enter_frames`` consecutive overloaded frames, and exit it after ``exit_frames`` consecutive healthy frames:
+    the hysteresis keep the state stable when the load is near the limit.
+
+    The :class:`MainLoop <GLXBob.MainLoop.MainLoop>` emit ``overload-enter`` and ``overload-exit`` on it
+    :class:`EventBus <GLXBob.EventBus.EventBus>` with the detector as parameter. During the overload it shed the
+    work it is allowed to drop: the idle sources of a priority greater than ``shed_priority`` are skipped, and the
+    queued emissions of the ``shed_signals`` stay in they queue.
+
+    .. code-block:: python
+
+       mainloop.set_overload_detector(OverloadDetector(shed_priority=PRIORITY_DEFAULT, shed_signals=('preview',)))
+       mainloop.get_event_bus().connect('overload-enter', lambda detector: logging.warning('overload'))
+    """
+    def __init__(self, enter_frames=8, exit_frames=30, enter_usage=0.95, exit_usage=0.7,
+                 shed_priority=PRIORITY_DEFAULT, shed_signals=()):
+        """
+        :param enter_frames: number of consecutive overloaded frames it enter the overload
+        :param exit_frames: number of consecutive healthy frames it exit the overload
+        :param enter_usage: budget usage of a overloaded frame, 0.95 is 95 % of the frame
+        :param exit_usage: budget usage of a healthy frame
+        :param shed_priority: the idle sources of a greater priority are skipped, :py:obj:`None` for skip none
+        :param shed_signals: the signals they queued emissions are not delivered
+        :type enter_frames: int
+        :type exit_frames: int
+        :type enter_usage: float
+        :type exit_usage: float
+        :type shed_priority: int or None
+        :type shed_signals: iterable
+        :raise TypeError: if ``enter_frames`` or ``exit_frames`` parameter is not a :py:data:`int` type, or
+           ``enter_usage`` or ``exit_usage`` is not a :py:data:`float` type
+        :raise ValueError: if ``exit_usage`` is greater than ``enter_usage``
+        """
+        if type(enter_frames) != int:
+            raise TypeError(u'>enter_frames< parameter must be a int')
+        if type(exit_frames) != int:
+            raise TypeError(u'>exit_frames< parameter must be a int')
+        if type(enter_usage) != float:
+            raise TypeError(u'>enter_usage< parameter must be a float')
+        if type(exit_usage) != float:
+            raise TypeError(u'>exit_usage< parameter must be a float')
+        if exit_usage > enter_usage:
+            raise ValueError(u'>exit_usage< parameter must be lower or equal to >enter_usage<')
+        self.__enter_frames = max(enter_frames, 1)
+        self.__exit_frames = max(exit_frames, 1)
+        self.__enter_usage = enter_usage
+        self.__exit_usage = exit_usage
+        self.__shed_priority = shed_priority
+        self.__shed_signals = frozenset(shed_signals)
+        self.__overloaded = False
+        self.__overloaded_frames = 0
+        self.__healthy_frames = 0
+        self.__usage = 0.0
+        self.__overloads = 0
+        self.__overload_frames = 0
+        self.__shed = 0
+
+    def is_overloaded(self):
+        """
+        Get the overload state.
+
+        :return: :py:obj:`True` between the ``overload-enter`` and the ``overload-exit`` signals
+        :rtype: bool
+        """
+        return self.__overloaded
+
+    def get_usage(self):
+        """
+        Get the budget usage of the last frame.
+
+        :return: the work time divided by the frame budget
+        :rtype: float
+        """
+        return self.__usage
+
+    def get_shed_priority(self):
+        """
+        Get the priority over which the idle sources are skipped during the overload.
+
+        :return: the priority or :py:obj:`None`
+        :rtype: int or None
+        """
+        return self.__shed_priority
+
+    def get_shed_signals(self):
+        """
+        Get the signals they queued emissions are not delivered during the overload.
+
+        :return: the signal names
+        :rtype: frozenset
+        """
+        return self.__shed_signals
+
+    def update(self, late, usage):
+        """
+        Add the measure of a frame, the :class:`MainLoop <GLXBob.MainLoop.MainLoop>` call it at the end of each
+        frame.
+
+        :param late: :py:obj:`True` if the frame miss it deadline
+        :param usage: the work time of the frame divided by it budget
+        :type late: bool
+        :type usage: float
+        :return: ``'enter'`` or ``'exit'`` when the state change, else :py:obj:`None`
+        :rtype: str or None
+        """
+        self.__usage = usage
+        if self.__overloaded:
+            self.__overload_frames += 1
+        if late or usage >= self.__enter_usage:
+            self.__overloaded_frames += 1
+            self.__healthy_frames = 0
+        elif usage <= self.__exit_usage:
+            self.__healthy_frames += 1
+            self.__overloaded_frames = 0
+        else:
+            # Between the watermarks, the frame don't change the state
+            self.__overloaded_frames = 0
+            self.__healthy_frames = 0
+        if not self.__overloaded and self.__overloaded_frames >= self.__enter_frames:
+            self.__overloaded = True
+            self.__overloads += 1
+            self.__healthy_frames = 0
+            return OVERLOAD_ENTER
+        if self.__overloaded and self.__healthy_frames >= self.__exit_frames:
+            self.__overloaded = False
+            self.__overloaded_frames = 0
+            return OVERLOAD_EXIT
+        return None
+
+    def should_shed(self, priority):
+        """
+        Tell if a idle source is skipped.
+
+        :param priority: priority of the source
+        :type priority: int
+        :return: :py:obj:`True` if the loop is overloaded and the priority is greater than ``shed_priority``
+        :rtype: bool
+        """
+        if self.__overloaded and self.__shed_priority is not None and priority > self.__shed_priority:
+            self.__shed += 1
+            return True
+        return False
+
+    def get_stats(self):
+        """
+        Get the counters of the detector.
+
+        :return: ``overloads`` (entered overloads), ``overload_frames`` (frames in overload) and ``shed`` (skipped
+           idle sources calls) counters
+        :rtype: dict
+        """
+        return {
+            'overloads': self.__overloads,
+            'overload_frames': self.__overload_frames,
+            'shed': self.__shed
+        }
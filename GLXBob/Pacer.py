@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import selectors
+from time import monotonic, sleep
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# The selectors round a timeout up to the millisecond, the end of a wait is slept
+SELECT_RESOLUTION = 0.001
+
+
+class Pacer(object):
+    """
+    :Description:
+
+    The :class:`Pacer <GLXBob.Pacer.Pacer>` object wait the frames of a :class:`Timer <GLXBob.Timer.Timer>` on
+    absolute deadlines, and dispatch the I/O of the watched files while it wait.
+
+    The deadline of a frame is the deadline of the previous frame plus the frame interval, the scheduling latency
+    of a wakeup is not added to the next frames. A late frame restart the schedule from it time, the late frames
+    are not rushed for catch up.
+
+    On Linux with Python 3.13 or later the deadlines are armed on a ``timerfd`` (:py:func:`os.timerfd_create`,
+    ``CLOCK_MONOTONIC``, ``TFD_TIMER_ABSTIME``) registered in the selector of the watched files, the frame wakeup
+    and the I/O share one ``epoll_wait``. Elsewhere the selector wait until the deadline with a timeout, the last
+    millisecond is slept.
+
+    .. code-block:: python
+
+       pacer = Pacer()
+       pacer.register(sock, selectors.EVENT_READ, on_readable)
+       timer.set_pacer(pacer)
+    """
+    def __init__(self, use_timerfd=True):
+        """
+        :param use_timerfd: :py:obj:`False` for never use a timerfd
+        :type use_timerfd: bool
+        :raise TypeError: if ``use_timerfd`` parameter is not a :py:data:`bool` type
+        """
+        if type(use_timerfd) != bool:
+            raise TypeError(u'>use_timerfd< parameter must be a bool type')
+        self.__selector = selectors.DefaultSelector()
+        self.__deadline = None
+        self.__timerfd = None
+        self.__watches = 0
+        self.__wakeups = 0
+        self.__late = 0
+        if use_timerfd and hasattr(os, 'timerfd_create'):
+            self.__timerfd = os.timerfd_create(
+                getattr(os, 'CLOCK_MONOTONIC', 1),
+                flags=os.TFD_NONBLOCK | os.TFD_CLOEXEC
+            )
+            # The timerfd is the only key without callback
+            self.__selector.register(self.__timerfd, selectors.EVENT_READ, None)
+
+    @staticmethod
+    def get_time():
+        """
+        Get the time of the pacer clock, the deadlines use it.
+
+        :return: :py:func:`time.monotonic` seconds
+        :rtype: float
+        """
+        return monotonic()
+
+    def uses_timerfd(self):
+        """
+        Get the wait backend.
+
+        :return: :py:obj:`True` if the deadlines are armed on a timerfd
+        :rtype: bool
+        """
+        return self.__timerfd is not None
+
+    def register(self, fileobj, events, callback, *args):
+        """
+        Watch a file, the callback is called during the waits when it is ready. Like GLib, the watch is
+        automatically removed when the callback don't return :py:obj:`True`.
+
+        :param fileobj: a file object or a file descriptor
+        :param events: :py:data:`selectors.EVENT_READ` and / or :py:data:`selectors.EVENT_WRITE`
+        :param callback: a callable it receive ``fileobj``, the ready events, then ``args``
+        :param *args: additional parameters arg1, arg2
+        :type events: int
+        """
+        self.__selector.register(fileobj, events, (callback, args))
+        self.__watches += 1
+
+    def unregister(self, fileobj):
+        """
+        Stop to watch a file.
+
+        :param fileobj: a file object or a file descriptor
+        :return: :py:obj:`True` if the file was watched
+        :rtype: bool
+        """
+        try:
+            self.__selector.unregister(fileobj)
+        except (KeyError, ValueError):
+            return False
+        self.__watches -= 1
+        return True
+
+    def schedule(self, interval):
+        """
+        Set the deadline of the next frame: the previous deadline plus ``interval``.
+
+        :param interval: frame interval in seconds
+        :type interval: float
+        :return: seconds before the deadline, a negative value if the frame is late
+        :rtype: float
+        """
+        now = monotonic()
+        if self.__deadline is None:
+            self.__deadline = now
+        self.__deadline += interval
+        remaining = self.__deadline - now
+        if remaining <= 0:
+            # Late, the next frames are paced from now
+            self.__deadline = now
+            self.__late += 1
+        return remaining
+
+    def wait(self):
+        """
+        Wait the deadline set by :func:`Pacer.schedule() <GLXBob.Pacer.Pacer.schedule()>`, the ready watched files
+        are dispatched during the wait.
+
+        :return: number of dispatched I/O callbacks
+        :rtype: int
+        """
+        if self.__deadline is None:
+            return 0
+        if self.__timerfd is not None:
+            return self._wait_timerfd()
+        return self._wait_timeout()
+
+    def poll(self):
+        """
+        Dispatch the ready watched files without wait, a late frame have no time to wait but it I/O must not
+        starve.
+
+        :return: number of dispatched I/O callbacks
+        :rtype: int
+        """
+        if not self.__watches:
+            return 0
+        count = 0
+        self.__wakeups += 1
+        for key, events in self.__selector.select(0):
+            if key.data is None:
+                # A expiration of a previous deadline, it must not end the next wait
+                try:
+                    os.read(self.__timerfd, 8)
+                except BlockingIOError:
+                    pass
+                continue
+            self._dispatch(key, events)
+            count += 1
+        return count
+
+    def reset(self):
+        """
+        Forget the deadline, the next :func:`Pacer.schedule() <GLXBob.Pacer.Pacer.schedule()>` start a new
+        schedule from it time.
+        """
+        self.__deadline = None
+
+    def get_stats(self):
+        """
+        Get the counters of the pacer.
+
+        :return: ``wakeups`` (selector waits), ``late`` (late frames) and ``watches`` (watched files) counters
+        :rtype: dict
+        """
+        return {
+            'wakeups': self.__wakeups,
+            'late': self.__late,
+            'watches': self.__watches
+        }
+
+    def close(self):
+        """
+        Close the selector and the timerfd, the watched files are not closed.
+        """
+        self.__selector.close()
+        if self.__timerfd is not None:
+            os.close(self.__timerfd)
+            self.__timerfd = None
+        self.__watches = 0
+
+    # Internal Method's
+    def _wait_timerfd(self):
+        os.timerfd_settime(self.__timerfd, flags=os.TFD_TIMER_ABSTIME, initial=self.__deadline)
+        count = 0
+        expired = False
+        while not expired:
+            self.__wakeups += 1
+            for key, events in self.__selector.select():
+                if key.data is None:
+                    try:
+                        os.read(self.__timerfd, 8)
+                    except BlockingIOError:
+                        continue
+                    expired = True
+                else:
+                    self._dispatch(key, events)
+                    count += 1
+        return count
+
+    def _wait_timeout(self):
+        count = 0
+        while True:
+            remaining = self.__deadline - monotonic()
+            if remaining <= 0:
+                return count
+            if not self.__watches or remaining <= SELECT_RESOLUTION:
+                sleep(remaining)
+                return count
+            self.__wakeups += 1
+            for key, events in self.__selector.select(remaining - SELECT_RESOLUTION):
+                self._dispatch(key, events)
+                count += 1
+
+    def _dispatch(self, key, events):
+        callback, args = key.data
+        if callback(key.fileobj, events, *args) is not True:
+            self.unregister(key.fileobj)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pickle
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+
+class ProcessExecutor(object):
+    """
+    :Description:
+
+    The :class:`ProcessExecutor <GLXBob.ProcessExecutor.ProcessExecutor>` object run the handlers connected with
+    ``executor='process'`` by :func:`EventBus.connect() <GLXBob.EventBus.EventBus.connect()>` in a persistent
+    pool of worker processes, they use every cores.
+
+    The handler and the emitted parameters are serialized with the :py:mod:`pickle` protocol 5. The buffers of
+    ``threshold`` bytes or more (``bytes``, ``bytearray``, ``memoryview`` parameters and the objects they support
+    out-of-band buffers, like the numpy arrays) are not written in the pickle stream, they are copied once in a
+    :py:mod:`multiprocessing.shared_memory` block mapped by the worker. A large ``bytes`` like parameter is
+    received by the handler as a :py:class:`memoryview` of the shared block, it is valid only during the handler
+    call.
+
+    The handler must be picklable: a module level function, or a method of a picklable object.
+
+    The workers inherit the CPU affinity and the scheduling class of the process it start them, a
+    :class:`SchedulingPolicy <GLXBob.SchedulingPolicy.SchedulingPolicy>` give them they own, for example the CPUs
+    the :class:`MainLoop <GLXBob.MainLoop.MainLoop>` is not pinned on.
+    """
+    def __init__(self, max_workers=None, threshold=65536, scheduling_policy=None):
+        """
+        :param max_workers: number of worker processes, :py:obj:`None` for the number of processors
+        :param threshold: minimal size in bytes of a buffer passed by shared memory
+        :param scheduling_policy: settings applied by each worker when it start, :py:obj:`None` for inherit them
+        :type max_workers: int or None
+        :type threshold: int
+        :type scheduling_policy: GLXBob.SchedulingPolicy or None
+        :raise TypeError: if ``max_workers`` parameter is not a :py:data:`int` or :py:obj:`None`, or ``threshold``
+           is not a :py:data:`int`
+        """
+        if type(max_workers) != int and max_workers is not None:
+            raise TypeError(u'>max_workers< parameter must be a int or None')
+        if type(threshold) != int:
+            raise TypeError(u'>threshold< parameter must be a int')
+        self.__max_workers = max_workers
+        self.__threshold = max(threshold, 1)
+        self.__scheduling_policy = scheduling_policy
+        self.__pool = None
+        self.__lock = threading.Lock()
+
+    def get_max_workers(self):
+        """
+        Get the number of worker processes.
+
+        :return: number of worker processes or :py:obj:`None` for the number of processors
+        :rtype: int or None
+        """
+        return self.__max_workers
+
+    def get_threshold(self):
+        """
+        Get the minimal size in bytes of a buffer passed by shared memory.
+
+        :return: size in bytes
+        :rtype: int
+        """
+        return self.__threshold
+
+    def get_scheduling_policy(self):
+        """
+        Get the settings applied by each worker when it start.
+
+        :return: the settings or :py:obj:`None`
+        :rtype: GLXBob.SchedulingPolicy or None
+        """
+        return self.__scheduling_policy
+
+    def submit(self, handler, args):
+        """
+        Run a handler in a worker process, the pool is started on the first call.
+
+        :param handler: a picklable function or method
+        :param args: parameters of the handler
+        :type args: tuple
+        :return: the future of the handler return value
+        :rtype: concurrent.futures.Future
+        """
+        blocks = list()
+
+        def buffer_callback(buffer):
+            # Return True for keep a buffer in the pickle stream
+            try:
+                raw = buffer.raw()
+            except BufferError:
+                return True
+            if raw.nbytes < self.__threshold:
+                return True
+            block = SharedMemory(create=True, size=raw.nbytes)
+            block.buf[:raw.nbytes] = raw
+            blocks.append((block, raw.nbytes, raw.readonly))
+            return False
+
+        payload = pickle.dumps((handler, tuple(self._wrap(arg) for arg in args)), 5, buffer_callback=buffer_callback)
+        segments = [(block.name, size, readonly) for block, size, readonly in blocks]
+        try:
+            future = self._get_pool().submit(_invoke, payload, segments)
+        except BaseException:
+            _release(blocks)
+            raise
+        if blocks:
+            future.add_done_callback(lambda _: _release(blocks))
+        return future
+
+    def shutdown(self, wait=True):
+        """
+        Stop the worker processes, a next :func:`ProcessExecutor.submit()
+        <GLXBob.ProcessExecutor.ProcessExecutor.submit()>` start a new pool.
+
+        :param wait: :py:obj:`True` for wait the running handlers
+        :type wait: bool
+        """
+        with self.__lock:
+            pool = self.__pool
+            self.__pool = None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    # Internal Method's
+    def _wrap(self, arg):
+        # bytes are always pickled in-band, a PickleBuffer let them go out-of-band
+        if isinstance(arg, (bytes, bytearray, memoryview)) and memoryview(arg).nbytes >= self.__threshold:
+            return pickle.PickleBuffer(arg)
+        return arg
+
+    def _get_pool(self):
+        with self.__lock:
+            if self.__pool is None:
+                initializer = None
+                if self.__scheduling_policy is not None:
+                    initializer = self.__scheduling_policy.apply
+                self.__pool = ProcessPoolExecutor(max_workers=self.__max_workers, initializer=initializer)
+            return self.__pool
+
+
+def _release(blocks):
+    for block, _, _ in blocks:
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _invoke(payload, segments):
+    # Run in the worker process
+    blocks = list()
+    views = list()
+    buffers = list()
+    try:
+        for name, size, readonly in segments:
+            block = SharedMemory(name=name)
+            blocks.append(block)
+            view = block.buf[:size]
+            views.append(view)
+            if readonly:
+                view = view.toreadonly()
+                views.append(view)
+            buffers.append(view)
+        handler, args = pickle.loads(payload, buffers=buffers)
+        return handler(*args)
+    finally:
+        handler = args = buffers = None
+        try:
+            for view in reversed(views):
+                view.release()
+            for block in blocks:
+                block.close()
+        except BufferError:
+            # The handler keep a reference to a buffer, the mapping is closed by the garbage collector
+            logging.warning('ProcessExecutor: a handler keep a shared memory buffer after it return')
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import logging
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# Scheduling classes and they os module constants
+SCHED_OTHER = 'other'
+SCHED_BATCH = 'batch'
+SCHED_IDLE = 'idle'
+SCHED_FIFO = 'fifo'
+SCHED_RR = 'rr'
+
+SCHED_POLICIES = {
+    SCHED_OTHER: 'SCHED_OTHER',
+    SCHED_BATCH: 'SCHED_BATCH',
+    SCHED_IDLE: 'SCHED_IDLE',
+    SCHED_FIFO: 'SCHED_FIFO',
+    SCHED_RR: 'SCHED_RR',
+}
+
+# The real-time classes have a static priority, the others must use 0
+_REALTIME = (SCHED_FIFO, SCHED_RR)
+
+
+class SchedulingPolicy(object):
+    """
+    :Description:
+
+    The :class:`SchedulingPolicy <GLXBob.SchedulingPolicy.SchedulingPolicy>` object pin a thread on a CPU set and
+    set it scheduling class and niceness, like ``taskset`` and ``chrt`` do. A
+    :class:`MainLoop <GLXBob.MainLoop.MainLoop>` apply it to it thread when it run, a
+    :class:`ProcessExecutor <GLXBob.ProcessExecutor.ProcessExecutor>` apply it to it worker processes when they
+    start.
+
+    Scheduling classes:
+       * **other**: the default time sharing class
+       * **batch**: time sharing for the CPU bound work, it is never preferred on wakeup
+       * **idle**: run only when the CPU have nothing else to run
+       * **fifo** and **rr**: real-time classes, they require the ``CAP_SYS_NICE`` capability or a ``RLIMIT_RTPRIO``
+
+    A setting the platform or the permissions refuse is logged and skipped, the others are still applied: a
+    real-time class fall back to the current class.
+
+    .. code-block:: python
+
+       mainloop.set_scheduling_policy(SchedulingPolicy(cpus=(2, 3), policy=SCHED_FIFO, priority=10))
+    """
+    def __init__(self, cpus=None, nice=None, policy=None, priority=None):
+        """
+        :param cpus: the CPU numbers the thread can run on, :py:obj:`None` for keep the affinity
+        :param nice: the niceness, -20 to 19, :py:obj:`None` for keep it
+        :param policy: ``other``, ``batch``, ``idle``, ``fifo``, ``rr`` or :py:obj:`None` for keep the class
+        :param priority: static priority of a real-time class, :py:obj:`None` for the minimal one
+        :type cpus: iterable or None
+        :type nice: int or None
+        :type policy: str or None
+        :type priority: int or None
+        :raise TypeError: if ``nice`` or ``priority`` parameter is not a :py:data:`int` or :py:obj:`None`
+        :raise ValueError: if ``cpus`` is empty or ``policy`` is not a scheduling class
+        """
+        if cpus is not None:
+            cpus = tuple(sorted(set(cpus)))
+            if not cpus:
+                raise ValueError(u'>cpus< parameter must contain a CPU')
+        if type(nice) != int and nice is not None:
+            raise TypeError(u'>nice< parameter must be a int or None')
+        if policy is not None and policy not in SCHED_POLICIES:
+            raise ValueError(u'>policy< parameter must be one of ' + ', '.join(SCHED_POLICIES))
+        if type(priority) != int and priority is not None:
+            raise TypeError(u'>priority< parameter must be a int or None')
+        self.__cpus = cpus
+        self.__nice = nice
+        self.__policy = policy
+        self.__priority = priority
+
+    def get_cpus(self):
+        """
+        Get the CPU numbers the thread can run on.
+
+        :return: sorted CPU numbers or :py:obj:`None`
+        :rtype: tuple or None
+        """
+        return self.__cpus
+
+    def get_nice(self):
+        """
+        Get the niceness.
+
+        :return: the niceness or :py:obj:`None`
+        :rtype: int or None
+        """
+        return self.__nice
+
+    def get_policy(self):
+        """
+        Get the scheduling class.
+
+        :return: ``other``, ``batch``, ``idle``, ``fifo``, ``rr`` or :py:obj:`None`
+        :rtype: str or None
+        """
+        return self.__policy
+
+    def get_priority(self):
+        """
+        Get the static priority of a real-time class.
+
+        :return: the priority or :py:obj:`None`
+        :rtype: int or None
+        """
+        return self.__priority
+
+    def apply(self, pid=0):
+        """
+        Apply the settings. On Linux ``pid`` 0 is the calling thread, the threads it start later inherit the
+        settings.
+
+        :param pid: a process or thread identifier, 0 for the calling thread
+        :type pid: int
+        :return: the applied settings: ``cpus``, ``policy`` and ``nice`` entries, :py:obj:`None` for a setting
+           not requested or refused
+        :rtype: dict
+        """
+        applied = {'cpus': None, 'policy': None, 'nice': None}
+        if self.__cpus is not None:
+            if self._call('sched_setaffinity', pid, self.__cpus):
+                applied['cpus'] = self.__cpus
+        if self.__policy is not None:
+            constant = getattr(os, SCHED_POLICIES[self.__policy], None)
+            if constant is None:
+                logging.warning('%s: %s is not supported by the platform', self.__class__.__name__, self.__policy)
+            else:
+                priority = 0
+                if self.__policy in _REALTIME:
+                    priority = self.__priority
+                    if priority is None:
+                        priority = os.sched_get_priority_min(constant)
+                if self._call('sched_setscheduler', pid, constant, os.sched_param(priority)):
+                    applied['policy'] = self.__policy
+        if self.__nice is not None:
+            if self._call('setpriority', getattr(os, 'PRIO_PROCESS', 0), pid, self.__nice):
+                applied['nice'] = self.__nice
+        return applied
+
+    # Internal Method's
+    def _call(self, name, *args):
+        # A refused setting must not stop the program, it run with the default scheduling
+        function = getattr(os, name, None)
+        if function is None:
+            logging.warning('%s: os.%s() is not supported by the platform', self.__class__.__name__, name)
+            return False
+        try:
+            function(*args)
+        except (OSError, ValueError) as error:
+            logging.warning('%s: os.%s%r refused: %s', self.__class__.__name__, name, args, error)
+            return False
+        return True
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left
+from time import perf_counter, sleep
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# Sleep durations in seconds measured by a calibration
+CALIBRATION_DURATIONS = (0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05)
+
+
+class SleepCalibrator(object):
+    """
+    :Description:
+
+    The :class:`SleepCalibrator <GLXBob.SleepCalibrator.SleepCalibrator>` object compensate the overshoot of
+    :py:func:`time.sleep`: the kernel timer slack and the scheduling latency make each sleep longer than asked, a
+    :class:`Timer <GLXBob.Timer.Timer>` it sleep exactly the rest of it frames stop to correct that error with it
+    frame rate.
+
+    The calibration measure the overshoot of a range of durations, the median of each duration is the model. A sleep
+    subtract the overshoot of the model, linearly interpolated between the calibrated durations, then the measured
+    overshoot update the model with a exponential moving average: the model follow the host load without a new
+    calibration.
+
+    .. code-block:: python
+
+       timer.set_sleep_calibrator(SleepCalibrator())
+       # Calibrated by MainLoop.run(), or on demand
+       timer.get_sleep_calibrator().calibrate()
+    """
+    def __init__(self, durations=CALIBRATION_DURATIONS, samples=5, smoothing=0.0625, clock=perf_counter,
+                 sleep_function=sleep):
+        """
+        :param durations: the calibrated sleep durations in seconds
+        :param samples: number of sleeps measured by duration
+        :param smoothing: weight of a live measure in the model, 0 for never update it
+        :param clock: the time source of the measures
+        :param sleep_function: the calibrated sleep
+        :type durations: tuple
+        :type samples: int
+        :type smoothing: float
+        :type clock: callable
+        :type sleep_function: callable
+        :raise TypeError: if ``samples`` parameter is not a :py:data:`int` or ``smoothing`` is not a
+           :py:data:`float` type
+        :raise ValueError: if ``durations`` is empty
+        """
+        if type(samples) != int:
+            raise TypeError(u'>samples< parameter must be a int')
+        if type(smoothing) != float:
+            raise TypeError(u'>smoothing< parameter must be a float')
+        durations = tuple(sorted(set(durations)))
+        if not durations:
+            raise ValueError(u'>durations< parameter must contain a duration')
+        self.__durations = durations
+        self.__samples = max(samples, 1)
+        self.__smoothing = min(max(smoothing, 0.0), 1.0)
+        self.__clock = clock
+        self.__sleep = sleep_function
+        # Expected overshoot of each duration, None before the calibration
+        self.__overshoots = None
+        self.__distribution = dict()
+        self.__sleeps = 0
+
+    def is_calibrated(self):
+        """
+        Get the state of the model.
+
+        :return: :py:obj:`True` if the model is calibrated or set
+        :rtype: bool
+        """
+        return self.__overshoots is not None
+
+    def calibrate(self):
+        """
+        Measure the overshoot of the durations on the current host, it block for about ``samples`` times the sum
+        of the durations.
+
+        :return: the ``(duration, overshoot)`` tuples of the model
+        :rtype: list
+        """
+        overshoots = list()
+        distribution = dict()
+        for duration in self.__durations:
+            measures = list()
+            for _ in range(self.__samples):
+                starting_time = self.__clock()
+                self.__sleep(duration)
+                measures.append(max(self.__clock() - starting_time - duration, 0.0))
+            measures.sort()
+            overshoots.append(measures[len(measures) // 2])
+            distribution[duration] = {'min': measures[0], 'median': measures[len(measures) // 2], 'max': measures[-1]}
+        self.__overshoots = overshoots
+        self.__distribution = distribution
+        return self.get_model()
+
+    def get_model(self):
+        """
+        Get the expected overshoot of each calibrated duration.
+
+        :return: ``(duration, overshoot)`` tuples in seconds, empty before the calibration
+        :rtype: list
+        """
+        if self.__overshoots is None:
+            return list()
+        return list(zip(self.__durations, self.__overshoots))
+
+    def set_model(self, model):
+        """
+        Set the expected overshoots, like a calibration, for example the model of a previous run.
+
+        :param model: ``(duration, overshoot)`` pairs in seconds
+        :type model: list
+        :raise ValueError: if ``model`` is empty
+        """
+        model = sorted((float(duration), float(overshoot)) for duration, overshoot in model)
+        if not model:
+            raise ValueError(u'>model< parameter must contain a duration')
+        self.__durations = tuple(duration for duration, _ in model)
+        self.__overshoots = [overshoot for _, overshoot in model]
+        self.__distribution = dict()
+
+    def get_distribution(self):
+        """
+        Get the overshoots measured by the last calibration.
+
+        :return: ``min``, ``median`` and ``max`` seconds by duration
+        :rtype: dict
+        """
+        return dict(self.__distribution)
+
+    def get_overshoot(self, duration):
+        """
+        Get the expected overshoot of a sleep.
+
+        :param duration: sleep duration in seconds
+        :type duration: float
+        :return: the overshoot in seconds, 0 before the calibration
+        :rtype: float
+        """
+        if self.__overshoots is None:
+            return 0.0
+        durations = self.__durations
+        index = bisect_left(durations, duration)
+        if index == 0:
+            return self.__overshoots[0]
+        if index == len(durations):
+            return self.__overshoots[-1]
+        ratio = (duration - durations[index - 1]) / (durations[index] - durations[index - 1])
+        return self.__overshoots[index - 1] + ratio * (self.__overshoots[index] - self.__overshoots[index - 1])
+
+    def sleep(self, duration):
+        """
+        Sleep ``duration`` seconds minus the expected overshoot, then update the model with the measured overshoot.
+
+        :param duration: sleep duration in seconds
+        :type duration: float
+        :return: the measured error in seconds, positive when the sleep was too long
+        :rtype: float
+        """
+        if duration <= 0:
+            return 0.0
+        compensated = duration - self.get_overshoot(duration)
+        if compensated <= 0:
+            # The overshoot of the shortest sleep is longer than the wait
+            return 0.0
+        starting_time = self.__clock()
+        self.__sleep(compensated)
+        elapsed = self.__clock() - starting_time
+        self.__sleeps += 1
+        if self.__overshoots is not None and self.__smoothing:
+            self._observe(compensated, max(elapsed - compensated, 0.0))
+        return elapsed - duration
+
+    def get_sleeps(self):
+        """
+        Get the number of compensated sleeps.
+
+        :return: number of sleeps
+        :rtype: int
+        """
+        return self.__sleeps
+
+    # Internal Method's
+    def _observe(self, duration, overshoot):
+        # The measure update the nearest calibrated duration
+        durations = self.__durations
+        index = bisect_left(durations, duration)
+        if index == len(durations) or (index and duration - durations[index - 1] < durations[index] - duration):
+            index -= 1
+        self.__overshoots[index] += (overshoot - self.__overshoots[index]) * self.__smoothing
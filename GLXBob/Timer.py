@@ -2,12 +2,23 @@
 # -*- coding: utf-8 -*-
 
 from time import time, sleep
+import os
+import stat
 import logging
 
 # It script it publish under GNU GENERAL PUBLIC LICENSE
 # http://www.gnu.org/licenses/gpl-3.0.en.html
 # Author: Tuuux <tuxa at rtnp dot org> all rights reserved
 
+# Adjustment of the frame rate analysis of a frame, recorded by the FrameTrace writers
+EVENT_NONE = 0
+EVENT_GOAL = 1
+EVENT_UP = 2
+EVENT_DOWN = 3
+
+# Version of the file written by Timer.export_state()
+STATE_VERSION = 1
+
 
 # Reference Document: http://code.activestate.com/recipes/579053-high-precision-fps/
 class Timer(object):
@@ -22,6 +33,25 @@ class Timer(object):
     The power saving happen that because the loop try to use the minimum
     The :class:`Timer <GLXBob.Timer.Timer>` object update value itself and can be requested, via internal method's.
     """
+    __slots__ = (
+        '__fps',
+        '__fps_increment',
+        '__fps_min',
+        '__fps_min_increment',
+        '__fps_max',
+        '__fps_max_increment',
+        '__fps_memory',
+        '__frame',
+        '__frame_max',
+        '__time_departure',
+        '__be_fast',
+        '__be_fast_multiplicator',
+        '__pacer',
+        '__idle_handler',
+        '__frame_trace',
+        '__sleep_calibrator'
+    )
+
     def __init__(self,
                  fps=60.0,
                  fps_max=float("inf"),
@@ -160,6 +190,10 @@ class Timer(object):
         self.__time_departure = None
         self.__be_fast = False
         self.__be_fast_multiplicator = 10
+        self.__pacer = None
+        self.__idle_handler = None
+        self.__frame_trace = None
+        self.__sleep_calibrator = None
 
     def tick(self):
         """
@@ -185,15 +219,23 @@ class Timer(object):
 
         # Increase Frame
         self._set_frame(self._get_frame() + 1)
+        event = EVENT_NONE
 
         # The algho
-        try:
-            target = self._get_frame() / self.get_fps()
-        except ZeroDivisionError:
-            target = self._get_frame()
+        if self.get_pacer() is not None:
+            # The pacer keep absolute deadlines, a frame is due one interval after the previous deadline
+            try:
+                differ = self.get_pacer().schedule(1.0 / self.get_fps())
+            except ZeroDivisionError:
+                differ = self.get_pacer().schedule(1.0)
+        else:
+            try:
+                target = self._get_frame() / self.get_fps()
+            except ZeroDivisionError:
+                target = self._get_frame()
 
-        passed = self.get_time() - self._get_time_departure()
-        differ = target - passed
+            passed = self.get_time() - self._get_time_departure()
+            differ = target - passed
 
         # Reset time reference due to time variation
         # Should never be remove or for a true system if compensate time variation
@@ -202,14 +244,15 @@ class Timer(object):
             self._set_frame(0)
 
             # Determine a increment factor for fast convergence
-            half_sum = sum(self._get_fps_memory()[:len(self._get_fps_memory()) / 2])
-            rest_sum = sum(self._get_fps_memory()[len(self._get_fps_memory()) / 2:])
+            half_sum = sum(self._get_fps_memory()[:len(self._get_fps_memory()) // 2])
+            rest_sum = sum(self._get_fps_memory()[len(self._get_fps_memory()) // 2:])
 
             # It's time to analyze the result
             # First Check if that egal
             if int(half_sum) == int(rest_sum):
                 self._set_be_fast_multiplicator(0)
                 self._set_be_fast(False)
+                event = EVENT_GOAL
                 logging.info("{0}:[GOAL]-> Increment {1} fps, {2} fps".format(
                     self.__class__.__name__,
                     self.get_fps_increment(),
@@ -222,6 +265,7 @@ class Timer(object):
             else:
                 # Check if we have to down fps
                 if half_sum < rest_sum:
+                    event = EVENT_DOWN
                     if self._get_be_fast():
                         self._set_be_fast_multiplicator(self._get_be_fast_multiplicator() - 10)
                         print("[DOWN]-> Increment {0} fps, {1} fps".format(
@@ -238,6 +282,7 @@ class Timer(object):
 
                 elif half_sum > rest_sum:
                     # Everything is fine , yes we can
+                    event = EVENT_UP
                     if self._get_be_fast():
                         self._set_be_fast_multiplicator(self._get_be_fast_multiplicator() + 10)
                         print("[ UP ]-> Increment {0} fps, {1} fps".format(
@@ -256,12 +301,18 @@ class Timer(object):
         self._push_fps_memory(self.get_fps())
 
         # Now we know how many time differ from the ideal Frame Rate
+        fps = self.get_fps()
         if differ <= 0:
             # raise ValueError('cannot maintain desired FPS rate')
             if self._get_be_fast():
                 self.set_fps(self.get_fps() - (self.get_fps_max_increment() * self._get_be_fast_multiplicator() / 100))
             else:
                 self.set_fps(self.get_fps() - self.get_fps_increment())
+            if self.__frame_trace is not None:
+                self.__frame_trace.write(self.get_time(), differ, self.get_fps(), self.get_fps() - fps, event, True)
+            # No time to wait, but the watched files are dispatched
+            if self.get_pacer() is not None:
+                self.get_pacer().poll()
             # Return False that because we haven't respect the ideal frame rate
             return False
         else:
@@ -269,9 +320,22 @@ class Timer(object):
                 self.set_fps(self.get_fps() + (self.get_fps_max_increment() * self._get_be_fast_multiplicator() / 100))
             else:
                 self.set_fps(self.get_fps() + self.get_fps_increment())
+            if self.__frame_trace is not None:
+                self.__frame_trace.write(self.get_time(), differ, self.get_fps(), self.get_fps() - fps, event, False)
 
             # Everything is fine , we have spare time then we can sleep for the rest of the frame time
-            sleep(differ)
+            if self.get_idle_handler() is not None:
+                # The idle work is taken on the sleep
+                starting_time = self.get_time()
+                self.get_idle_handler()(differ)
+                differ -= self.get_time() - starting_time
+            if self.get_pacer() is not None:
+                self.get_pacer().wait()
+            elif differ > 0:
+                if self.__sleep_calibrator is not None:
+                    self.__sleep_calibrator.sleep(differ)
+                else:
+                    sleep(differ)
             # Return True that because we have respect the ideal frame rate
             return True
 
@@ -289,6 +353,210 @@ class Timer(object):
         """
         return time()
 
+    def set_pacer(self, pacer=None):
+        """
+        Set the object it wait the frames on absolute deadlines, and dispatch the watched files I/O during the wait.
+
+        Without pacer the :class:`Timer <GLXBob.Timer.Timer>` sleep the rest of each frame.
+
+        :param pacer: the pacer or :py:obj:`None` for sleep
+        :type pacer: GLXBob.Pacer or None
+        """
+        if self.get_pacer() is not None:
+            self.get_pacer().reset()
+        self.__pacer = pacer
+
+    def get_pacer(self):
+        """
+        Get the object it wait the frames.
+
+        :return: the pacer or :py:obj:`None`
+        :rtype: GLXBob.Pacer or None
+        """
+        return self.__pacer
+
+    def set_idle_handler(self, idle_handler=None):
+        """
+        Set a callable it use the spare time of the frames, it is called before the sleep with the spare time in
+        seconds, then the rest of the spare time is slept.
+
+        :param idle_handler: a callable or :py:obj:`None`
+        :type idle_handler: callable or None
+        """
+        self.__idle_handler = idle_handler
+
+    def get_idle_handler(self):
+        """
+        Get the callable it use the spare time of the frames.
+
+        :return: a callable or :py:obj:`None`
+        :rtype: callable or None
+        """
+        return self.__idle_handler
+
+    def set_frame_trace(self, frame_trace=None):
+        """
+        Set the object it record each frame to a binary trace, for a offline analyse with
+        ``python -m GLXBob.analyze``.
+
+        :param frame_trace: the writer or :py:obj:`None` for don't record the frames
+        :type frame_trace: GLXBob.FrameTraceWriter or None
+        """
+        self.__frame_trace = frame_trace
+
+    def get_frame_trace(self):
+        """
+        Get the object it record each frame to a binary trace.
+
+        :return: the writer or :py:obj:`None`
+        :rtype: GLXBob.FrameTraceWriter or None
+        """
+        return self.__frame_trace
+
+    def set_sleep_calibrator(self, sleep_calibrator=None):
+        """
+        Set the object it subtract the expected overshoot of the host from the sleep of each frame. It is not used
+        when the :class:`Timer <GLXBob.Timer.Timer>` have a :class:`Pacer <GLXBob.Pacer.Pacer>`, the pacer wait
+        absolute deadlines.
+
+        :param sleep_calibrator: the calibrator or :py:obj:`None` for sleep the exact rest of the frames
+        :type sleep_calibrator: GLXBob.SleepCalibrator or None
+        """
+        self.__sleep_calibrator = sleep_calibrator
+
+    def get_sleep_calibrator(self):
+        """
+        Get the object it compensate the overshoot of the sleep of each frame.
+
+        :return: the calibrator or :py:obj:`None`
+        :rtype: GLXBob.SleepCalibrator or None
+        """
+        return self.__sleep_calibrator
+
+    def get_state(self):
+        """
+        Get the state learned by the self-correcting timing algorithms: the frame rate, the convergence increment
+        and multiplier, the frame rate memory and the model of the sleep calibrator.
+
+        :return: a state it can be serialized as JSON
+        :rtype: dict
+        """
+        return {
+            'fps': self.get_fps(),
+            'fps_increment': self.get_fps_increment(),
+            'be_fast': self._get_be_fast(),
+            'be_fast_multiplicator': self._get_be_fast_multiplicator(),
+            'fps_memory': list(self._get_fps_memory() or list()),
+            'sleep_model': [list(pair) for pair in self.__sleep_calibrator.get_model()]
+            if self.__sleep_calibrator is not None else list(),
+            'time': self.get_time()
+        }
+
+    def set_state(self, state):
+        """
+        Restore a state returned by :func:`Timer.get_state() <GLXBob.Timer.Timer.get_state()>`, the frame rate is
+        clamped to the limits of the :class:`Timer <GLXBob.Timer.Timer>`. The sleep model is set only when the
+        :class:`Timer <GLXBob.Timer.Timer>` have a sleep calibrator, then it is not calibrated again.
+
+        :param state: the state
+        :type state: dict
+        :raise TypeError: if ``state`` parameter is not a :py:data:`dict` type
+        :raise ValueError: if a entry of the state have a wrong type
+        """
+        if type(state) != dict:
+            raise TypeError(u'>state< parameter must be a dict')
+        try:
+            fps = float(state['fps'])
+            fps_increment = float(state.get('fps_increment', self.get_fps_increment()))
+            be_fast = bool(state.get('be_fast', False))
+            be_fast_multiplicator = int(state.get('be_fast_multiplicator', 0))
+            fps_memory = [float(value) for value in state.get('fps_memory', ())][:self._get_frame_max()]
+            sleep_model = [(float(duration), float(overshoot)) for duration, overshoot in state.get('sleep_model', ())]
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(u'>state< parameter is not a Timer state: {0}'.format(error))
+        self.set_fps(fps)
+        self.set_fps_increment(min(max(fps_increment, self.get_fps_min_increment()), self.get_fps_max_increment()))
+        self._set_be_fast(be_fast)
+        self._set_be_fast_multiplicator(be_fast_multiplicator)
+        self._set_fps_memory(fps_memory)
+        # The frames are counted again from the restored rate
+        self._set_frame(0)
+        self._set_time_departure(None)
+        if self.__sleep_calibrator is not None and sleep_model:
+            self.__sleep_calibrator.set_model(sleep_model)
+
+    def export_state(self, path, workload='default'):
+        """
+        Save the learned state in a small JSON file, under a workload name. The other workloads of the file are
+        kept, the file is replaced atomically: a worker it crash never leave a truncated file. The read, the merge
+        and the replace hold a lock on the ``path + '.lock'`` file, the concurrent workers never lose a workload.
+        The file keep it permissions, a new file is created with the ``0644`` mode.
+
+        :param path: file system path of the state file
+        :param workload: name of the workload, a process restarted with the same name start at the same rate
+        :type path: str
+        :type workload: str
+        :raise TypeError: if ``workload`` parameter is not a :py:data:`str` type
+        """
+        if type(workload) != str:
+            raise TypeError(u'>workload< parameter must be a str')
+        # Imported on demand, tempfile import random
+        import json
+        import fcntl
+        import tempfile
+        lock = os.open(path + '.lock', os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            workloads = _read_states(path)
+            workloads[workload] = self.get_state()
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o644
+            directory = os.path.dirname(os.path.abspath(path))
+            descriptor, temporary_path = tempfile.mkstemp(prefix='.timer-state-', dir=directory)
+            try:
+                # mkstemp() create the file with the 0600 mode
+                os.chmod(temporary_path, mode)
+                with os.fdopen(descriptor, 'w') as destination:
+                    json.dump({'version': STATE_VERSION, 'workloads': workloads}, destination, indent=1,
+                              sort_keys=True)
+                os.replace(temporary_path, path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+        finally:
+            # Closing the file release the lock
+            os.close(lock)
+
+    def import_state(self, path, workload='default'):
+        """
+        Restore the state of a workload saved by :func:`Timer.export_state() <GLXBob.Timer.Timer.export_state()>`.
+        A missing or unreadable file is not a error, the :class:`Timer <GLXBob.Timer.Timer>` learn from it current
+        state.
+
+        :param path: file system path of the state file
+        :param workload: name of the workload
+        :type path: str
+        :type workload: str
+        :return: :py:obj:`True` if the state is restored
+        :rtype: bool
+        :raise TypeError: if ``workload`` parameter is not a :py:data:`str` type
+        """
+        if type(workload) != str:
+            raise TypeError(u'>workload< parameter must be a str')
+        state = _read_states(path).get(workload)
+        if state is None:
+            return False
+        try:
+            self.set_state(state)
+        except (TypeError, ValueError) as error:
+            logging.warning('{0}: ignore the state of {1} in {2}: {3}'.format(
+                self.__class__.__name__, workload, path, error
+            ))
+            return False
+        return True
+
     def set_fps(self, fps=25.00):
         """
         Set the :class:`Timer <GLXBob.Timer.Timer>` :py:data:`fps` property.
@@ -639,3 +907,20 @@ class Timer(object):
         :rtype: int
         """
         return self.__be_fast_multiplicator
+
+
+def _read_states(path):
+    # The states of the workloads, empty when the file is missing or unreadable
+    import json
+    try:
+        with open(path, 'r') as source:
+            content = json.load(source)
+    except FileNotFoundError:
+        return dict()
+    except (OSError, ValueError) as error:
+        logging.warning('Timer: ignore the state file {0}: {1}'.format(path, error))
+        return dict()
+    if type(content) != dict or content.get('version') != STATE_VERSION or type(content.get('workloads')) != dict:
+        logging.warning('Timer: ignore the state file {0}: unsupported version'.format(path))
+        return dict()
+    return content['workloads']
@@ -5,9 +5,74 @@
 # http://www.gnu.org/licenses/gpl-3.0.en.html
 # Author: Jérôme ORNECH alias "Tuux" <tuxa@rtnp.org> all rights reserved
 
-from GLXBob.Timer import Timer
-from GLXBob.MainLoop import MainLoop
-from GLXBob.EventBus import EventBus
+import sys
+
+# Exported names and they modules, a module is imported on the first access of one of it names
+_EXPORTS = {
+    'Timer': 'GLXBob.Timer',
+    'MainLoop': 'GLXBob.MainLoop',
+    'DataStore': 'GLXBob.DataStore',
+    'DeliveryPolicy': 'GLXBob.DeliveryPolicy',
+    'Throttle': 'GLXBob.DeliveryPolicy',
+    'Debounce': 'GLXBob.DeliveryPolicy',
+    'Coalesce': 'GLXBob.DeliveryPolicy',
+    'EventBus': 'GLXBob.EventBus',
+    'EVENT_STOP': 'GLXBob.EventBus',
+    'EVENT_PROPAGATE': 'GLXBob.EventBus',
+    'PRIORITY_HIGH': 'GLXBob.EventBus',
+    'PRIORITY_DEFAULT': 'GLXBob.EventBus',
+    'PRIORITY_LOW': 'GLXBob.EventBus',
+    'EventBusBridge': 'GLXBob.EventBusBridge',
+    'EventQueue': 'GLXBob.EventQueue',
+    'OVERFLOW_DROP_OLDEST': 'GLXBob.EventQueue',
+    'OVERFLOW_DROP_NEWEST': 'GLXBob.EventQueue',
+    'OVERFLOW_BLOCK': 'GLXBob.EventQueue',
+    'OVERFLOW_RAISE': 'GLXBob.EventQueue',
+    'EventBusMetrics': 'GLXBob.EventBusMetrics',
+    'EventRecorder': 'GLXBob.EventJournal',
+    'EventReplayer': 'GLXBob.EventJournal',
+    'ProcessExecutor': 'GLXBob.ProcessExecutor',
+    'Pacer': 'GLXBob.Pacer',
+    'IdleCollector': 'GLXBob.IdleCollector',
+    'AllocationProfiler': 'GLXBob.AllocationProfiler',
+    'SchedulingPolicy': 'GLXBob.SchedulingPolicy',
+    'SCHED_OTHER': 'GLXBob.SchedulingPolicy',
+    'SCHED_BATCH': 'GLXBob.SchedulingPolicy',
+    'SCHED_IDLE': 'GLXBob.SchedulingPolicy',
+    'SCHED_FIFO': 'GLXBob.SchedulingPolicy',
+    'SCHED_RR': 'GLXBob.SchedulingPolicy',
+    'FrameTraceWriter': 'GLXBob.FrameTrace',
+    'SleepCalibrator': 'GLXBob.SleepCalibrator',
+    'OverloadDetector': 'GLXBob.OverloadDetector',
+    'FileSource': 'GLXBob.FileSource',
+    'FairScheduler': 'GLXBob.FairScheduler',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    value = getattr(__import__(module_name, fromlist=(name,)), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+class _Package(type(sys)):
+    # The import system bind a imported submodule on it package, it would hide the class of the same name
+    def __setattr__(self, name, value):
+        if name in _EXPORTS and isinstance(value, type(sys)):
+            return
+        super(_Package, self).__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
 
 __author__ = u"Tuuux"
 __copyright__ = u"Copyright 2016-2017, The Galaxie Project"
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+import argparse
+from GLXBob.FrameTrace import HEADER, RECORD, EVENT_GOAL, EVENT_UP, EVENT_DOWN
+from GLXBob.FrameTrace import check_header
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+# Columns of the CSV summary, one row by window of frames
+CSV_COLUMNS = (
+    'window', 'start_time', 'frames', 'measured_fps', 'target_fps', 'jitter_p50_ms', 'jitter_p99_ms',
+    'late_ratio', 'goal', 'up', 'down'
+)
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def _import_numpy():
+    # NumPy is a optional dependency, only the analyse require it
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(u'the frame trace analyse require NumPy: pip install numpy')
+    return numpy
+
+
+def get_dtype():
+    """
+    Get the NumPy structured type of a record of a frame trace, see
+    :class:`FrameTraceWriter <GLXBob.FrameTrace.FrameTraceWriter>`.
+
+    :return: the record type
+    :rtype: numpy.dtype
+    """
+    numpy = _import_numpy()
+    dtype = numpy.dtype([
+        ('time', '<f8'),
+        ('slack', '<f8'),
+        ('fps', '<f8'),
+        ('increment', '<f4'),
+        ('event', 'u1'),
+        ('late', 'u1'),
+        ('padding', 'V2')
+    ])
+    assert dtype.itemsize == RECORD.size
+    return dtype
+
+
+def load_trace(path):
+    """
+    Memory-map a frame trace as a NumPy array of records, the file is not read in memory.
+
+    :param path: file system path of the trace
+    :type path: str
+    :return: the records, the fields are ``time``, ``slack``, ``fps``, ``increment``, ``event`` and ``late``
+    :rtype: numpy.ndarray
+    :raise ValueError: if the file is not a frame trace
+    """
+    numpy = _import_numpy()
+    with open(path, 'rb') as trace:
+        check_header(trace.read(HEADER.size))
+        size = trace.seek(0, 2)
+    # A record truncated by a crash is ignored
+    count = (size - HEADER.size) // RECORD.size
+    if not count:
+        return numpy.zeros(0, dtype=get_dtype())
+    return numpy.memmap(path, dtype=get_dtype(), mode='r', offset=HEADER.size, shape=(count,))
+
+
+def sliding_fps(times, window):
+    """
+    Measure the frame rate over a sliding window of frames.
+
+    :param times: end time of each frame in seconds
+    :param window: number of frames of the window
+    :type times: numpy.ndarray
+    :type window: int
+    :return: frame rate of each window, ``len(times) - window`` values
+    :rtype: numpy.ndarray
+    """
+    numpy = _import_numpy()
+    times = numpy.asarray(times, dtype=numpy.float64)
+    if len(times) <= window:
+        return numpy.zeros(0)
+    elapsed = times[window:] - times[:-window]
+    with numpy.errstate(divide='ignore'):
+        return numpy.where(elapsed > 0, window / numpy.maximum(elapsed, 1e-12), numpy.inf)
+
+
+def frame_jitter(records):
+    """
+    Measure the jitter of the frames: the interval between two frames minus the interval of the frame rate.
+
+    :param records: the records of a trace
+    :type records: numpy.ndarray
+    :return: jitter of each frame after the first one, in seconds
+    :rtype: numpy.ndarray
+    """
+    numpy = _import_numpy()
+    if len(records) < 2:
+        return numpy.zeros(0)
+    intervals = numpy.diff(records['time'])
+    # A frame is paced on the frame rate decided by the previous one
+    return intervals - 1.0 / numpy.maximum(records['fps'][:-1], 1e-12)
+
+
+def overrun_runs(late):
+    """
+    Find the runs of consecutive late frames.
+
+    :param late: late flag of each frame
+    :type late: numpy.ndarray
+    :return: index of the first frame and length of each run
+    :rtype: tuple
+    """
+    numpy = _import_numpy()
+    padded = numpy.concatenate(([0], numpy.asarray(late, dtype=numpy.int8) != 0, [0])).astype(numpy.int8)
+    edges = numpy.diff(padded)
+    starts = numpy.flatnonzero(edges == 1)
+    ends = numpy.flatnonzero(edges == -1)
+    return starts, ends - starts
+
+
+def convergence_events(events):
+    """
+    Find the adjustments of the frame rate analysis of :func:`Timer.tick() <GLXBob.Timer.Timer.tick()>`.
+
+    :param events: event of each frame
+    :type events: numpy.ndarray
+    :return: ``goal``, ``up`` and ``down`` counts, ``first_goal`` frame index or :py:obj:`None`, and ``up_down``
+       the number of reversals between UP and DOWN, the oscillations before the convergence
+    :rtype: dict
+    """
+    numpy = _import_numpy()
+    events = numpy.asarray(events)
+    goals = numpy.flatnonzero(events == EVENT_GOAL)
+    directions = events[(events == EVENT_UP) | (events == EVENT_DOWN)]
+    return {
+        'goal': int(len(goals)),
+        'up': int(numpy.count_nonzero(events == EVENT_UP)),
+        'down': int(numpy.count_nonzero(events == EVENT_DOWN)),
+        'first_goal': int(goals[0]) if len(goals) else None,
+        'up_down': int(numpy.count_nonzero(directions[1:] != directions[:-1]))
+    }
+
+
+def summarize(records, window=600):
+    """
+    Compute the summary of a trace.
+
+    :param records: the records of a trace
+    :param window: number of frames of the sliding frame rate window
+    :type records: numpy.ndarray
+    :type window: int
+    :return: ``frames``, ``duration``, ``fps`` (min, mean and max of the sliding frame rate), ``jitter_ms``
+       (percentiles of the absolute jitter), ``late``, ``overruns`` (count, longest run and mean run length) and
+       ``events`` entries
+    :rtype: dict
+    """
+    numpy = _import_numpy()
+    summary = {
+        'frames': int(len(records)),
+        'duration': float(records['time'][-1] - records['time'][0]) if len(records) else 0.0,
+        'fps': None,
+        'jitter_ms': None,
+        'late': int(numpy.count_nonzero(records['late'])),
+        'overruns': None,
+        'events': convergence_events(records['event'])
+    }
+    fps = sliding_fps(records['time'], window)
+    if len(fps):
+        summary['fps'] = {'min': float(fps.min()), 'mean': float(fps.mean()), 'max': float(fps.max())}
+    jitter = numpy.abs(frame_jitter(records))
+    if len(jitter):
+        values = numpy.percentile(jitter, PERCENTILES) * 1000.0
+        summary['jitter_ms'] = dict(('p{0:g}'.format(percentile), float(value))
+                                    for percentile, value in zip(PERCENTILES, values))
+        summary['jitter_ms']['max'] = float(jitter.max() * 1000.0)
+    _, lengths = overrun_runs(records['late'])
+    summary['overruns'] = {
+        'count': int(len(lengths)),
+        'longest': int(lengths.max()) if len(lengths) else 0,
+        'mean': float(lengths.mean()) if len(lengths) else 0.0
+    }
+    return summary
+
+
+def window_summary(records, window=600):
+    """
+    Compute the summary of each window of frames, for plot it.
+
+    :param records: the records of a trace
+    :param window: number of frames by row, the last incomplete window is ignored
+    :type records: numpy.ndarray
+    :type window: int
+    :return: a array by column of :py:data:`CSV_COLUMNS`
+    :rtype: dict
+    """
+    numpy = _import_numpy()
+    # The jitter of a frame need the previous frame, a window of N frame end at the frame N * window
+    count = max(len(records) - 1, 0) // window
+    end = count * window
+    times = numpy.asarray(records['time'][:end + 1], dtype=numpy.float64)
+    jitter = numpy.abs(frame_jitter(records[:end + 1])).reshape(count, window)
+    late = numpy.asarray(records['late'][1:end + 1]).reshape(count, window)
+    events = numpy.asarray(records['event'][1:end + 1]).reshape(count, window)
+    elapsed = times[window::window] - times[:end:window]
+    columns = {
+        'window': numpy.arange(count),
+        'start_time': times[:end:window],
+        'frames': numpy.full(count, window),
+        'measured_fps': window / numpy.maximum(elapsed, 1e-12),
+        'target_fps': numpy.asarray(records['fps'][1:end + 1]).reshape(count, window).mean(axis=1),
+        'jitter_p50_ms': numpy.percentile(jitter, 50.0, axis=1) * 1000.0 if count else numpy.zeros(0),
+        'jitter_p99_ms': numpy.percentile(jitter, 99.0, axis=1) * 1000.0 if count else numpy.zeros(0),
+        'late_ratio': numpy.count_nonzero(late, axis=1) / float(window),
+        'goal': numpy.count_nonzero(events == EVENT_GOAL, axis=1),
+        'up': numpy.count_nonzero(events == EVENT_UP, axis=1),
+        'down': numpy.count_nonzero(events == EVENT_DOWN, axis=1)
+    }
+    return columns
+
+
+def write_csv(columns, destination):
+    """
+    Write the summary of the windows as CSV, with a header line.
+
+    :param columns: the result of :func:`window_summary() <GLXBob.analyze.window_summary()>`
+    :param destination: a file object open in text mode
+    :type columns: dict
+    """
+    numpy = _import_numpy()
+    destination.write(','.join(CSV_COLUMNS) + '\n')
+    table = numpy.column_stack([numpy.asarray(columns[name], dtype=numpy.float64) for name in CSV_COLUMNS])
+    # The counters are integers, the measures have a fixed precision
+    formats = ['%d', '%.6f', '%d', '%.3f', '%.3f', '%.4f', '%.4f', '%.4f', '%d', '%d', '%d']
+    if len(table):
+        numpy.savetxt(destination, table, fmt=formats, delimiter=',')
+
+
+def format_summary(summary):
+    """
+    Format a summary for a human.
+
+    :param summary: the result of :func:`summarize() <GLXBob.analyze.summarize()>`
+    :type summary: dict
+    :return: the summary text
+    :rtype: str
+    """
+    lines = ['frames: {0}, duration: {1:.3f} s, late: {2}'.format(
+        summary['frames'], summary['duration'], summary['late']
+    )]
+    if summary['fps'] is not None:
+        lines.append('fps: min {0[min]:.2f}, mean {0[mean]:.2f}, max {0[max]:.2f}'.format(summary['fps']))
+    if summary['jitter_ms'] is not None:
+        lines.append('jitter: ' + ', '.join('{0} {1:.3f} ms'.format(name, value)
+                                            for name, value in summary['jitter_ms'].items()))
+    lines.append('overruns: {0[count]} runs, longest {0[longest]} frames, mean {0[mean]:.2f} frames'.format(
+        summary['overruns']
+    ))
+    events = summary['events']
+    lines.append('events: {0} GOAL, {1} UP, {2} DOWN, {3} UP/DOWN reversals, first GOAL at frame {4}'.format(
+        events['goal'], events['up'], events['down'], events['up_down'], events['first_goal']
+    ))
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    """
+    The ``python -m GLXBob.analyze`` command.
+
+    :param argv: the command line arguments, :py:obj:`None` for :py:data:`sys.argv`
+    :type argv: list or None
+    :return: the exit status
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m GLXBob.analyze',
+        description='Analyse a frame trace written by GLXBob.FrameTraceWriter'
+    )
+    parser.add_argument('trace', help='the frame trace file')
+    parser.add_argument('--window', type=int, default=600, help='number of frames of the windows (default: 600)')
+    parser.add_argument('--csv', help='write the summary of each window to this CSV file, - for stdout')
+    arguments = parser.parse_args(argv)
+    if arguments.window <= 0:
+        parser.error('--window must be positive')
+    try:
+        records = load_trace(arguments.trace)
+    except (ImportError, ValueError, OSError) as error:
+        sys.stderr.write('{0}\n'.format(error))
+        return 1
+    if arguments.csv == '-':
+        write_csv(window_summary(records, arguments.window), sys.stdout)
+        return 0
+    sys.stdout.write(format_summary(summarize(records, arguments.window)))
+    if arguments.csv is not None:
+        with open(arguments.csv, 'w') as destination:
+            write_csv(window_summary(records, arguments.window), destination)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+import sys
+import os
+import logging
+import threading
+import tracemalloc
+from time import perf_counter
+
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+def do_nothing(*args):
+    pass
+
+
+def bench_emit_threads(threads=1, emits=100000, handlers=4):
+    """
+    Measure the :func:`EventBus.emit() <GLXBob.EventBus.EventBus.emit()>` throughput when ``threads`` producers
+    emit on the same bus, when a subscriber thread connect and disconnect handlers in same time.
+
+    :param threads: number of emitting threads
+    :param emits: total number of emissions, shared by the emitting threads
+    :param handlers: number of handlers connected to the emitted signal
+    :return: emissions per second
+    :rtype: float
+    """
+    event_bus = GLXBob.EventBus()
+    for _ in range(handlers):
+        event_bus.connect('signal', do_nothing)
+
+    running = threading.Event()
+    running.set()
+
+    def subscriber():
+        while running.is_set():
+            event_bus.disconnect(event_bus.connect('signal', do_nothing))
+
+    def producer(count):
+        for _ in range(count):
+            event_bus.emit('signal', 42)
+
+    producers = [threading.Thread(target=producer, args=(emits // threads,)) for _ in range(threads)]
+    churn = threading.Thread(target=subscriber)
+    churn.start()
+    starting_time = perf_counter()
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    elapsed = perf_counter() - starting_time
+    running.clear()
+    churn.join()
+    return (emits // threads) * threads / elapsed
+
+
+def bench_memory_per_subscription(subscriptions=1000000, signals=1000):
+    """
+    Measure the memory used by each :func:`EventBus.connect() <GLXBob.EventBus.EventBus.connect()>` subscription,
+    with :py:mod:`tracemalloc`. The signals names are created before the measure.
+
+    :param subscriptions: number of connected handlers
+    :param signals: number of signals, the handlers are shared between them
+    :return: bytes per subscription
+    :rtype: float
+    """
+    event_bus = GLXBob.EventBus()
+    names = ['signal-{0}'.format(index) for index in range(signals)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(subscriptions):
+        event_bus.connect(names[index % signals], do_nothing)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / subscriptions
+
+
+if __name__ == '__main__':
+    # The bus log each invocation at INFO level, keep it out of the measure
+    logging.disable(logging.CRITICAL)
+    sys.stdout.write('Galaxie-Bob EventBus benchmark\n')
+    sys.stdout.write('------------------------------\n')
+    for thread_count in (1, 4, 16):
+        sys.stdout.write('emit, {0:>2} thread(s): {1:>12.0f} emit/s\n'.format(
+            thread_count,
+            bench_emit_threads(threads=thread_count)
+        ))
+    sys.stdout.write('memory, 10^6 subscriptions: {0:>6.1f} bytes/subscription\n'.format(
+        bench_memory_per_subscription()
+    ))
+    sys.stdout.flush()
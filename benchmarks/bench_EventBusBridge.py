@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+import sys
+import os
+import logging
+import tempfile
+import multiprocessing
+from time import perf_counter
+
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+def sender(path, emits, batch_size):
+    event_bus = GLXBob.EventBus()
+    bridge = GLXBob.EventBusBridge(event_bus, signals=['signal'], batch_size=batch_size)
+    bridge.connect_peer(path)
+    for value in range(emits):
+        event_bus.emit('signal', value, 'payload')
+    bridge.close()
+
+
+def bench_bridge(emits=500000, batch_size=1024):
+    """
+    Measure the throughput of signals forwarded by a other process.
+
+    :param emits: number of emissions of the sending process
+    :param batch_size: emissions per frame
+    :return: received emissions per second
+    :rtype: float
+    """
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'bench.sock')
+    event_bus = GLXBob.EventBus()
+    bridge = GLXBob.EventBusBridge(event_bus)
+    bridge.listen(path)
+    received = [0]
+
+    def on_signal(*args):
+        received[0] += 1
+
+    event_bus.connect('signal', on_signal)
+    process = multiprocessing.Process(target=sender, args=(path, emits, batch_size))
+    starting_time = perf_counter()
+    process.start()
+    while received[0] < emits:
+        bridge.process(0.1)
+    elapsed = perf_counter() - starting_time
+    process.join()
+    bridge.close()
+    os.rmdir(directory)
+    return emits / elapsed
+
+
+if __name__ == '__main__':
+    # The bus log each invocation at INFO level, keep it out of the measure
+    logging.disable(logging.CRITICAL)
+    sys.stdout.write('Galaxie-Bob EventBusBridge benchmark\n')
+    sys.stdout.write('------------------------------------\n')
+    for batch in (1, 64, 1024):
+        sys.stdout.write('bridge, batch {0:>4}: {1:>12.0f} emit/s\n'.format(
+            batch,
+            bench_bridge(emits=50000 if batch == 1 else 500000, batch_size=batch)
+        ))
+    sys.stdout.flush()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+import sys
+import os
+import gc
+import json
+import math
+import random
+import argparse
+import logging
+import platform
+import threading
+import tracemalloc
+from time import perf_counter
+
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+FAN_OUTS = (1, 10, 100)
+BLOCKED_RATIOS = (0.0, 0.1, 0.5)
+THREADS = (1, 4)
+
+# A per operation cost it grow faster than size ** MAX_SLOPE is a algorithmic regression
+MAX_SLOPE = 0.35
+
+
+def do_nothing(*args):
+    pass
+
+
+def build_bus(handlers, fan_out):
+    """
+    Connect ``handlers`` handlers on ``handlers // fan_out`` signals and measure the
+    :func:`EventBus.connect() <GLXBob.EventBus.EventBus.connect()>` throughput.
+
+    :param handlers: number of connected handlers
+    :param fan_out: number of handlers by signal
+    :type handlers: int
+    :type fan_out: int
+    :return: the bus, the signal names, the handlers identifiers and the measure
+    :rtype: tuple
+    """
+    event_bus = GLXBob.EventBus()
+    names = ['signal-{0}'.format(index) for index in range(max(handlers // fan_out, 1))]
+    signals = len(names)
+    connect = event_bus.connect
+    starting_time = perf_counter()
+    handler_ids = [connect(names[index % signals], do_nothing) for index in range(handlers)]
+    elapsed = perf_counter() - starting_time
+    return event_bus, names, handler_ids, measure(handlers, elapsed, True)
+
+
+def measure(operations, elapsed, complete):
+    return {
+        'operations': operations,
+        'seconds': elapsed,
+        'rate': operations / elapsed if elapsed > 0 else float('inf'),
+        'complete': complete
+    }
+
+
+def timed(operation, items, time_budget):
+    """
+    Call ``operation`` on each item until the end of the items or of the time budget.
+
+    :param operation: a callable it receive a item
+    :param items: the items
+    :param time_budget: maximum time in seconds
+    :type operation: callable
+    :type items: list
+    :type time_budget: float
+    :return: ``operations``, ``seconds``, ``rate`` (operations per second) and ``complete`` entries
+    :rtype: dict
+    """
+    starting_time = perf_counter()
+    deadline = starting_time + time_budget
+    done = 0
+    # The clock is read by batch, a operation can be shorter than the clock
+    batch = 64
+    while done < len(items):
+        for item in items[done:done + batch]:
+            operation(item)
+        done = min(done + batch, len(items))
+        if perf_counter() >= deadline:
+            break
+    return measure(done, perf_counter() - starting_time, done == len(items))
+
+
+def bench_emit(event_bus, names, threads, time_budget):
+    """
+    Measure the :func:`EventBus.emit() <GLXBob.EventBus.EventBus.emit()>` throughput of ``threads`` producers,
+    each emit the signals in a random order during ``time_budget`` seconds.
+
+    :param event_bus: the bus
+    :param names: the emitted signals
+    :param threads: number of emitting threads
+    :param time_budget: duration of the measure in seconds
+    :type event_bus: GLXBob.EventBus
+    :type names: list
+    :type threads: int
+    :type time_budget: float
+    :return: the measure, ``operations`` are emissions
+    :rtype: dict
+    """
+    counts = [0] * threads
+    start = threading.Barrier(threads + 1)
+    order = list(names)
+    random.Random(threads).shuffle(order)
+
+    def producer(index):
+        emit = event_bus.emit
+        count = 0
+        start.wait()
+        deadline = perf_counter() + time_budget
+        while perf_counter() < deadline:
+            for detailed_signal in order[count % len(order):count % len(order) + 64]:
+                emit(detailed_signal, 42)
+                count += 1
+        counts[index] = count
+
+    producers = [threading.Thread(target=producer, args=(index,)) for index in range(threads)]
+    for thread in producers:
+        thread.start()
+    start.wait()
+    starting_time = perf_counter()
+    for thread in producers:
+        thread.join()
+    return measure(sum(counts), perf_counter() - starting_time, True)
+
+
+def bench_block(event_bus, handler_ids, time_budget):
+    """
+    Measure :func:`EventBus.handler_block() <GLXBob.EventBus.EventBus.handler_block()>` then
+    :func:`EventBus.handler_unblock() <GLXBob.EventBus.EventBus.handler_unblock()>` of the handlers in a random
+    order, the blocked handlers accumulate.
+
+    :param event_bus: the bus
+    :param handler_ids: the handlers identifiers
+    :param time_budget: maximum time in seconds of each measure
+    :type event_bus: GLXBob.EventBus
+    :type handler_ids: list
+    :type time_budget: float
+    :return: ``block`` and ``unblock`` measures
+    :rtype: dict
+    """
+    order = list(handler_ids)
+    random.Random(len(order)).shuffle(order)
+    block = timed(event_bus.handler_block, order, time_budget)
+    unblock = timed(event_bus.handler_unblock, order[:block['operations']], time_budget)
+    # The blocked handlers left by a incomplete measure are released for the next measures
+    event_bus.blocked_handler = set()
+    return {'block': block, 'unblock': unblock}
+
+
+def set_blocked_ratio(event_bus, handler_ids, blocked_ratio):
+    # Set directly, blocking a half of 10^6 handlers one by one would be the measure of handler_block()
+    step = int(round(1.0 / blocked_ratio)) if blocked_ratio else 0
+    event_bus.blocked_handler = set(handler_ids[::step]) if step else set()
+    return len(event_bus.blocked_handler)
+
+
+def bench_memory(handlers, fan_out):
+    """
+    Measure the memory used by each subscription with :py:mod:`tracemalloc`, the signals names are created before
+    the measure.
+
+    :param handlers: number of connected handlers
+    :param fan_out: number of handlers by signal
+    :type handlers: int
+    :type fan_out: int
+    :return: bytes per subscription
+    :rtype: float
+    """
+    event_bus = GLXBob.EventBus()
+    names = ['signal-{0}'.format(index) for index in range(max(handlers // fan_out, 1))]
+    signals = len(names)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(handlers):
+        event_bus.connect(names[index % signals], do_nothing)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / handlers
+
+
+def scaling_slope(sizes, rates):
+    """
+    Fit the cost of a operation to ``size ** slope`` by a least squares on the log-log curve: a slope near 0 is a
+    constant cost, a slope near 1 is a cost it grow linearly with the size.
+
+    :param sizes: the sizes
+    :param rates: the operations per second of each size
+    :type sizes: list
+    :type rates: list
+    :return: the slope, :py:obj:`None` with less than 2 sizes
+    :rtype: float or None
+    """
+    points = [(math.log(size), -math.log(rate)) for size, rate in zip(sizes, rates) if rate and rate != float('inf')]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def run(sizes, fan_outs, blocked_ratios, threads, time_budget, memory=True, output=sys.stdout):
+    """
+    Run the benchmark suite.
+
+    :param sizes: numbers of handlers
+    :param fan_outs: numbers of handlers by signal
+    :param blocked_ratios: ratios of blocked handlers of the emit measures
+    :param threads: numbers of emitting threads
+    :param time_budget: maximum time in seconds of a measure
+    :param memory: :py:obj:`True` for measure the memory by subscription
+    :param output: a text file it receive a line by measure, :py:obj:`None` for none
+    :type sizes: list
+    :type fan_outs: list
+    :type blocked_ratios: list
+    :type threads: list
+    :type time_budget: float
+    :type memory: bool
+    :return: ``results`` (a entry by measure) and ``curves`` (the rates, or the bytes by subscription, of each
+       serie by size, and it slope)
+    :rtype: dict
+    """
+    results = list()
+
+    def record(case, handlers, fan_out, result, **parameters):
+        entry = dict(case=case, handlers=handlers, signals=max(handlers // fan_out, 1), fan_out=fan_out)
+        entry.update(parameters)
+        entry.update(result)
+        results.append(entry)
+        if output is not None:
+            output.write('{0:<10} handlers {1:>8} fan-out {2:>4} {3:<28} {4:>14.1f} {5}\n'.format(
+                case, handlers, fan_out,
+                ' '.join('{0} {1}'.format(name, value) for name, value in sorted(parameters.items())),
+                result['rate'] if 'rate' in result else result['bytes_per_subscription'],
+                'op/s' if 'rate' in result else 'bytes/subscription'
+            ))
+            output.flush()
+
+    for handlers in sizes:
+        for fan_out in fan_outs:
+            if fan_out > handlers:
+                continue
+            event_bus, names, handler_ids, connect = build_bus(handlers, fan_out)
+            record('connect', handlers, fan_out, connect)
+            for blocked_ratio in blocked_ratios:
+                blocked = set_blocked_ratio(event_bus, handler_ids, blocked_ratio)
+                for thread_count in threads:
+                    # The threads are measured without blocked handlers only, the blocked lookup is not threaded
+                    if thread_count > 1 and blocked_ratio:
+                        continue
+                    emit = bench_emit(event_bus, names, thread_count, time_budget)
+                    emit['deliveries'] = emit['operations'] * fan_out
+                    record('emit', handlers, fan_out, emit, blocked_ratio=blocked_ratio, blocked=blocked,
+                           threads=thread_count)
+            event_bus.blocked_handler = set()
+            block = bench_block(event_bus, handler_ids, time_budget)
+            record('block', handlers, fan_out, block['block'])
+            record('unblock', handlers, fan_out, block['unblock'])
+            order = list(handler_ids)
+            random.Random(handlers).shuffle(order)
+            record('disconnect', handlers, fan_out, timed(event_bus.disconnect, order, time_budget))
+            del event_bus, names, handler_ids, order
+            if memory:
+                used = bench_memory(handlers, fan_out)
+                record('memory', handlers, fan_out, {'bytes_per_subscription': used})
+            gc.collect()
+
+    curves = dict()
+    for entry in results:
+        key = '{0} fan-out={1}'.format(entry['case'], entry['fan_out'])
+        if entry['case'] == 'emit':
+            key += ' blocked={0} threads={1}'.format(entry['blocked_ratio'], entry['threads'])
+        curve = curves.setdefault(key, {'sizes': list(), 'values': list()})
+        curve['sizes'].append(entry['handlers'])
+        curve['values'].append(entry['rate'] if 'rate' in entry else entry['bytes_per_subscription'])
+    for key, curve in curves.items():
+        if key.startswith('memory'):
+            # The memory is a cost, the slope is computed on it inverse
+            curve['slope'] = scaling_slope(curve['sizes'], [1.0 / value if value > 0 else None
+                                                            for value in curve['values']])
+        else:
+            curve['slope'] = scaling_slope(curve['sizes'], curve['values'])
+    return {'results': results, 'curves': curves}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Galaxie-Bob EventBus scalability benchmark')
+    parser.add_argument('--max-exponent', type=int, default=6, help='largest size is 10^N handlers (default: 6)')
+    parser.add_argument('--fan-outs', type=int, nargs='+', default=list(FAN_OUTS), help='handlers by signal')
+    parser.add_argument('--blocked-ratios', type=float, nargs='+', default=list(BLOCKED_RATIOS),
+                        help='ratios of blocked handlers of the emit measures')
+    parser.add_argument('--threads', type=int, nargs='+', default=list(THREADS), help='emitting threads')
+    parser.add_argument('--time-budget', type=float, default=0.5, help='maximum seconds of a measure')
+    parser.add_argument('--no-memory', action='store_true', help='do not measure the memory by subscription')
+    parser.add_argument('--json', help='write the results and the curves to this JSON file, - for stdout')
+    parser.add_argument('--check', action='store_true',
+                        help='exit with a error status when a cost grow faster than size ** --max-slope')
+    parser.add_argument('--max-slope', type=float, default=MAX_SLOPE)
+    arguments = parser.parse_args()
+    # The bus log each invocation at INFO level, keep it out of the measure
+    logging.disable(logging.CRITICAL)
+
+    sizes = [10 ** exponent for exponent in range(2, max(arguments.max_exponent, 2) + 1)]
+    text = sys.stderr if arguments.json == '-' else sys.stdout
+    text.write('Galaxie-Bob EventBus scalability benchmark\n')
+    text.write('------------------------------------------\n')
+    report = run(sizes, arguments.fan_outs, arguments.blocked_ratios, arguments.threads, arguments.time_budget,
+                 memory=not arguments.no_memory, output=text)
+    report['python'] = platform.python_implementation() + ' ' + platform.python_version()
+    report['machine'] = platform.machine()
+    report['time_budget'] = arguments.time_budget
+
+    text.write('\nscaling slopes (0: constant cost by operation, 1: cost proportional to the size)\n')
+    over_slope = list()
+    for key, curve in sorted(report['curves'].items()):
+        slope = curve['slope']
+        flag = ''
+        if slope is not None and slope > arguments.max_slope:
+            over_slope.append(key)
+            flag = '  <- over {0}'.format(arguments.max_slope)
+        text.write('{0:<45} {1}{2}\n'.format(key, 'n/a' if slope is None else '{0:+.2f}'.format(slope), flag))
+    if arguments.json == '-':
+        json.dump(report, sys.stdout, indent=1, sort_keys=True)
+        sys.stdout.write('\n')
+    elif arguments.json is not None:
+        with open(arguments.json, 'w') as destination:
+            json.dump(report, destination, indent=1, sort_keys=True)
+    text.flush()
+    sys.exit(1 if arguments.check and over_slope else 0)
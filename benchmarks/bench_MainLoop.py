@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+import sys
+import os
+import argparse
+import logging
+import threading
+
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+from GLXBob.SchedulingPolicy import SCHED_POLICIES
+
+
+def bench_frame_jitter(fps=200.0, frames=1000, work=0.0005):
+    """
+    Measure the wakeup lateness of the frames paced by a :class:`Pacer <GLXBob.Pacer.Pacer>`, each frame run a
+    busy loop of ``work`` seconds like a loop it have something to do.
+
+    :param fps: frame rate
+    :param frames: number of measured frames
+    :param work: busy time of each frame in seconds
+    :type fps: float
+    :type frames: int
+    :type work: float
+    :return: lateness percentiles in microseconds: ``p50``, ``p99``, ``p999`` and ``max``
+    :rtype: dict
+    """
+    pacer = GLXBob.Pacer()
+    lateness = list()
+    try:
+        for _ in range(frames):
+            starting_time = pacer.get_time()
+            while pacer.get_time() - starting_time < work:
+                pass
+            deadline = pacer.get_time() + pacer.schedule(1.0 / fps)
+            pacer.wait()
+            lateness.append(max(pacer.get_time() - deadline, 0.0) * 1000000.0)
+    finally:
+        pacer.close()
+    lateness.sort()
+    return {
+        'p50': lateness[len(lateness) // 2],
+        'p99': lateness[int(len(lateness) * 0.99)],
+        'p999': lateness[int(len(lateness) * 0.999)],
+        'max': lateness[-1]
+    }
+
+
+def noisy_neighbours(count, stop):
+    # CPU bound threads, they compete with the loop for the CPU
+    def spin():
+        while not stop.is_set():
+            sum(range(1000))
+
+    threads = [threading.Thread(target=spin, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Galaxie-Bob frame jitter benchmark')
+    parser.add_argument('--cpus', type=int, nargs='+', help='CPU numbers the loop is pinned on')
+    parser.add_argument('--nice', type=int, help='niceness of the loop')
+    parser.add_argument('--policy', choices=sorted(SCHED_POLICIES), help='scheduling class of the loop')
+    parser.add_argument('--priority', type=int, help='static priority of a real-time class')
+    parser.add_argument('--fps', type=float, default=200.0)
+    parser.add_argument('--frames', type=int, default=1000)
+    parser.add_argument('--neighbours', type=int, default=0, help='number of CPU bound threads during the measure')
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    sys.stdout.write('Galaxie-Bob frame jitter benchmark\n')
+    sys.stdout.write('----------------------------------\n')
+    stop = threading.Event()
+    noisy_neighbours(arguments.neighbours, stop)
+    line = '{0:<10} p50 {1[p50]:>8.1f} us  p99 {1[p99]:>8.1f} us  p99.9 {1[p999]:>8.1f} us  max {1[max]:>8.1f} us\n'
+    # The default scheduling is measured first, a policy can't always be reverted
+    default = bench_frame_jitter(fps=arguments.fps, frames=arguments.frames)
+    sys.stdout.write(line.format('default', default))
+    scheduling_policy = GLXBob.SchedulingPolicy(
+        cpus=arguments.cpus,
+        nice=arguments.nice,
+        policy=arguments.policy,
+        priority=arguments.priority
+    )
+    applied = scheduling_policy.apply()
+    sys.stdout.write('applied: {0}\n'.format(', '.join(
+        '{0}={1}'.format(name, value) for name, value in sorted(applied.items()) if value is not None
+    ) or 'nothing'))
+    tuned = bench_frame_jitter(fps=arguments.fps, frames=arguments.frames)
+    sys.stdout.write(line.format('tuned', tuned))
+    sys.stdout.write('difference p99 {0:>+8.1f} us  max {1:>+8.1f} us\n'.format(
+        tuned['p99'] - default['p99'],
+        tuned['max'] - default['max']
+    ))
+    stop.set()
+    sys.stdout.flush()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# It script it publish under GNU GENERAL PUBLIC LICENSE
+# http://www.gnu.org/licenses/gpl-3.0.en.html
+# Author: Tuuux <tuxa at rtnp dot org> all rights reserved
+
+import sys
+import os
+import subprocess
+from statistics import median
+
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+package_dir = os.path.dirname(current_dir)
+
+# Import statements and they budget in milliseconds, a short-lived worker process pay it on each start. The medians
+# measured on one CPU with CPython 3.11 are ~2, ~24 and ~32 ms.
+BUDGETS = (
+    ('import GLXBob', 4.0),
+    ('from GLXBob import EventBus', 35.0),
+    ('from GLXBob import MainLoop', 45.0),
+)
+
+
+def import_time(statement, runs=7):
+    """
+    Measure the import time of ``statement`` with ``python -X importtime``, in a new interpreter for each run.
+    The modules imported by the interpreter startup are not counted.
+
+    :param statement: the Python statement
+    :param runs: number of measures
+    :type statement: str
+    :type runs: int
+    :return: median of the import time in milliseconds, and the slowest modules of the last run
+    :rtype: tuple
+    """
+    measures = list()
+    modules = list()
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import sys; sys.stderr.write("-\\n"); ' + statement],
+            cwd=package_dir,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True
+        )
+        # The lines after the marker belong to the statement
+        lines = process.stderr.split('-\n', 1)[1].splitlines()
+        total = 0
+        modules = list()
+        for line in lines:
+            if not line.startswith('import time:'):
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            modules.append((int(cumulative), name.strip()))
+            # Only the top level imports, the cumulative time include they own imports
+            if not name.startswith('  '):
+                total += int(cumulative)
+        measures.append(total / 1000.0)
+    return median(measures), sorted(modules, reverse=True)[:5]
+
+
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob import time benchmark\n')
+    sys.stdout.write('---------------------------------\n')
+    over_budget = False
+    for statement, budget in BUDGETS:
+        milliseconds, slowest = import_time(statement)
+        status = 'OK'
+        if milliseconds > budget:
+            status = 'OVER BUDGET'
+            over_budget = True
+        sys.stdout.write('{0:<30} {1:>7.1f} ms (budget {2:>5.1f} ms) {3}\n'.format(
+            statement,
+            milliseconds,
+            budget,
+            status
+        ))
+        for cumulative, name in slowest:
+            sys.stdout.write('    {0:>7.1f} ms {1}\n'.format(cumulative / 1000.0, name))
+    sys.stdout.flush()
+    sys.exit(1 if over_budget else 0)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import tracemalloc
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+# Unittest
+class TestAllocationProfiler(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.profiler = GLXBob.AllocationProfiler(sample_interval=2)
+        self.event_bus = GLXBob.EventBus()
+        self.event_bus.set_metrics(self.profiler)
+        self.kept = list()
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        self.profiler.stop()
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def allocate(self, size):
+        self.kept.append(bytearray(size))
+
+    def copy(self, size):
+        bytes(size)
+
+    def test_start_stop(self):
+        """AllocationProfiler: Test 'start()' and 'stop()' trace the allocations only when the profiler is started"""
+        self.assertFalse(self.profiler.is_started())
+        self.assertIsNone(self.profiler.end_frame())
+        self.profiler.start()
+        self.assertTrue(self.profiler.is_started())
+        self.assertTrue(tracemalloc.is_tracing())
+        self.profiler.stop()
+        self.assertFalse(self.profiler.is_started())
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_handler_allocations(self):
+        """AllocationProfiler: Test the net and peak bytes by signal and by handler"""
+        kept_id = self.event_bus.connect('kept', self.allocate)
+        copy_id = self.event_bus.connect('copy', self.copy)
+        self.profiler.start()
+        for _ in range(4):
+            self.event_bus.emit('kept', 100000)
+            self.event_bus.emit('copy', 100000)
+        allocations = self.profiler.get_allocations()
+        self.assertEqual(allocations['handlers'][kept_id]['calls'], 4)
+        self.assertGreaterEqual(allocations['handlers'][kept_id]['net'], 400000)
+        # A temporary copy is in the peak, not in the net bytes
+        self.assertGreaterEqual(allocations['handlers'][copy_id]['peak'], 400000)
+        self.assertLess(allocations['handlers'][copy_id]['net'], 100000)
+        self.assertEqual(allocations['signals']['copy']['calls'], 4)
+        self.assertIn('copy', allocations['handlers'][copy_id]['handler'])
+        # The latency metrics are kept
+        self.assertEqual(self.profiler.snapshot()['signals']['kept']['deliveries'], 4)
+
+        self.event_bus.disconnect(kept_id)
+        self.assertNotIn(kept_id, self.profiler.get_allocations()['handlers'])
+
+    def test_frames_and_top_sites(self):
+        """AllocationProfiler: Test the frames measures and the allocation sites of the snapshots"""
+        self.event_bus.connect('kept', self.allocate)
+        self.profiler.start()
+        for _ in range(4):
+            self.profiler.begin_frame()
+            self.event_bus.emit('kept', 200000)
+            infos = self.profiler.end_frame()
+            self.assertGreaterEqual(infos['net'], 200000)
+            self.assertGreaterEqual(infos['peak'], infos['net'])
+        frames = self.profiler.get_frames()
+        self.assertEqual([infos['frame'] for infos in frames], [1, 2, 3, 4])
+        # The first snapshot have nothing to compare
+        self.assertEqual([infos['blocks'] is None for infos in frames], [True, True, True, False])
+        site, size_diff, count_diff = self.profiler.get_top_sites()[0]
+        self.assertIn(os.path.basename(__file__), site)
+        self.assertGreaterEqual(size_diff, 400000)
+        self.assertIn('Allocation sites:', self.profiler.report())
+
+        self.profiler.reset()
+        self.assertEqual(self.profiler.get_frames(), [])
+        self.assertEqual(self.profiler.get_allocations(), {'signals': {}, 'handlers': {}})
+
+    def test_self_disconnected_handler_allocations_removed(self):
+        """AllocationProfiler: Test the allocations of a handler it disconnect itself are not created again"""
+        handler_ids = list()
+
+        def allocate_once(size):
+            self.allocate(size)
+            self.event_bus.disconnect(handler_ids[0])
+
+        handler_ids.append(self.event_bus.connect('signal', allocate_once))
+        self.profiler.start()
+        self.event_bus.emit('signal', 1000)
+        self.assertEqual(self.profiler.get_allocations(), {'signals': {}, 'handlers': {}})
+        self.assertEqual(self.profiler.snapshot()['handlers'], {})
+
+    def test_mainloop_allocation_profiler(self):
+        """AllocationProfiler: Test 'MainLoop.set_allocation_profiler()' measure the frames of 'MainLoop.run()'"""
+        mainloop = GLXBob.MainLoop()
+        profiler = GLXBob.AllocationProfiler()
+        mainloop.set_allocation_profiler(profiler)
+        self.assertEqual(mainloop.get_allocation_profiler(), profiler)
+        mainloop.get_event_bus().connect('frame', self.allocate)
+        frames = list()
+
+        def frame():
+            mainloop.get_event_bus().emit('frame', 1000)
+            frames.append(profiler.is_started())
+            if len(frames) == 3:
+                mainloop.quit()
+            return True
+
+        mainloop.get_timer().set_fps(200.0)
+        mainloop.idle_add(frame)
+        self.assertRaises(SystemExit, mainloop.run)
+        self.assertEqual(frames, [True, True, True])
+        self.assertFalse(profiler.is_started())
+        self.assertEqual(len(profiler.get_frames()), 3)
+        self.assertIs(mainloop.get_event_bus().get_metrics(), profiler)
+        self.assertEqual(profiler.get_allocations()['signals']['frame']['calls'], 3)
+
+    def test_raise_parameters(self):
+        """AllocationProfiler: Test raise TypeError when the profiler use wrong parameters"""
+        self.assertRaises(TypeError, GLXBob.AllocationProfiler, nframes=1.0)
+        self.assertRaises(TypeError, GLXBob.AllocationProfiler, sample_interval='60')
+        self.assertRaises(TypeError, GLXBob.AllocationProfiler, top=None)
+        self.assertRaises(TypeError, GLXBob.AllocationProfiler, history=1.5)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test AllocationProfiler Class script\n')
+    sys.stdout.write('-----------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
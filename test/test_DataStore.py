@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# Unittest
+class TestDataStore(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.clock = FakeClock()
+        self.data_store = GLXBob.DataStore(clock=self.clock)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_get_set(self):
+        """DataStore: Test if DataStore.get() return the value stored with DataStore.set()"""
+        self.data_store.set('int', 0)
+        self.data_store.set('empty', [])
+        self.assertEqual(self.data_store.get('int'), 0)
+        self.assertEqual(self.data_store.get('empty'), [])
+        self.assertIsNone(self.data_store.get('missing'))
+        self.assertEqual(self.data_store.get('missing', 42), 42)
+        self.assertTrue(self.data_store.delete('int'))
+        self.assertFalse(self.data_store.delete('int'))
+        self.assertEqual(len(self.data_store), 1)
+
+    def test_capacity_evict_least_recently_used(self):
+        """DataStore: Test if the capacity policy evict the least recently used entry"""
+        self.data_store.set_capacity(2)
+        self.data_store.set('a', 1)
+        self.data_store.set('b', 2)
+        self.data_store.get('a')
+        self.data_store.set('c', 3)
+        self.assertNotIn('b', self.data_store)
+        self.assertIn('a', self.data_store)
+        self.assertIn('c', self.data_store)
+        self.assertEqual(self.data_store.get_stats()['evictions'], 1)
+
+    def test_max_size_evict_least_recently_used(self):
+        """DataStore: Test if the max_size policy evict entries until the size fit"""
+        data_store = GLXBob.DataStore(max_size=100, sizeof=len)
+        data_store.set('a', b'x' * 60)
+        data_store.set('b', b'x' * 30)
+        self.assertEqual(data_store.get_size(), 90)
+        data_store.set('c', b'x' * 30)
+        self.assertNotIn('a', data_store)
+        self.assertEqual(data_store.get_size(), 60)
+
+    def test_ttl_lazy_expiry_and_sweep(self):
+        """DataStore: Test if expired entries are removed on access and by DataStore.sweep()"""
+        self.data_store.set_ttl(10.0)
+        self.data_store.set('a', 1)
+        self.data_store.set('b', 2, ttl=20.0)
+        self.data_store.set('c', 3)
+        self.clock.now = 15.0
+        self.assertIsNone(self.data_store.get('a'))
+        self.assertEqual(self.data_store.sweep(), 1)
+        self.assertEqual(self.data_store.get('b'), 2)
+        self.assertEqual(self.data_store.get_stats()['expirations'], 2)
+        self.clock.now = 25.0
+        self.assertEqual(self.data_store.sweep(), 1)
+        self.assertEqual(len(self.data_store), 0)
+
+    def test_stats(self):
+        """DataStore: Test the hits and misses counters of DataStore.get_stats()"""
+        self.data_store.set('a', 1)
+        self.data_store.get('a')
+        self.data_store.get('b')
+        stats = self.data_store.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 1, 1))
+
+    def test_raise_typeerror(self):
+        """DataStore: Test raise TypeError when the policies use a wrong type"""
+        self.assertRaises(TypeError, self.data_store.set_capacity, 1.0)
+        self.assertRaises(TypeError, self.data_store.set_ttl, 1)
+        self.assertRaises(TypeError, self.data_store.set_max_size, '1')
+        self.assertRaises(TypeError, self.data_store.attach, GLXBob.MainLoop(), 1)
+
+    def test_attach_sweep_on_mainloop_frames(self):
+        """DataStore: Test if DataStore.attach() sweep the expired entries on the MainLoop frames"""
+        mainloop = GLXBob.MainLoop()
+        self.data_store.set('a', 1, ttl=1.0)
+        self.data_store.attach(mainloop, interval=5.0)
+        mainloop._dispatch_sources()
+        self.clock.now = 2.0
+        mainloop._dispatch_sources()
+        self.assertEqual(len(self.data_store), 1)
+        self.clock.now = 5.0
+        mainloop._dispatch_sources()
+        self.assertEqual(len(self.data_store), 0)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test DataStore Class script\n')
+    sys.stdout.write('---------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# Unittest
+class TestDeliveryPolicy(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.clock = FakeClock()
+        self.event_bus = GLXBob.EventBus()
+        self.event_bus.set_clock(self.clock)
+        self.received = list()
+        self.event_bus.connect('signal', lambda *args: self.received.append(args))
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_get_set_signal_policy(self):
+        """DeliveryPolicy: Test 'EventBus.set_signal_policy()' and 'EventBus.get_signal_policy()' method's"""
+        policy = GLXBob.Coalesce()
+        self.event_bus.set_signal_policy('signal', policy)
+        self.assertEqual(self.event_bus.get_signal_policy('signal'), policy)
+        self.event_bus.set_signal_policy('signal')
+        self.assertIsNone(self.event_bus.get_signal_policy('signal'))
+        self.assertEqual(self.event_bus.get_clock(), self.clock)
+
+    def test_throttle(self):
+        """DeliveryPolicy: Test if Throttle deliver the leading emission then the last one by interval"""
+        policy = GLXBob.Throttle(10.0)
+        self.event_bus.set_signal_policy('signal', policy)
+        for value in range(1000):
+            self.event_bus.emit('signal', value)
+        self.assertEqual(self.received, [(0,)])
+        self.clock.now = 0.05
+        self.event_bus.dispatch_pending()
+        self.assertEqual(self.received, [(0,)])
+        self.clock.now = 0.1
+        self.assertEqual(self.event_bus.dispatch_pending(), 1)
+        self.assertEqual(self.received, [(0,), (999,)])
+        self.clock.now = 0.25
+        self.event_bus.emit('signal', 1000)
+        self.assertEqual(self.received[-1], (1000,))
+        self.assertEqual((policy.get_offered(), policy.get_delivered()), (1001, 3))
+
+    def test_debounce(self):
+        """DeliveryPolicy: Test if Debounce deliver the last emission after the quiet delay"""
+        self.event_bus.set_signal_policy('signal', GLXBob.Debounce(0.2))
+        self.event_bus.emit('signal', 1)
+        self.clock.now = 0.1
+        self.event_bus.emit('signal', 2)
+        self.clock.now = 0.25
+        self.event_bus.dispatch_pending()
+        self.assertEqual(self.received, [])
+        self.clock.now = 0.35
+        self.event_bus.dispatch_pending()
+        self.event_bus.dispatch_pending()
+        self.assertEqual(self.received, [(2,)])
+
+    def test_coalesce_by_key(self):
+        """DeliveryPolicy: Test if Coalesce deliver the last emission by key at the end of the frame"""
+        self.event_bus.set_signal_policy('signal', GLXBob.Coalesce(key=lambda job, percent: job))
+        for percent in range(100):
+            self.event_bus.emit('signal', 'a', percent)
+            self.event_bus.emit('signal', 'b', percent * 2)
+        self.assertEqual(self.received, [])
+        self.event_bus.dispatch_pending()
+        self.assertEqual(self.received, [('a', 99), ('b', 198)])
+        self.event_bus.dispatch_pending()
+        self.assertEqual(len(self.received), 2)
+
+    def test_raise_policy_parameters(self):
+        """DeliveryPolicy: Test raise TypeError and ValueError when the policies use wrong parameters"""
+        self.assertRaises(TypeError, GLXBob.Throttle, 10)
+        self.assertRaises(ValueError, GLXBob.Throttle, 0.0)
+        self.assertRaises(TypeError, GLXBob.Debounce, 1)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test DeliveryPolicy Class script\n')
+    sys.stdout.write('--------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
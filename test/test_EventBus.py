@@ -6,6 +6,8 @@ from random import randint, sample
 from time import time
 import sys
 import os
+import asyncio
+import threading
 # Require when you haven't GLXBob as default Package
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(current_dir))
@@ -34,6 +36,14 @@ class TestEventBus(unittest.TestCase):
         self.event_bus.set_data(value_random_1, value_random_2)
         self.assertEqual(self.event_bus.get_data(value_random_1), value_random_2)
 
+    def test_get_data_return_empty_and_false_values(self):
+        """EventBus: Test if 'EventBus.get_data()' return stored int and empty containers"""
+        self.event_bus.set_data('zero', 0)
+        self.event_bus.set_data('empty', '')
+        self.assertEqual(self.event_bus.get_data('zero'), 0)
+        self.assertEqual(self.event_bus.get_data('empty'), '')
+        self.assertIsNone(self.event_bus.get_data('missing'))
+
     def test_if_connect_increase_signal_handlers_list_size(self):
         """EventBus: Test if signal_handlers_list increase when use EventBus.connect() """
         value_tested = len(self.event_bus.signal_handlers)
@@ -41,6 +51,200 @@ class TestEventBus(unittest.TestCase):
         self.event_bus.connect(value_random, self.do_nothing)
         self.assertEqual(value_tested + 1, len(self.event_bus.signal_handlers))
 
+    def test_emit_pass_emitted_and_connect_parameters(self):
+        """EventBus: Test if EventBus.emit() pass emitted parameters then connect() parameters to the handler"""
+        received = list()
+        self.event_bus.connect('signal', lambda *args: received.append(args), 'user_data')
+        self.event_bus.emit('signal', 42)
+        self.assertEqual(received, [(42, 'user_data')])
+
+    def test_emit_respect_handler_priority(self):
+        """EventBus: Test if EventBus.emit() invoke handlers by priority order, then by connection order"""
+        received = list()
+        self.event_bus.connect('signal', received.append, 'default_1')
+        self.event_bus.connect_after('signal', received.append, 'low')
+        self.event_bus.connect('signal', received.append, 'high', priority=GLXBob.PRIORITY_HIGH)
+        self.event_bus.connect('signal', received.append, 'default_2')
+        self.event_bus.emit('signal')
+        self.assertEqual(received, ['high', 'default_1', 'default_2', 'low'])
+
+    def test_emit_stop_propagation(self):
+        """EventBus: Test if a handler returning EVENT_STOP stop the propagation of EventBus.emit()"""
+        received = list()
+        self.event_bus.connect('signal', lambda: GLXBob.EVENT_STOP, priority=GLXBob.PRIORITY_HIGH)
+        self.event_bus.connect('signal', lambda: received.append('expensive'))
+        self.assertTrue(self.event_bus.emit('signal'))
+        self.assertEqual(received, [])
+
+        self.event_bus._reset()
+        self.event_bus.connect('signal', lambda: True)
+        self.event_bus.connect('signal', lambda: received.append('expensive'))
+        self.assertFalse(self.event_bus.emit('signal'))
+        self.assertEqual(received, ['expensive'])
+
+    def test_handler_block_and_disconnect(self):
+        """EventBus: Test if blocked or disconnected handlers are not invoked by EventBus.emit()"""
+        received = list()
+        handler_id = self.event_bus.connect('signal', received.append, 'by_id')
+        self.event_bus.connect('signal', self.do_nothing)
+        self.event_bus.handler_block(handler_id)
+        self.event_bus.handler_block_by_func(self.do_nothing)
+        self.event_bus.emit('signal')
+        self.assertEqual(received, [])
+
+        self.event_bus.handler_unblock(handler_id)
+        self.event_bus.emit('signal')
+        self.assertEqual(received, ['by_id'])
+
+        self.event_bus.disconnect(handler_id)
+        self.assertFalse(self.event_bus.handler_is_connected(handler_id))
+        self.event_bus.emit('signal')
+        self.assertEqual(received, ['by_id'])
+
+    def test_handler_block_set(self):
+        """EventBus: Test the blocked handlers and functions are sets"""
+        handler_id = self.event_bus.connect('signal', lambda: None)
+        self.event_bus.handler_block(handler_id)
+        self.event_bus.handler_block(handler_id)
+        self.assertEqual(self.event_bus.blocked_handler, {handler_id})
+        self.event_bus.handler_unblock(handler_id)
+        self.event_bus.handler_unblock(handler_id)
+        self.assertEqual(self.event_bus.blocked_handler, set())
+        # A disconnected handler is removed from the blocked handlers
+        self.event_bus.handler_block(handler_id)
+        self.event_bus.disconnect(handler_id)
+        self.assertEqual(self.event_bus.blocked_handler, set())
+        # The blocked functions are swapped, never changed in place
+        blocked_function = self.event_bus.blocked_function
+        self.event_bus.handler_block_by_func(len)
+        self.assertEqual(blocked_function, frozenset())
+        self.assertEqual(self.event_bus.blocked_function, frozenset({len}))
+        self.event_bus._reset()
+        self.assertEqual(self.event_bus.blocked_handler, set())
+        self.assertEqual(self.event_bus.blocked_function, frozenset())
+
+    def test_get_set_weak(self):
+        """EventBus: Test 'weak' attribute with 'EventBus.set_weak()' and 'EventBus.get_weak()' method's """
+        self.assertFalse(self.event_bus.get_weak())
+        self.event_bus.set_weak(True)
+        self.assertTrue(self.event_bus.get_weak())
+        self.assertRaises(TypeError, self.event_bus.set_weak, 'Hello World!')
+
+    def test_weak_subscription_is_disconnected_when_handler_die(self):
+        """EventBus: Test if a weak subscription is removed when the handler object is garbage collected"""
+        received = list()
+
+        class Subscriber(object):
+            def on_signal(self, value):
+                received.append(value)
+
+        subscriber = Subscriber()
+        method_id = self.event_bus.connect('signal', subscriber.on_signal, weak=True)
+
+        def function(value):
+            received.append(-value)
+
+        function_id = self.event_bus.connect('signal', function, weak=True)
+        self.event_bus.emit('signal', 1)
+        self.assertEqual(received, [1, -1])
+
+        del subscriber
+        del function
+        self.assertFalse(self.event_bus.handler_is_connected(method_id))
+        self.assertFalse(self.event_bus.handler_is_connected(function_id))
+        self.event_bus.emit('signal', 2)
+        self.assertEqual(received, [1, -1])
+
+    def test_strong_subscription_keep_handler_alive(self):
+        """EventBus: Test if a subscription keep the handler alive when the bus is not weak"""
+        received = list()
+
+        class Subscriber(object):
+            def on_signal(self, value):
+                received.append(value)
+
+        self.event_bus.connect('signal', Subscriber().on_signal)
+        self.event_bus.emit('signal', 1)
+        self.assertEqual(received, [1])
+
+    def test_connect_from_other_thread_during_emit(self):
+        """EventBus: Test if connect() and disconnect() from a other thread during EventBus.emit() is safe"""
+        errors = list()
+        running = threading.Event()
+        running.set()
+
+        def subscriber():
+            try:
+                while running.is_set():
+                    handler_id = self.event_bus.connect('signal', self.do_nothing)
+                    self.event_bus.handler_block(handler_id)
+                    self.event_bus.disconnect(handler_id)
+            except Exception as error:
+                errors.append(error)
+
+        self.event_bus.connect('signal', lambda: None)
+        thread = threading.Thread(target=subscriber)
+        thread.start()
+        try:
+            for _ in range(2000):
+                self.event_bus.emit('signal')
+        finally:
+            running.clear()
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.event_bus.signal_handlers['signal']), 1)
+
+    def test_emit_and_wait_await_coroutine_handlers_concurrently(self):
+        """EventBus: Test if EventBus.emit_and_wait() await the coroutine handlers concurrently"""
+        received = list()
+
+        async def slow_handler(value):
+            await asyncio.sleep(0.1)
+            received.append(value)
+
+        self.event_bus.connect('signal', slow_handler)
+        self.event_bus.connect('signal', slow_handler)
+        self.event_bus.connect('signal', received.append)
+        starting_time = time()
+        self.assertFalse(asyncio.run(self.event_bus.emit_and_wait('signal', 42)))
+        self.assertLess(time() - starting_time, 0.19)
+        self.assertEqual(received, [42, 42, 42])
+
+    def test_emit_and_wait_timeout(self):
+        """EventBus: Test if EventBus.emit_and_wait() raise asyncio.TimeoutError after the timeout"""
+        async def slow_handler():
+            await asyncio.sleep(10)
+
+        self.event_bus.connect('signal', slow_handler)
+        self.assertRaises(asyncio.TimeoutError, asyncio.run, self.event_bus.emit_and_wait('signal', timeout=0.01))
+
+    def test_emit_schedule_coroutine_handlers_on_mainloop(self):
+        """EventBus: Test if EventBus.emit() schedule the coroutine handlers on the MainLoop asyncio loop"""
+        received = list()
+
+        async def handler(value):
+            await asyncio.sleep(0)
+            received.append(value)
+
+        mainloop = GLXBob.MainLoop()
+        self.event_bus.set_asyncio_loop(mainloop.get_asyncio_loop())
+        self.assertEqual(self.event_bus.get_asyncio_loop(), mainloop.get_asyncio_loop())
+        self.event_bus.connect('signal', handler)
+        self.event_bus.emit('signal', 42)
+        self.assertEqual(received, [])
+        for _ in range(4):
+            mainloop._run_asyncio()
+        self.assertEqual(received, [42])
+        mainloop.get_asyncio_loop().close()
+
+    def test_raise_runtimeerror_when_no_asyncio_loop(self):
+        """EventBus: Test raise RuntimeError when EventBus.emit() have a coroutine handler and no asyncio loop"""
+        async def handler():
+            pass
+
+        self.event_bus.connect('signal', handler)
+        self.assertRaises(RuntimeError, self.event_bus.emit, 'signal')
+
     # def test_get_set__is_running(self):
         # handle_1 = self.event_bus.connect("coucou1", print_hello1)
         # handle_2 = self.event_bus.connect("coucou1", print_hello2)
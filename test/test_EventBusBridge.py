@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import threading
+from time import time
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+# Unittest
+class TestEventBusBridge(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'bridge.sock')
+        self.receiver_bus = GLXBob.EventBus()
+        self.sender_bus = GLXBob.EventBus()
+        self.receiver = GLXBob.EventBusBridge(self.receiver_bus)
+        self.receiver.listen(self.path)
+        self.sender = GLXBob.EventBusBridge(self.sender_bus, signals=['forwarded'], batch_size=8)
+        self.sender.connect_peer(self.path)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        self.sender.close()
+        self.receiver.close()
+        self.directory.cleanup()
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def process_until(self, condition, timeout=5.0):
+        deadline = time() + timeout
+        while not condition() and time() < deadline:
+            self.sender.process()
+            self.receiver.process(0.01)
+
+    def test_forward_selected_signals(self):
+        """EventBusBridge: Test if only the selected signals are emitted on the peer bus"""
+        received = list()
+        self.receiver_bus.connect('forwarded', lambda *args: received.append(('forwarded', args)))
+        self.receiver_bus.connect('local', lambda *args: received.append(('local', args)))
+
+        self.sender_bus.emit('local', 1)
+        self.sender_bus.emit('forwarded', 1, 'two', 3.0, b'four', (5, None))
+        self.process_until(lambda: received)
+        self.assertEqual(received, [('forwarded', (1, 'two', 3.0, b'four', (5, None)))])
+
+    def test_batch_preserve_order(self):
+        """EventBusBridge: Test if batched emissions are received in the emission order"""
+        received = list()
+        self.receiver_bus.connect('forwarded', received.append)
+        for value in range(1000):
+            self.sender_bus.emit('forwarded', value)
+        self.process_until(lambda: len(received) == 1000)
+        self.assertEqual(received, list(range(1000)))
+
+    def test_skip_not_serialisable(self):
+        """EventBusBridge: Test if a not serialisable emission is skipped without break the next ones"""
+        received = list()
+        self.receiver_bus.connect('forwarded', received.append)
+        self.sender_bus.emit('forwarded', 1)
+        self.sender_bus.emit('forwarded', object())
+        self.sender_bus.emit('forwarded', 2)
+        self.sender.flush()
+        self.sender_bus.emit('forwarded', 3)
+        self.process_until(lambda: len(received) == 3)
+        self.assertEqual(received, [1, 2, 3])
+        self.assertEqual(self.sender.get_skipped(), 1)
+
+    def test_forward_from_threads(self):
+        """EventBusBridge: Test if the emissions of concurrent threads are all received in they thread order"""
+        received = list()
+        self.receiver_bus.connect('forwarded', lambda *args: received.append(args))
+
+        def produce(name):
+            for value in range(500):
+                self.sender_bus.emit('forwarded', name, value)
+
+        threads = [threading.Thread(target=produce, args=(name,)) for name in range(4)]
+        for thread in threads:
+            thread.start()
+        # The producers flush the full batches while the bridge is processed
+        while any(thread.is_alive() for thread in threads):
+            self.sender.process()
+        for thread in threads:
+            thread.join()
+        self.process_until(lambda: len(received) == 2000)
+        self.assertEqual(len(received), 2000)
+        for name in range(4):
+            self.assertEqual([value for thread_name, value in received if thread_name == name], list(range(500)))
+
+    def test_receiving_is_by_thread(self):
+        """EventBusBridge: Test if a other thread can forward while the bridge emit the received signals"""
+        echo_bus = GLXBob.EventBus()
+        echo = GLXBob.EventBusBridge(echo_bus)
+        echo.listen(self.path + '.echo')
+        relay_bus = GLXBob.EventBus()
+        relay = GLXBob.EventBusBridge(relay_bus, signals=['reply'])
+        relay.listen(self.path + '.relay')
+        relay.connect_peer(self.path + '.echo')
+        self.sender.connect_peer(self.path + '.relay')
+        received = list()
+        echo_bus.connect('reply', received.append)
+
+        def on_forwarded(value):
+            # Emitted by the receiving thread, not send back
+            relay_bus.emit('reply', 'receiving thread')
+            thread = threading.Thread(target=relay_bus.emit, args=('reply', 'other thread'))
+            thread.start()
+            thread.join()
+
+        relay_bus.connect('forwarded', on_forwarded)
+        self.sender_bus.emit('forwarded', 0)
+        self.sender.flush()
+        deadline = time() + 5.0
+        while not received and time() < deadline:
+            relay.process(0.01)
+            echo.process(0.01)
+        relay.close()
+        echo.close()
+        self.assertEqual(received, ['other thread'])
+
+    def test_raise_typeerror_batch_size(self):
+        """EventBusBridge: Test raise TypeError when batch_size parameter is not a int"""
+        self.assertRaises(TypeError, GLXBob.EventBusBridge, self.sender_bus, None, 1.0)
+
+    def test_attach_to_mainloop(self):
+        """EventBusBridge: Test if EventBusBridge.attach() add a idle source to the MainLoop"""
+        mainloop = GLXBob.MainLoop()
+        source_id = self.sender.attach(mainloop)
+        self.assertTrue(mainloop.source_remove(source_id))
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test EventBusBridge Class script\n')
+    sys.stdout.write('--------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import socket
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+# Unittest
+class TestEventBusMetrics(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.event_bus = GLXBob.EventBus()
+        self.metrics = GLXBob.EventBusMetrics()
+        self.event_bus.set_metrics(self.metrics)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def do_nothing(self, *args):
+        pass
+
+    def raise_error(self, *args):
+        raise ValueError('handler failure')
+
+    def test_get_set_metrics(self):
+        """EventBusMetrics: Test 'metrics' attribute with 'EventBus.set_metrics()' and 'EventBus.get_metrics()'"""
+        self.assertEqual(self.event_bus.get_metrics(), self.metrics)
+        self.event_bus.set_metrics()
+        self.assertIsNone(self.event_bus.get_metrics())
+
+    def test_signal_counters(self):
+        """EventBusMetrics: Test the emits, deliveries, blocked and exceptions counters by signal"""
+        self.event_bus.connect('signal', self.do_nothing)
+        blocked_id = self.event_bus.connect('signal', self.do_nothing)
+        self.event_bus.connect('failing', self.raise_error)
+        self.event_bus.handler_block(blocked_id)
+        for _ in range(3):
+            self.event_bus.emit('signal', 1)
+        self.event_bus.emit('without-handler')
+        self.assertRaises(ValueError, self.event_bus.emit, 'failing')
+
+        signals = self.metrics.snapshot()['signals']
+        self.assertEqual(signals['signal'], {'emits': 3, 'deliveries': 3, 'blocked': 3, 'exceptions': 0})
+        self.assertEqual(signals['without-handler']['emits'], 1)
+        self.assertEqual(signals['failing'], {'emits': 1, 'deliveries': 1, 'blocked': 0, 'exceptions': 1})
+
+    def test_handler_latency_histogram(self):
+        """EventBusMetrics: Test the handler latency histogram of the snapshot"""
+        handler_id = self.event_bus.connect('signal', self.do_nothing)
+        for _ in range(5):
+            self.event_bus.emit('signal')
+        infos = self.metrics.snapshot()['handlers'][handler_id]
+        self.assertEqual(infos['signal'], 'signal')
+        self.assertIn('do_nothing', infos['handler'])
+        self.assertEqual(infos['count'], 5)
+        self.assertEqual(infos['buckets'][-1], (float('inf'), 5))
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot(), {'signals': {}, 'handlers': {}})
+
+    def test_disconnected_handler_histogram_removed(self):
+        """EventBusMetrics: Test the histogram of a disconnected handler is removed"""
+        for _ in range(1000):
+            handler_id = self.event_bus.connect('signal', self.do_nothing)
+            self.event_bus.emit('signal')
+            self.event_bus.disconnect(handler_id)
+        self.assertEqual(self.metrics.snapshot()['handlers'], {})
+        self.assertNotIn('handler_latency_seconds_count', self.metrics.to_prometheus())
+        self.assertEqual(self.metrics.snapshot()['signals']['signal']['emits'], 1000)
+
+        self.event_bus.connect('signal', self.do_nothing)
+        self.event_bus.emit('signal')
+        self.event_bus._reset()
+        self.assertEqual(self.metrics.snapshot()['handlers'], {})
+
+    def test_self_disconnected_handler_histogram_removed(self):
+        """EventBusMetrics: Test the histogram of a handler it disconnect itself is not created again"""
+        handler_ids = list()
+        handler_ids.append(self.event_bus.connect('signal', lambda: self.event_bus.disconnect(handler_ids[0])))
+        self.event_bus.emit('signal')
+        self.assertEqual(self.metrics.snapshot()['handlers'], {})
+        self.assertFalse(self.metrics.remove_handler(handler_ids[0]))
+        self.assertEqual(self.metrics.snapshot()['signals']['signal']['deliveries'], 1)
+
+    def test_handler_connected_before_set_metrics(self):
+        """EventBusMetrics: Test the histogram of a handler connected before 'EventBus.set_metrics()'"""
+        event_bus = GLXBob.EventBus()
+        handler_id = event_bus.connect('signal', self.do_nothing)
+        event_bus.set_metrics(self.metrics)
+        event_bus.emit('signal')
+        self.assertEqual(self.metrics.snapshot()['handlers'][handler_id]['count'], 1)
+        # The histogram is kept by reset() and filled again
+        self.metrics.reset()
+        event_bus.emit('signal')
+        self.assertEqual(self.metrics.snapshot()['handlers'][handler_id]['count'], 1)
+
+    def test_emits_counted_before_delivery_policy(self):
+        """EventBusMetrics: Test the emissions merged by a delivery policy are counted as emits"""
+        self.event_bus.connect('signal', self.do_nothing)
+        self.event_bus.set_signal_policy('signal', GLXBob.Coalesce())
+        for value in range(1000):
+            self.event_bus.emit('signal', value)
+        self.assertEqual(self.event_bus.dispatch_pending(), 1)
+        signals = self.metrics.snapshot()['signals']
+        self.assertEqual(signals['signal']['emits'], 1000)
+        self.assertEqual(signals['signal']['deliveries'], 1)
+
+    def test_write_prometheus_to_file_and_socket(self):
+        """EventBusMetrics: Test the Prometheus text exposition written to a file and a socket"""
+        self.event_bus.connect('sig"nal', self.do_nothing)
+        self.event_bus.emit('sig"nal')
+        text = self.metrics.to_prometheus()
+        self.assertIn('glxbob_eventbus_emits_total{signal="sig\\"nal"} 1\n', text)
+        self.assertIn('# TYPE glxbob_eventbus_handler_latency_seconds histogram\n', text)
+        self.assertIn('le="+Inf"} 1\n', text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'glxbob.prom')
+            self.metrics.write_prometheus(path)
+            with open(path) as exposition:
+                self.assertEqual(exposition.read(), text)
+
+        writer, reader = socket.socketpair()
+        self.metrics.write_prometheus(writer)
+        writer.close()
+        received = b''
+        chunk = reader.recv(65536)
+        while chunk:
+            received += chunk
+            chunk = reader.recv(65536)
+        reader.close()
+        self.assertEqual(received.decode('utf-8'), text)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test EventBusMetrics Class script\n')
+    sys.stdout.write('---------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
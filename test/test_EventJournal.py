@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# Unittest
+class TestEventJournal(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'events.journal')
+        self.event_bus = GLXBob.EventBus()
+        self.clock = FakeClock()
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        self.directory.cleanup()
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def record(self, count, index_interval=16, chunk_size=4096):
+        recorder = GLXBob.EventRecorder(self.event_bus, self.path, index_interval=index_interval,
+                                        clock=self.clock, chunk_size=chunk_size)
+        for value in range(count):
+            self.clock.now = float(value)
+            self.event_bus.emit('signal', value, 'payload')
+        return recorder
+
+    def test_record_and_replay(self):
+        """EventJournal: Test if EventReplayer.replay() re-emit every recorded emission"""
+        recorder = self.record(1000)
+        self.event_bus.emit('not-serialisable', object())
+        recorder.close()
+        self.assertEqual(recorder.get_recorded(), 1000)
+        self.assertEqual(recorder.get_skipped(), 1)
+
+        received = list()
+        event_bus = GLXBob.EventBus()
+        event_bus.connect('signal', lambda value, text: received.append(value))
+        replayer = GLXBob.EventReplayer(self.path)
+        self.assertEqual(replayer.replay(event_bus), 1000)
+        self.assertEqual(received, list(range(1000)))
+        self.assertEqual(replayer.get_emitted(), 1000)
+        replayer.close()
+
+    def test_close_with_concurrent_emissions(self):
+        """EventJournal: Test if EventRecorder.close() is safe with emissions in progress in other threads"""
+        import threading
+        recorder = GLXBob.EventRecorder(self.event_bus, self.path, chunk_size=4096)
+        errors = list()
+
+        def emit():
+            try:
+                for value in range(2000):
+                    self.event_bus.emit('signal', value, 'payload')
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=emit) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        recorder.close()
+        for thread in threads:
+            thread.join()
+        # A emission it have take the hook before it removal is ignored
+        recorder._record('signal', (0, 'payload'))
+        recorder.close()
+        self.assertEqual(errors, [])
+        replayer = GLXBob.EventReplayer(self.path)
+        self.assertEqual(len(list(replayer)), recorder.get_recorded())
+        replayer.close()
+
+    def test_read_a_journal_still_recorded(self):
+        """EventJournal: Test if a journal can be read before the EventRecorder is closed"""
+        recorder = self.record(10)
+        replayer = GLXBob.EventReplayer(self.path)
+        self.assertEqual([record[2][0] for record in replayer], list(range(10)))
+        replayer.close()
+        recorder.close()
+
+    def test_seek(self):
+        """EventJournal: Test if EventReplayer.seek() use the index blocks and the not indexed records"""
+        self.record(100).close()
+        replayer = GLXBob.EventReplayer(self.path)
+        for timestamp in (0.0, 15.0, 16.0, 42.5, 95.0, 99.0):
+            replayer.seek(timestamp)
+            self.assertEqual(next(iter(replayer))[0], float(int(timestamp + 0.5)))
+        replayer.seek(100.0)
+        self.assertEqual(list(replayer), [])
+        replayer.rewind()
+        self.assertEqual(len(list(replayer)), 100)
+        replayer.close()
+
+    def test_raise_valueerror_when_not_a_journal(self):
+        """EventJournal: Test raise ValueError when EventReplayer open a file it's not a journal"""
+        with open(self.path, 'wb') as journal:
+            journal.write(b'\0' * 64)
+        self.assertRaises(ValueError, GLXBob.EventReplayer, self.path)
+
+    def test_replay_through_mainloop(self):
+        """EventJournal: Test if EventReplayer.attach() replay the journal on the MainLoop frames"""
+        self.record(50).close()
+        received = list()
+        finished = list()
+        event_bus = GLXBob.EventBus()
+        event_bus.connect('signal', lambda value, text: received.append(value))
+        mainloop = GLXBob.MainLoop()
+        replayer = GLXBob.EventReplayer(self.path)
+        self.assertRaises(TypeError, replayer.attach, mainloop, event_bus, 1)
+        self.assertRaises(ValueError, replayer.attach, mainloop, event_bus, 0.0)
+
+        replayer.attach(mainloop, event_bus, speed=float('inf'), callback=lambda: finished.append(True))
+        while not finished:
+            mainloop._dispatch_sources()
+        self.assertEqual(received, list(range(50)))
+        self.assertGreater(replayer.get_throughput(), 0.0)
+        replayer.close()
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test EventJournal Class script\n')
+    sys.stdout.write('------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import threading
+import queue
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+# Unittest
+class TestEventQueue(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.event_bus = GLXBob.EventBus()
+        self.received = list()
+        self.event_bus.connect('signal', lambda value: self.received.append(value))
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_emit_queued(self):
+        """EventQueue: Test 'EventBus.emit_queued()' deliver on 'EventBus.dispatch_pending()'"""
+        self.assertTrue(self.event_bus.emit_queued('signal', 1))
+        self.assertTrue(self.event_bus.emit_queued('signal', 2))
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.event_bus.dispatch_pending(), 2)
+        self.assertEqual(self.received, [1, 2])
+        self.assertIsInstance(self.event_bus.get_signal_queue('signal'), GLXBob.EventQueue)
+
+    def test_dispatch_pending_handler_exception(self):
+        """EventQueue: Test a handler exception don't lose the next queued emissions"""
+        def fail_on_two(value):
+            if value == 2:
+                raise ValueError('handler failure')
+
+        self.event_bus.connect('signal', fail_on_two)
+        for value in range(5):
+            self.event_bus.emit_queued('signal', value)
+        with self.assertLogs(level='ERROR'):
+            self.assertEqual(self.event_bus.dispatch_pending(), 5)
+        self.assertEqual(self.received, [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.event_bus.get_signal_queue('signal')), 0)
+
+    def test_drop_oldest(self):
+        """EventQueue: Test the 'drop-oldest' overflow policy"""
+        event_queue = GLXBob.EventQueue(maxsize=3, overflow=GLXBob.OVERFLOW_DROP_OLDEST)
+        self.event_bus.set_signal_queue('signal', event_queue)
+        for value in range(10):
+            self.assertTrue(self.event_bus.emit_queued('signal', value))
+        self.event_bus.dispatch_pending()
+        self.assertEqual(self.received, [7, 8, 9])
+        self.assertEqual(event_queue.get_stats(), {'enqueued': 10, 'dequeued': 3, 'dropped': 7, 'size': 0})
+
+    def test_drop_newest(self):
+        """EventQueue: Test the 'drop-newest' overflow policy"""
+        event_queue = GLXBob.EventQueue(maxsize=3, overflow=GLXBob.OVERFLOW_DROP_NEWEST)
+        self.event_bus.set_signal_queue('signal', event_queue)
+        results = [self.event_bus.emit_queued('signal', value) for value in range(5)]
+        self.assertEqual(results, [True, True, True, False, False])
+        self.event_bus.dispatch_pending()
+        self.assertEqual(self.received, [0, 1, 2])
+        self.assertEqual(event_queue.get_stats()['dropped'], 2)
+
+    def test_raise(self):
+        """EventQueue: Test the 'raise' overflow policy raise queue.Full"""
+        self.event_bus.set_signal_queue('signal', GLXBob.EventQueue(maxsize=1))
+        self.event_bus.emit_queued('signal', 1)
+        self.assertRaises(queue.Full, self.event_bus.emit_queued, 'signal', 2)
+
+    def test_block(self):
+        """EventQueue: Test the 'block' overflow policy wait the consumer then raise after the timeout"""
+        event_queue = GLXBob.EventQueue(maxsize=1, overflow=GLXBob.OVERFLOW_BLOCK, timeout=0.01)
+        self.event_bus.set_signal_queue('signal', event_queue)
+        self.event_bus.emit_queued('signal', 1)
+        self.assertRaises(queue.Full, self.event_bus.emit_queued, 'signal', 2)
+
+        event_queue = GLXBob.EventQueue(maxsize=1, overflow=GLXBob.OVERFLOW_BLOCK, timeout=5.0)
+        self.event_bus.set_signal_queue('signal', event_queue)
+        self.event_bus.emit_queued('signal', 1)
+        producer = threading.Thread(target=self.event_bus.emit_queued, args=('signal', 2))
+        producer.start()
+        while not self.received:
+            self.event_bus.dispatch_pending()
+        producer.join()
+        self.event_bus.dispatch_pending()
+        self.assertEqual(self.received, [1, 2])
+
+    def test_watermarks(self):
+        """EventQueue: Test the high and low watermark callbacks"""
+        calls = list()
+        event_queue = GLXBob.EventQueue(
+            maxsize=10,
+            high_watermark=8,
+            low_watermark=2,
+            on_high=lambda q: calls.append(('high', len(q))),
+            on_low=lambda q: calls.append(('low', len(q)))
+        )
+        for value in range(9):
+            event_queue.put((value,))
+        self.assertTrue(event_queue.is_high())
+        event_queue.drain(5)
+        self.assertEqual(calls, [('high', 8)])
+        event_queue.drain(2)
+        self.assertEqual(calls, [('high', 8), ('low', 2)])
+        self.assertFalse(event_queue.is_high())
+
+    def test_clear_call_on_low(self):
+        """EventQueue: Test 'EventQueue.clear()' call 'on_low' when the queue was over the high watermark"""
+        calls = list()
+        event_queue = GLXBob.EventQueue(
+            maxsize=10,
+            high_watermark=8,
+            on_high=lambda q: calls.append('high'),
+            on_low=lambda q: calls.append('low')
+        )
+        event_queue.clear()
+        self.assertEqual(calls, [])
+        for value in range(8):
+            event_queue.put((value,))
+        event_queue.clear()
+        self.assertEqual(calls, ['high', 'low'])
+        self.assertFalse(event_queue.is_high())
+        self.assertEqual(event_queue.get_stats()['dropped'], 8)
+
+    def test_replaced_queue_wake_producers(self):
+        """EventQueue: Test a replaced or reset queue is cleared and wake the blocked producers"""
+        for replace in (lambda: self.event_bus.set_signal_queue('signal', GLXBob.EventQueue()),
+                        lambda: self.event_bus.set_signal_queue('signal'),
+                        self.event_bus._reset):
+            calls = list()
+            event_queue = GLXBob.EventQueue(maxsize=1, overflow=GLXBob.OVERFLOW_BLOCK, timeout=5.0,
+                                            on_low=lambda q: calls.append('low'))
+            self.event_bus.set_signal_queue('signal', event_queue)
+            self.event_bus.emit_queued('signal', 1)
+            producer = threading.Thread(target=self.event_bus.emit_queued, args=('signal', 2))
+            producer.start()
+            # Wait the producer is blocked on the full queue
+            while producer.is_alive() and not event_queue._EventQueue__not_full._waiters:
+                producer.join(0.001)
+            replace()
+            producer.join(1.0)
+            self.assertFalse(producer.is_alive())
+            self.assertEqual(calls, ['low'])
+            self.assertIsNot(self.event_bus.get_signal_queue('signal'), event_queue)
+
+    def test_raise_parameters(self):
+        """EventQueue: Test raise TypeError and ValueError when the queue use wrong parameters"""
+        self.assertRaises(TypeError, GLXBob.EventQueue, maxsize=1.0)
+        self.assertRaises(ValueError, GLXBob.EventQueue, maxsize=0)
+        self.assertRaises(ValueError, GLXBob.EventQueue, overflow='sometimes')
+        self.assertRaises(TypeError, GLXBob.EventQueue, timeout=1)
+        self.assertRaises(ValueError, GLXBob.EventQueue, maxsize=10, high_watermark=2, low_watermark=4)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test EventQueue Class script\n')
+    sys.stdout.write('---------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+# Unittest
+class TestFairScheduler(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.event_bus = GLXBob.EventBus()
+        self.received = list()
+        for detailed_signal in ('bulk', 'bulk-2', 'input', 'metric'):
+            self.event_bus.set_signal_queue(detailed_signal, GLXBob.EventQueue(maxsize=10000))
+            self.event_bus.connect(detailed_signal, self._on_signal, detailed_signal)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def _on_signal(self, value, detailed_signal):
+        self.received.append((detailed_signal, value))
+
+    def _emit(self, detailed_signal, count):
+        for value in range(count):
+            self.event_bus.emit_queued(detailed_signal, value)
+
+    def _count(self, detailed_signal):
+        return len([name for name, _ in self.received if name == detailed_signal])
+
+    def test_schedule_weights(self):
+        """FairScheduler: Test the backlogged classes share the budget proportionally to they weights"""
+        scheduler = GLXBob.FairScheduler(weights={'bulk': 3}, classes={'bulk': 'bulk', 'metric': 'metric'},
+                                         budget=400)
+        self.event_bus.set_queue_scheduler(scheduler)
+        self.assertEqual(self.event_bus.get_queue_scheduler(), scheduler)
+        self._emit('bulk', 1000)
+        self._emit('metric', 1000)
+        self.assertEqual(self.event_bus.dispatch_pending(), 400)
+        self.assertEqual(self._count('bulk'), 300)
+        self.assertEqual(self._count('metric'), 100)
+        self.assertEqual(scheduler.get_delivered(), {'bulk': 300, 'metric': 100})
+        # The FIFO order of each signal is kept
+        self.assertEqual([value for name, value in self.received if name == 'metric'], list(range(100)))
+        self.assertEqual(len(self.event_bus.get_signal_queue('bulk')), 700)
+
+    def test_schedule_resume_interrupted_class(self):
+        """FairScheduler: Test a small budget keep the proportions over many calls"""
+        scheduler = GLXBob.FairScheduler(weights={'bulk': 3}, classes={'bulk': 'bulk', 'metric': 'metric'},
+                                         budget=2)
+        self.event_bus.set_queue_scheduler(scheduler)
+        self._emit('bulk', 100)
+        self._emit('metric', 100)
+        for _ in range(8):
+            self.assertEqual(self.event_bus.dispatch_pending(), 2)
+        self.assertEqual(self._count('bulk'), 12)
+        self.assertEqual(self._count('metric'), 4)
+
+    def test_schedule_quiet_class_latency(self):
+        """FairScheduler: Test a emission of a quiet class is delivered in the first round"""
+        scheduler = GLXBob.FairScheduler(weights={'bulk': 50}, classes={'bulk': 'bulk', 'bulk-2': 'bulk'},
+                                         budget=60)
+        scheduler.set_signal_class('input', 'input')
+        self.event_bus.set_queue_scheduler(scheduler)
+        self._emit('bulk', 5000)
+        self._emit('bulk-2', 5000)
+        self.event_bus.dispatch_pending()
+        self.received = list()
+        self._emit('input', 1)
+        self.event_bus.dispatch_pending()
+        self.assertIn(('input', 0), self.received)
+        # The signals of a class are served in round robin
+        self.assertLessEqual(abs(self._count('bulk') - self._count('bulk-2')), 1)
+
+    def test_schedule_pending_and_skipped(self):
+        """FairScheduler: Test the emissions queued during the call and the skipped signals wait"""
+        self.event_bus.set_queue_scheduler(GLXBob.FairScheduler())
+        self.event_bus.connect('input', lambda value: self.event_bus.emit_queued('input', value + 1))
+        self._emit('input', 1)
+        self._emit('metric', 2)
+        self.assertEqual(self.event_bus.dispatch_pending(skipped=('metric',)), 1)
+        self.assertEqual(self.received, [('input', 0)])
+        self.assertEqual(self.event_bus.dispatch_pending(), 3)
+        self.assertEqual(self.received, [('input', 0), ('input', 1), ('metric', 0), ('metric', 1)])
+
+    def test_schedule_time_budget(self):
+        """FairScheduler: Test the time budget stop the call"""
+        now = [0.0]
+
+        def clock():
+            now[0] += 0.001
+            return now[0]
+
+        self.event_bus.set_queue_scheduler(GLXBob.FairScheduler(time_budget=0.0045, clock=clock))
+        self._emit('metric', 10)
+        # The deadline is 5.5 ms after the first clock read, each emission take 1 ms
+        self.assertEqual(self.event_bus.dispatch_pending(), 5)
+        self.event_bus.set_queue_scheduler()
+        self.assertIsNone(self.event_bus.get_queue_scheduler())
+        self.assertEqual(self.event_bus.dispatch_pending(), 5)
+
+    def test_raise_fair_scheduler(self):
+        """FairScheduler: Test raise TypeError and ValueError"""
+        self.assertRaises(TypeError, GLXBob.FairScheduler, budget=1.0)
+        self.assertRaises(TypeError, GLXBob.FairScheduler, time_budget=1)
+        self.assertRaises(TypeError, GLXBob.FairScheduler, weights={'bulk': 1.5})
+        self.assertRaises(ValueError, GLXBob.FairScheduler, weights={'bulk': 0})
+        scheduler = GLXBob.FairScheduler(classes={'metric': 'telemetry'})
+        self.assertEqual(scheduler.get_signal_class('metric'), 'telemetry')
+        scheduler.set_signal_class('metric')
+        self.assertEqual(scheduler.get_signal_class('metric'), 'default')
+        self.assertEqual(scheduler.get_class_weight('telemetry'), 1)
+
+
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test FairScheduler Class script\n')
+    sys.stdout.write('------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+# Unittest
+class TestFileSource(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'ingest.log')
+        self.event_bus = GLXBob.EventBus()
+        self.received = list()
+        self.event_bus.connect('file-chunk', self._on_chunk)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        self.directory.cleanup()
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def _on_chunk(self, chunk, offset):
+        self.assertIsInstance(chunk, memoryview)
+        self.received.append((bytes(chunk), offset))
+
+    def _write(self, data, mode='ab'):
+        with open(self.path, mode) as destination:
+            destination.write(data)
+
+    def test_dispatch_frame_budget(self):
+        """FileSource: Test 'dispatch()' emit memoryview chunks up to the frame budget"""
+        self._write(bytes(range(100)) * 10, 'wb')
+        file_source = GLXBob.FileSource(self.event_bus, self.path, chunk_size=128, frame_budget=256, follow=False)
+        self.assertTrue(file_source.dispatch())
+        self.assertEqual([offset for _, offset in self.received], [0, 128])
+        self.assertEqual(file_source.get_offset(), 256)
+        while file_source.dispatch():
+            pass
+        self.assertEqual(b''.join(chunk for chunk, _ in self.received), bytes(range(100)) * 10)
+        self.assertEqual(file_source.get_stats()['bytes'], 1000)
+        self.assertEqual(file_source.get_stats()['chunks'], 8)
+        # The file is closed at the end of a not followed file
+        self.assertFalse(file_source.dispatch())
+
+    def test_dispatch_separator(self):
+        """FileSource: Test 'dispatch()' cut the chunks after the last separator"""
+        self._write(b'first line\nsecond line\nthird', 'wb')
+        file_source = GLXBob.FileSource(self.event_bus, self.path, chunk_size=16, separator=b'\n', poll_interval=0.0)
+        self.assertTrue(file_source.dispatch())
+        self.assertEqual(self.received, [(b'first line\n', 0), (b'second line\n', 11)])
+        # The incomplete last line is emitted when it end
+        self._write(b' line\n')
+        file_source.dispatch()
+        self.assertEqual(self.received[-1], (b'third line\n', 23))
+
+    def test_dispatch_follow_growth(self):
+        """FileSource: Test 'dispatch()' follow the growth of the file"""
+        self._write(b'', 'wb')
+        file_source = GLXBob.FileSource(self.event_bus, self.path, poll_interval=0.0)
+        self.assertTrue(file_source.dispatch())
+        self.assertEqual(self.received, [])
+        self._write(b'abc')
+        file_source.dispatch()
+        self._write(b'def')
+        file_source.dispatch()
+        self.assertEqual(self.received, [(b'abc', 0), (b'def', 3)])
+
+    def test_dispatch_follow_rotation(self):
+        """FileSource: Test 'dispatch()' read the end of a rotated file then the new file"""
+        self._write(b'old', 'wb')
+        file_source = GLXBob.FileSource(self.event_bus, self.path, poll_interval=0.0)
+        file_source.dispatch()
+        self._write(b'-end')
+        os.rename(self.path, self.path + '.1')
+        self._write(b'new', 'wb')
+        file_source.dispatch()
+        self.assertEqual(self.received, [(b'old', 0), (b'-end', 3), (b'new', 0)])
+        self.assertEqual(file_source.get_stats()['rotations'], 1)
+
+    def test_dispatch_follow_rotation_incomplete_record(self):
+        """FileSource: Test 'dispatch()' emit the not terminated last line of a rotated file"""
+        self._write(b'first line\nsecond', 'wb')
+        file_source = GLXBob.FileSource(self.event_bus, self.path, separator=b'\n', poll_interval=0.0)
+        file_source.dispatch()
+        self.assertEqual(self.received, [(b'first line\n', 0)])
+        os.rename(self.path, self.path + '.1')
+        self._write(b'new line\n', 'wb')
+        file_source.dispatch()
+        self.assertEqual(self.received, [(b'first line\n', 0), (b'second', 11), (b'new line\n', 0)])
+        self.assertEqual(file_source.get_stats()['rotations'], 1)
+
+    def test_dispatch_follow_truncation(self):
+        """FileSource: Test 'dispatch()' read a truncated file from the start"""
+        self._write(b'abcdef', 'wb')
+        file_source = GLXBob.FileSource(self.event_bus, self.path, poll_interval=0.0)
+        file_source.dispatch()
+        self._write(b'xy', 'wb')
+        file_source.dispatch()
+        self.assertEqual(self.received, [(b'abcdef', 0), (b'xy', 0)])
+        self.assertEqual(file_source.get_stats()['truncations'], 1)
+        file_source.close()
+        self.assertFalse(file_source.dispatch())
+
+    def test_mainloop_idle_add(self):
+        """FileSource: Test the source stream a file in a MainLoop"""
+        self._write(b'x' * 4096, 'wb')
+        mainloop = GLXBob.MainLoop()
+        mainloop.get_timer().set_fps(200.0)
+        file_source = GLXBob.FileSource(mainloop.get_event_bus(), self.path, chunk_size=1024, frame_budget=1024,
+                                        follow=False, offset=1024)
+        mainloop.get_event_bus().connect('file-chunk', self._on_chunk)
+        mainloop.idle_add(file_source.dispatch)
+        mainloop.idle_add(lambda: len(self.received) < 3 or mainloop.quit())
+        self.assertRaises(SystemExit, mainloop.run)
+        mainloop.get_asyncio_loop().close()
+        self.assertEqual([offset for _, offset in self.received], [1024, 2048, 3072])
+
+    def test_raise_file_source(self):
+        """FileSource: Test raise TypeError of the constructor"""
+        self._write(b'', 'wb')
+        self.assertRaises(TypeError, GLXBob.FileSource, self.event_bus, self.path, chunk_size=1.0)
+        self.assertRaises(TypeError, GLXBob.FileSource, self.event_bus, self.path, frame_budget='1')
+        self.assertRaises(TypeError, GLXBob.FileSource, self.event_bus, self.path, offset=None)
+        self.assertRaises(TypeError, GLXBob.FileSource, self.event_bus, self.path, separator='\n')
+
+
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test FileSource Class script\n')
+    sys.stdout.write('---------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+from GLXBob.FrameTrace import read_frame_trace, EVENT_NONE, EVENT_GOAL, EVENT_UP, EVENT_DOWN, HEADER, RECORD
+
+
+# Unittest
+class TestFrameTrace(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'frames.trace')
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        self.directory.cleanup()
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_write_read(self):
+        """FrameTrace: Test 'FrameTraceWriter.write()' records are read back by 'read_frame_trace()'"""
+        writer = GLXBob.FrameTraceWriter(self.path)
+        writer.write(1.0, 0.01, 60.0, 0.1)
+        writer.write(1.02, -0.002, 59.9, -0.1, EVENT_DOWN, True)
+        self.assertEqual(writer.get_written(), 2)
+        writer.close()
+        writer.close()
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 2 * RECORD.size)
+        self.assertEqual(read_frame_trace(self.path), [
+            (1.0, 0.01, 60.0, RECORD.unpack(RECORD.pack(0, 0, 0, 0.1, 0, 0))[3], EVENT_NONE, 0),
+            (1.02, -0.002, 59.9, RECORD.unpack(RECORD.pack(0, 0, 0, -0.1, 0, 0))[3], EVENT_DOWN, 1)
+        ])
+
+        # A record truncated by a crash is ignored
+        with open(self.path, 'ab') as trace:
+            trace.write(b'\x00' * (RECORD.size // 2))
+        self.assertEqual(len(read_frame_trace(self.path)), 2)
+
+    def test_read_bad_file(self):
+        """FrameTrace: Test 'read_frame_trace()' raise ValueError when the file is not a frame trace"""
+        with open(self.path, 'wb') as trace:
+            trace.write(b'GLXJ' + b'\x00' * 64)
+        self.assertRaises(ValueError, read_frame_trace, self.path)
+        with open(self.path, 'wb') as trace:
+            trace.write(b'GLX')
+        self.assertRaises(ValueError, read_frame_trace, self.path)
+
+    def test_timer_frame_trace(self):
+        """FrameTrace: Test 'Timer.set_frame_trace()' record each frame of 'Timer.tick()'"""
+        timer = GLXBob.Timer()
+        writer = GLXBob.FrameTraceWriter(self.path)
+        timer.set_frame_trace(writer)
+        self.assertEqual(timer.get_frame_trace(), writer)
+        timer.set_fps(500.0)
+        results = [timer.tick() for _ in range(timer._get_frame_max() * 2 + 2)]
+        writer.close()
+        timer.set_frame_trace()
+        self.assertIsNone(timer.get_frame_trace())
+
+        records = read_frame_trace(self.path)
+        self.assertEqual(len(records), len(results))
+        self.assertEqual([not record[5] for record in records], results)
+        times = [record[0] for record in records]
+        self.assertEqual(times, sorted(times))
+        # The frame rate memory is analysed after frame_max frames
+        events = [record[4] for record in records]
+        self.assertIn(events[timer._get_frame_max()], (EVENT_GOAL, EVENT_UP, EVENT_DOWN))
+        self.assertEqual(events[0], EVENT_NONE)
+
+    def test_raise_parameters(self):
+        """FrameTrace: Test raise TypeError when the writer use wrong parameters"""
+        self.assertRaises(TypeError, GLXBob.FrameTraceWriter, self.path, buffer_size=1.0)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test FrameTrace Class script\n')
+    sys.stdout.write('---------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
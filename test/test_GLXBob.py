@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import subprocess
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+def loaded_modules(statement):
+    # The modules loaded by the statement, in a new interpreter
+    output = subprocess.check_output(
+        [sys.executable, '-c', statement + '; import sys; print(" ".join(sys.modules))'],
+        cwd=os.path.dirname(current_dir),
+        universal_newlines=True
+    )
+    return set(output.split())
+
+
+# Unittest
+class TestGLXBob(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_lazy_import(self):
+        """GLXBob: Test 'import GLXBob' import none of the package modules"""
+        modules = loaded_modules('import GLXBob')
+        self.assertEqual(sorted(name for name in modules if name.startswith('GLXBob.')), [])
+        for name in ('logging', 'asyncio', 'threading', 'random', 'uuid'):
+            self.assertNotIn(name, modules)
+
+    def test_lazy_import_heavy_modules(self):
+        """GLXBob: Test the MainLoop import path avoid asyncio, inspect and multiprocessing"""
+        modules = loaded_modules(
+            'from GLXBob import MainLoop; MainLoop().get_event_bus().connect("signal", lambda: None)'
+        )
+        self.assertIn('GLXBob.EventBus', modules)
+        for name in ('asyncio', 'inspect', 'multiprocessing', 'concurrent.futures', 'random', 'uuid',
+                     'GLXBob.FrameTrace', 'mmap', 'GLXBob.Pacer', 'GLXBob.DataStore', 'GLXBob.EventQueue'):
+            self.assertNotIn(name, modules)
+
+    def test_exported_names(self):
+        """GLXBob: Test the exported names are the classes and constants, even after a submodule import"""
+        import GLXBob.EventBus
+        from GLXBob.EventBus import EventBus
+        self.assertIs(GLXBob.EventBus, EventBus)
+        self.assertIs(GLXBob.Timer, __import__('GLXBob.Timer', fromlist=('Timer',)).Timer)
+        self.assertEqual(GLXBob.PRIORITY_LOW, 300)
+        for name in GLXBob.__all__:
+            self.assertIn(name, dir(GLXBob))
+            self.assertNotIsInstance(getattr(GLXBob, name), type(sys))
+
+    def test_raise_attribute_error(self):
+        """GLXBob: Test raise AttributeError for a unknown name"""
+        self.assertRaises(AttributeError, getattr, GLXBob, 'Unknown')
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test GLXBob Package script\n')
+    sys.stdout.write('-------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
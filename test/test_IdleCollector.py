@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import gc
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+def make_due(thresholds):
+    # Each generation 1 collection increase the generation 2 count, the thresholds are the ones saved before
+    # IdleCollector.enable(), it raise the generation 2 threshold
+    for _ in range(thresholds[2] + 1):
+        gc.collect(1)
+
+
+# Unittest
+class TestIdleCollector(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.thresholds = gc.get_threshold()
+        self.idle_collector = GLXBob.IdleCollector(generation=2, max_deferred=3)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        self.idle_collector.disable()
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_enable_disable(self):
+        """IdleCollector: Test 'enable()' and 'disable()' save and restore the gc configuration"""
+        self.idle_collector.enable()
+        self.assertTrue(self.idle_collector.is_enabled())
+        self.assertEqual(gc.get_threshold()[:2], self.thresholds[:2])
+        self.assertGreater(gc.get_threshold()[2], self.thresholds[2])
+        self.idle_collector.disable()
+        self.assertFalse(self.idle_collector.is_enabled())
+        self.assertEqual(gc.get_threshold(), self.thresholds)
+
+        idle_collector = GLXBob.IdleCollector(generation=0)
+        idle_collector.enable()
+        self.assertFalse(gc.isenabled())
+        idle_collector.disable()
+        self.assertTrue(gc.isenabled())
+
+    def test_collect_in_slack(self):
+        """IdleCollector: Test a due collection is run when the slack is greater than it cost"""
+        self.idle_collector.enable()
+        self.assertIsNone(self.idle_collector.collect(1.0))
+        make_due(self.thresholds)
+        self.assertEqual(self.idle_collector.collect(1.0), 2)
+        self.assertIsNotNone(self.idle_collector.get_costs()[2])
+        self.assertEqual(self.idle_collector.get_stats()['collections'], 1)
+
+    def test_collect_deferred_then_forced(self):
+        """IdleCollector: Test a due collection is deferred without slack, then forced after max_deferred frames"""
+        self.idle_collector.enable()
+        make_due(self.thresholds)
+        self.assertIsNone(self.idle_collector.collect(0.0))
+        self.assertIsNone(self.idle_collector.collect(0.0))
+        self.assertEqual(self.idle_collector.collect(0.0), 2)
+        stats = self.idle_collector.get_stats()
+        self.assertEqual((stats['deferred'], stats['forced']), (2, 1))
+
+    def test_automatic_collections(self):
+        """IdleCollector: Test the collections run by the interpreter are counted, not the own collections"""
+        self.idle_collector.enable()
+        gc.collect()
+        self.assertEqual(self.idle_collector.get_stats()['automatic'], 1)
+        make_due(self.thresholds)
+        self.idle_collector.collect(1.0)
+        self.assertEqual(self.idle_collector.get_stats()['automatic'], 1)
+
+    def test_timer_idle_handler(self):
+        """IdleCollector: Test the Timer call the idle handler with the slack of the frame"""
+        timer = GLXBob.Timer(fps=100.0)
+        slacks = list()
+        timer.set_idle_handler(slacks.append)
+        self.assertEqual(timer.get_idle_handler(), slacks.append)
+        for _ in range(3):
+            timer.tick()
+        self.assertTrue(slacks)
+        for slack in slacks:
+            self.assertGreater(slack, 0.0)
+
+    def test_raise_parameters(self):
+        """IdleCollector: Test raise TypeError and ValueError when the collector use wrong parameters"""
+        self.assertRaises(TypeError, GLXBob.IdleCollector, generation=2.0)
+        self.assertRaises(ValueError, GLXBob.IdleCollector, generation=1)
+        self.assertRaises(TypeError, GLXBob.IdleCollector, max_deferred=None)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test IdleCollector Class script\n')
+    sys.stdout.write('------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
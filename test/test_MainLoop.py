@@ -73,6 +73,191 @@ class TestMainLoop(unittest.TestCase):
         self.assertEqual(fps_min_increment, mainloop.get_timer().get_fps_min_increment())
         self.assertEqual(fps_max_increment, mainloop.get_timer().get_fps_max_increment())
 
+    def test_get_set_event_bus(self):
+        """MainLoop: Test 'event_bus' attribute with 'MainLoop.set_event_bus()' and 'MainLoop.get_event_bus()'"""
+        event_bus = GLXBob.EventBus()
+        self.assertIsInstance(self.mainloop.get_event_bus(), GLXBob.EventBus)
+        self.mainloop.set_event_bus(event_bus)
+        self.assertEqual(event_bus, self.mainloop.get_event_bus())
+        self.mainloop.set_event_bus()
+        self.assertNotEqual(event_bus, self.mainloop.get_event_bus())
+
+    def test_idle_add_and_source_remove(self):
+        """MainLoop: Test if idle_add() sources are dispatched by priority until they don't return True"""
+        received = list()
+
+        def callback(name, keep):
+            received.append(name)
+            return keep
+
+        self.mainloop.idle_add(callback, 'once', None)
+        self.mainloop.idle_add(callback, 'always', True, priority=GLXBob.PRIORITY_HIGH)
+        removed_id = self.mainloop.idle_add(callback, 'removed', True)
+        self.assertTrue(self.mainloop.source_remove(removed_id))
+        self.assertFalse(self.mainloop.source_remove(removed_id))
+
+        self.mainloop._dispatch_sources()
+        self.mainloop._dispatch_sources()
+        self.assertEqual(received, ['always', 'once', 'always'])
+
+    def test_get_set_idle_collector(self):
+        """MainLoop: Test the idle collector is enabled during run() then the gc configuration is restored"""
+        import gc
+        thresholds = gc.get_threshold()
+        idle_collector = GLXBob.IdleCollector()
+        self.mainloop.set_idle_collector(idle_collector)
+        self.assertEqual(self.mainloop.get_idle_collector(), idle_collector)
+        states = list()
+
+        def frame():
+            states.append(idle_collector.is_enabled())
+            if len(states) == 3:
+                self.mainloop.quit()
+            return True
+
+        self.mainloop.get_timer().set_fps(200.0)
+        self.mainloop.idle_add(frame)
+        self.assertRaises(SystemExit, self.mainloop.run)
+        self.assertEqual(states, [True, True, True])
+        self.assertFalse(idle_collector.is_enabled())
+        self.assertEqual(gc.get_threshold(), thresholds)
+        self.mainloop.set_idle_collector()
+        self.assertIsNone(self.mainloop.get_timer().get_idle_handler())
+
+    def test_idle_collector_restored_on_exception(self):
+        """MainLoop: Test the gc configuration is restored when a callback raise a exception"""
+        import gc
+        thresholds = gc.get_threshold()
+        idle_collector = GLXBob.IdleCollector(generation=0)
+        self.mainloop.set_idle_collector(idle_collector)
+
+        def raise_error():
+            raise ValueError('callback failure')
+
+        self.mainloop.idle_add(raise_error)
+        self.assertRaises(ValueError, self.mainloop.run)
+        self.assertFalse(idle_collector.is_enabled())
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(gc.get_threshold(), thresholds)
+
+    def test_add_task_round_robin(self):
+        """MainLoop: Test 'add_task()' advance the tasks by priority then round-robin, and emit 'task-done'"""
+        steps = list()
+        ended = list()
+
+        def job(name, count):
+            for index in range(count):
+                steps.append((name, index))
+                yield
+            return name
+
+        async def coroutine_job():
+            import asyncio
+            steps.append(('coroutine', 0))
+            await asyncio.sleep(0)
+            steps.append(('coroutine', 1))
+            return 'coroutine'
+
+        self.mainloop.get_event_bus().connect('task-done', lambda task_id, value: ended.append((task_id, value)))
+        first = self.mainloop.add_task(job('a', 2))
+        second = self.mainloop.add_task(job('b', 2))
+        urgent = self.mainloop.add_task(job('urgent', 1), priority=GLXBob.PRIORITY_HIGH)
+        third = self.mainloop.add_task(coroutine_job(), priority=GLXBob.PRIORITY_LOW)
+        self.assertEqual(self.mainloop.get_tasks(), [urgent, first, second, third])
+        # A infinite slice, the tasks run until they end
+        self.mainloop._run_tasks(float('inf'))
+        self.assertEqual(steps, [
+            ('urgent', 0), ('a', 0), ('b', 0), ('a', 1), ('b', 1), ('coroutine', 0), ('coroutine', 1)
+        ])
+        self.assertEqual(ended, [(urgent, 'urgent'), (first, 'a'), (second, 'b'), (third, 'coroutine')])
+        self.assertEqual(self.mainloop.get_tasks(), [])
+
+    def test_add_task_time_slice(self):
+        """MainLoop: Test the tasks stop at the end of the task slice and advance a least one step by frame"""
+        import time
+        steps = list()
+
+        def job():
+            while True:
+                time.sleep(0.001)
+                steps.append(None)
+                yield
+
+        task_id = self.mainloop.add_task(job())
+        self.mainloop._run_tasks(0.0)
+        self.assertEqual(len(steps), 1)
+        self.mainloop._run_tasks(self.mainloop.get_timer().get_time() + 0.01)
+        self.assertGreater(len(steps), 2)
+        self.assertLess(len(steps), 13)
+        self.assertTrue(self.mainloop.remove_task(task_id))
+        self.assertFalse(self.mainloop.remove_task(task_id))
+        self.assertEqual(self.mainloop.get_tasks(), [])
+
+    def test_add_task_spent_slice(self):
+        """MainLoop: Test a spent task slice advance only the first task, the others wait they turn"""
+        steps = list()
+
+        def job(name):
+            while True:
+                steps.append(name)
+                yield
+
+        self.mainloop.add_task(job('a'))
+        self.mainloop.add_task(job('b'))
+        self.mainloop.add_task(job('low'), priority=GLXBob.PRIORITY_LOW)
+        for _ in range(4):
+            self.mainloop._run_tasks(0.0)
+        # One step by frame, the same priority tasks in turn, the low priority task starve
+        self.assertEqual(steps, ['a', 'b', 'a', 'b'])
+        for task_id in self.mainloop.get_tasks():
+            self.mainloop.remove_task(task_id)
+
+    def test_add_task_failed(self):
+        """MainLoop: Test a task it raise a exception is removed and emit 'task-failed'"""
+        import logging
+        failed = list()
+
+        def job():
+            yield
+            raise ValueError('task failure')
+
+        self.mainloop.get_event_bus().connect('task-failed', lambda task_id, error: failed.append((task_id, error)))
+        task_id = self.mainloop.add_task(job())
+        logging.disable(logging.ERROR)
+        try:
+            self.mainloop._run_tasks(float('inf'))
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(failed[0][0], task_id)
+        self.assertIsInstance(failed[0][1], ValueError)
+        self.assertEqual(self.mainloop.get_tasks(), [])
+
+    def test_add_task_run(self):
+        """MainLoop: Test 'MainLoop.run()' advance the tasks in the task slice of each frame"""
+        frames = list()
+
+        def job():
+            for _ in range(3):
+                yield
+            self.mainloop.quit()
+
+        def frame():
+            frames.append(len(self.mainloop.get_tasks()))
+            return True
+
+        self.mainloop.set_task_slice(0.25)
+        self.assertEqual(self.mainloop.get_task_slice(), 0.25)
+        self.mainloop.idle_add(frame)
+        self.mainloop.add_task(job())
+        self.assertRaises(SystemExit, self.mainloop.run)
+        self.assertEqual(frames[0], 1)
+        self.assertEqual(self.mainloop.get_tasks(), [])
+
+    def test_raise_add_task(self):
+        """MainLoop: Test raise TypeError when 'add_task()' and 'set_task_slice()' use wrong parameters"""
+        self.assertRaises(TypeError, self.mainloop.add_task, lambda: None)
+        self.assertRaises(TypeError, self.mainloop.set_task_slice, 1)
+
 # Run test if call directly
 if __name__ == '__main__':
     sys.stdout.write('Galaxie-Bob Unit Test Timer Class script\n')
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import logging
+from time import sleep
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+# Unittest
+class TestOverloadDetector(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.overload_detector = GLXBob.OverloadDetector(enter_frames=3, exit_frames=2, shed_signals=('preview',))
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_update_hysteresis(self):
+        """OverloadDetector: Test 'update()' enter and exit the overload with hysteresis"""
+        detector = self.overload_detector
+        # Isolated late frames are not a overload
+        self.assertEqual([detector.update(late, 0.5) for late in (True, True, False, True, False)], [None] * 5)
+        self.assertFalse(detector.is_overloaded())
+        self.assertEqual([detector.update(False, 0.99) for _ in range(3)], [None, None, 'enter'])
+        self.assertTrue(detector.is_overloaded())
+        # Between the watermarks the state don't change
+        self.assertEqual([detector.update(False, 0.8) for _ in range(5)], [None] * 5)
+        self.assertEqual([detector.update(False, 0.1), detector.update(True, 0.1)], [None, None])
+        self.assertEqual([detector.update(False, 0.1) for _ in range(2)], [None, 'exit'])
+        self.assertFalse(detector.is_overloaded())
+        self.assertEqual(detector.get_usage(), 0.1)
+        self.assertEqual(detector.get_stats(), {'overloads': 1, 'overload_frames': 9, 'shed': 0})
+
+    def test_should_shed(self):
+        """OverloadDetector: Test 'should_shed()' skip the low priority sources during the overload"""
+        detector = self.overload_detector
+        self.assertFalse(detector.should_shed(GLXBob.PRIORITY_LOW))
+        for _ in range(3):
+            detector.update(True, 1.5)
+        self.assertTrue(detector.should_shed(GLXBob.PRIORITY_LOW))
+        self.assertFalse(detector.should_shed(GLXBob.PRIORITY_DEFAULT))
+        self.assertFalse(detector.should_shed(GLXBob.PRIORITY_HIGH))
+        self.assertEqual(detector.get_stats()['shed'], 1)
+        self.assertEqual(detector.get_shed_priority(), GLXBob.PRIORITY_DEFAULT)
+        self.assertEqual(detector.get_shed_signals(), frozenset(('preview',)))
+
+    def test_dispatch_pending_skipped(self):
+        """OverloadDetector: Test 'EventBus.dispatch_pending()' keep the queued emissions of the skipped signals"""
+        event_bus = GLXBob.EventBus()
+        received = list()
+        event_bus.connect('preview', lambda: received.append('preview'))
+        event_bus.connect('critical', lambda: received.append('critical'))
+        event_bus.emit_queued('preview')
+        event_bus.emit_queued('critical')
+        self.assertEqual(event_bus.dispatch_pending(frozenset(('preview',))), 1)
+        self.assertEqual(received, ['critical'])
+        self.assertEqual(event_bus.dispatch_pending(), 1)
+        self.assertEqual(received, ['critical', 'preview'])
+
+    def test_mainloop_overload(self):
+        """OverloadDetector: Test 'MainLoop.run()' emit 'overload-enter' and shed the low priority work"""
+        mainloop = GLXBob.MainLoop()
+        mainloop.set_overload_detector(self.overload_detector)
+        self.assertEqual(mainloop.get_overload_detector(), self.overload_detector)
+        calls = list()
+        mainloop.get_event_bus().connect('overload-enter', lambda detector: calls.append(('enter', detector)))
+        mainloop.get_event_bus().connect('preview', lambda: calls.append('preview'))
+
+        def heavy():
+            # Each frame overrun the budget of a 1000 fps frame
+            sleep(0.005)
+            calls.append('heavy')
+            mainloop.get_event_bus().emit_queued('preview')
+            if calls.count('heavy') == 6:
+                mainloop.quit()
+            return True
+
+        def low():
+            calls.append('low')
+            return True
+
+        mainloop.get_timer().set_fps(1000.0)
+        mainloop.idle_add(heavy, priority=GLXBob.PRIORITY_HIGH)
+        mainloop.idle_add(low, priority=GLXBob.PRIORITY_LOW)
+        logging.disable(logging.WARNING)
+        try:
+            self.assertRaises(SystemExit, mainloop.run)
+        finally:
+            logging.disable(logging.NOTSET)
+        enter = calls.index(('enter', self.overload_detector))
+        # The overload is entered at the end of the third frame, then the low source and the preview are shed
+        self.assertEqual(calls[:enter].count('heavy'), 3)
+        self.assertEqual(calls[:enter].count('low'), 3)
+        self.assertNotIn('low', calls[enter:])
+        self.assertNotIn('preview', calls[enter:])
+        self.assertEqual(len(mainloop.get_event_bus().get_signal_queue('preview')), 3)
+
+    def test_raise_parameters(self):
+        """OverloadDetector: Test raise TypeError and ValueError when the detector use wrong parameters"""
+        self.assertRaises(TypeError, GLXBob.OverloadDetector, enter_frames=1.0)
+        self.assertRaises(TypeError, GLXBob.OverloadDetector, exit_frames='1')
+        self.assertRaises(TypeError, GLXBob.OverloadDetector, enter_usage=1)
+        self.assertRaises(TypeError, GLXBob.OverloadDetector, exit_usage=1)
+        self.assertRaises(ValueError, GLXBob.OverloadDetector, enter_usage=0.5, exit_usage=0.6)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test OverloadDetector Class script\n')
+    sys.stdout.write('---------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import selectors
+import socket
+import threading
+import time
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+class FakeTimerfdOs(object):
+    """
+    The timerfd functions of :py:mod:`os` on a pipe, a thread write the expiration at the armed deadline. The
+    other attributes are the :py:mod:`os` ones.
+    """
+    TFD_NONBLOCK = 0o4000
+    TFD_CLOEXEC = 0o2000000
+    TFD_TIMER_ABSTIME = 1
+
+    def __init__(self):
+        self.armed = list()
+        self.timers = list()
+        self.reader, self.writer = os.pipe()
+        os.set_blocking(self.reader, False)
+
+    def __getattr__(self, name):
+        return getattr(os, name)
+
+    def timerfd_create(self, clockid, flags=0):
+        self.armed.append(('create', clockid, flags))
+        return self.reader
+
+    def timerfd_settime(self, fd, flags=0, initial=0.0, interval=0.0):
+        self.armed.append(('settime', flags, initial))
+        timer = threading.Timer(max(initial - time.monotonic(), 0.0), os.write, (self.writer, b'\x01' * 8))
+        timer.start()
+        self.timers.append(timer)
+
+    def close(self, fd):
+        for timer in self.timers:
+            timer.join()
+        os.close(self.reader)
+        os.close(self.writer)
+
+
+# Unittest
+class TestPacer(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.pacer = GLXBob.Pacer(use_timerfd=False)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        self.pacer.close()
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_absolute_deadlines(self):
+        """Pacer: Test the deadlines are absolute, the wakeup latency is not accumulated"""
+        interval = 0.005
+        start = self.pacer.get_time()
+        for _ in range(20):
+            self.pacer.schedule(interval)
+            self.pacer.wait()
+        elapsed = self.pacer.get_time() - start
+        # 20 frames, the drift is at most the latency of the last wakeup
+        self.assertGreaterEqual(elapsed, 20 * interval)
+        self.assertLess(elapsed, 20 * interval + 0.05)
+
+    def test_late_frame(self):
+        """Pacer: Test a late frame restart the schedule from it time"""
+        self.pacer.schedule(0.01)
+        self.assertLessEqual(self.pacer.schedule(-1.0), 0.0)
+        self.assertEqual(self.pacer.get_stats()['late'], 1)
+        self.assertGreater(self.pacer.schedule(1.0), 0.9)
+
+    def test_register(self):
+        """Pacer: Test the watched files are dispatched during the wait"""
+        reader, writer = socket.socketpair()
+        received = list()
+
+        def on_readable(fileobj, events, tag):
+            received.append((fileobj.recv(16), events, tag))
+            return True
+
+        self.pacer.register(reader, selectors.EVENT_READ, on_readable, 'tag')
+        writer.send(b'ping')
+        self.pacer.schedule(0.05)
+        self.assertEqual(self.pacer.wait(), 1)
+        self.assertEqual(received, [(b'ping', selectors.EVENT_READ, 'tag')])
+        self.assertEqual(self.pacer.get_stats()['watches'], 1)
+        self.assertTrue(self.pacer.unregister(reader))
+        self.assertFalse(self.pacer.unregister(reader))
+        reader.close()
+        writer.close()
+
+    def test_register_remove_watch(self):
+        """Pacer: Test a watch is removed when the callback don't return True"""
+        reader, writer = socket.socketpair()
+        self.pacer.register(reader, selectors.EVENT_READ, lambda fileobj, events: fileobj.recv(16))
+        writer.send(b'ping')
+        self.pacer.schedule(0.02)
+        self.pacer.wait()
+        self.assertEqual(self.pacer.get_stats()['watches'], 0)
+        reader.close()
+        writer.close()
+
+    def test_timerfd(self):
+        """Pacer: Test the timerfd backend when the platform have it"""
+        pacer = GLXBob.Pacer()
+        self.assertEqual(pacer.uses_timerfd(), hasattr(os, 'timerfd_create'))
+        start = pacer.get_time()
+        for _ in range(5):
+            pacer.schedule(0.002)
+            pacer.wait()
+        self.assertGreaterEqual(pacer.get_time() - start, 0.01)
+        pacer.close()
+
+    def test_late_frame_poll(self):
+        """Pacer: Test 'poll()' dispatch the ready watched files without wait"""
+        reader, writer = socket.socketpair()
+        received = list()
+        self.pacer.register(reader, selectors.EVENT_READ, lambda fileobj, events: received.append(fileobj.recv(16)))
+        self.assertEqual(self.pacer.poll(), 0)
+        writer.send(b'ping')
+        self.assertEqual(self.pacer.poll(), 1)
+        self.assertEqual(received, [b'ping'])
+        reader.close()
+        writer.close()
+
+    def test_timer_late_frames_dispatch_io(self):
+        """Pacer: Test the Timer late frames still dispatch the watched files"""
+        timer = GLXBob.Timer(fps=1000.0)
+        timer.set_pacer(self.pacer)
+        reader, writer = socket.socketpair()
+        received = list()
+
+        def on_readable(fileobj, events):
+            received.append(fileobj.recv(16))
+            return True
+
+        self.pacer.register(reader, selectors.EVENT_READ, on_readable)
+        for _ in range(5):
+            writer.send(b'ping')
+            # The frame work take longer than the frame
+            time.sleep(0.003)
+            timer.tick()
+        self.assertGreaterEqual(self.pacer.get_stats()['late'], 1)
+        self.assertEqual(b''.join(received), b'ping' * 5)
+        reader.close()
+        writer.close()
+
+    def test_timerfd_fake(self):
+        """Pacer: Test the timerfd backend arm absolute deadlines and read the expirations, on a fake timerfd"""
+        fake_os = FakeTimerfdOs()
+        pacer_module = sys.modules[GLXBob.Pacer.__module__]
+        pacer_module.os = fake_os
+        try:
+            pacer = GLXBob.Pacer()
+            self.assertTrue(pacer.uses_timerfd())
+            reader, writer = socket.socketpair()
+            received = list()
+            pacer.register(reader, selectors.EVENT_READ, lambda fileobj, events: received.append(fileobj.recv(16)))
+            writer.send(b'ping')
+            start = pacer.get_time()
+            pacer.schedule(0.02)
+            self.assertEqual(pacer.wait(), 1)
+            self.assertGreaterEqual(pacer.get_time() - start, 0.02)
+            pacer.schedule(0.02)
+            pacer.wait()
+            pacer.close()
+            reader.close()
+            writer.close()
+        finally:
+            pacer_module.os = os
+        self.assertEqual(received, [b'ping'])
+        settimes = [call for call in fake_os.armed if call[0] == 'settime']
+        self.assertEqual([call[1] for call in settimes], [fake_os.TFD_TIMER_ABSTIME] * 2)
+        # Absolute deadlines, the second one is one interval after the first
+        self.assertAlmostEqual(settimes[1][2] - settimes[0][2], 0.02, places=6)
+
+    @unittest.skipUnless(hasattr(os, 'timerfd_create'), 'os.timerfd_create require Linux and Python 3.13')
+    def test_timerfd_native(self):
+        """Pacer: Test the native timerfd backend wait the absolute deadlines"""
+        pacer = GLXBob.Pacer()
+        self.assertTrue(pacer.uses_timerfd())
+        start = pacer.get_time()
+        for _ in range(10):
+            pacer.schedule(0.002)
+            pacer.wait()
+        self.assertGreaterEqual(pacer.get_time() - start, 0.02)
+        self.assertLess(pacer.get_time() - start, 0.07)
+        pacer.close()
+
+    def test_raise_typeerror(self):
+        """Pacer: Test raise TypeError when the use_timerfd parameter is not a bool"""
+        self.assertRaises(TypeError, GLXBob.Pacer, use_timerfd=1)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test Pacer Class script\n')
+    sys.stdout.write('----------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
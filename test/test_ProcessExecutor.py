@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import asyncio
+import time
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+# The handlers run in the worker processes, they must be picklable
+def describe(data, tag):
+    return type(data).__name__, bytes(data[:4]), len(data), tag
+
+
+def shared_blocks():
+    return sorted(name for name in os.listdir('/dev/shm') if name.startswith('psm_'))
+
+
+# Unittest
+class TestProcessExecutor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.process_executor = GLXBob.ProcessExecutor(max_workers=1, threshold=1024)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.process_executor.shutdown()
+
+    def setUp(self):
+        # Before the test start
+        self.event_bus = GLXBob.EventBus()
+        self.event_bus.set_process_executor(self.process_executor)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_submit_shared_memory(self):
+        """ProcessExecutor: Test large buffers are received as shared memory and the blocks are released"""
+        before = shared_blocks()
+        self.assertEqual(
+            self.process_executor.submit(describe, (b'abcd' * 1024, 1)).result(),
+            ('memoryview', b'abcd', 4096, 1)
+        )
+        self.assertEqual(
+            self.process_executor.submit(describe, (bytearray(b'wxyz' * 1024), 2)).result(),
+            ('memoryview', b'wxyz', 4096, 2)
+        )
+        # The blocks are released by a future callback, it can run after result() return
+        deadline = time.monotonic() + 5.0
+        while shared_blocks() != before and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(shared_blocks(), before)
+
+    def test_submit_small_buffer(self):
+        """ProcessExecutor: Test small buffers stay in the pickle stream"""
+        self.assertEqual(self.process_executor.submit(describe, (b'abcdef', 3)).result(), ('bytes', b'abcd', 6, 3))
+
+    def test_connect_executor(self):
+        """ProcessExecutor: Test 'EventBus.connect()' with executor='process' and 'EventBus.emit_and_wait()'"""
+        received = list()
+        self.event_bus.connect('signal', describe, 'tag', executor='process')
+        self.event_bus.connect('signal', lambda data, tag: received.append(tag), 'local')
+
+        async def emit():
+            return await self.event_bus.emit_and_wait('signal', b'\x00' * 2048, timeout=30.0)
+
+        self.assertFalse(asyncio.run(emit()))
+        self.assertEqual(received, ['local'])
+
+    def test_raise_executor(self):
+        """ProcessExecutor: Test raise ValueError and TypeError for wrong executor parameters"""
+        async def coroutine_handler():
+            pass
+
+        self.assertRaises(ValueError, self.event_bus.connect, 'signal', describe, executor='thread')
+        self.assertRaises(ValueError, self.event_bus.connect, 'signal', coroutine_handler, executor='process')
+        self.assertRaises(TypeError, GLXBob.ProcessExecutor, max_workers=1.0)
+        self.assertRaises(TypeError, GLXBob.ProcessExecutor, threshold=None)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test ProcessExecutor Class script\n')
+    sys.stdout.write('--------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+import logging
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+def worker_niceness():
+    # Run in the worker process
+    return os.getpriority(os.PRIO_PROCESS, 0)
+
+
+# Unittest
+@unittest.skipUnless(hasattr(os, 'sched_setaffinity'), 'require os.sched_setaffinity()')
+class TestSchedulingPolicy(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.cpus = tuple(sorted(os.sched_getaffinity(0)))
+        self.nice = os.getpriority(os.PRIO_PROCESS, 0)
+        logging.disable(logging.WARNING)
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        logging.disable(logging.NOTSET)
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_apply(self):
+        """SchedulingPolicy: Test 'apply()' set the affinity, the scheduling class and the niceness"""
+        scheduling_policy = GLXBob.SchedulingPolicy(cpus=self.cpus[:1], nice=self.nice, policy=GLXBob.SCHED_OTHER)
+        try:
+            self.assertEqual(scheduling_policy.apply(), {'cpus': self.cpus[:1], 'policy': 'other', 'nice': self.nice})
+            self.assertEqual(tuple(os.sched_getaffinity(0)), self.cpus[:1])
+            self.assertEqual(os.sched_getscheduler(0), os.SCHED_OTHER)
+        finally:
+            os.sched_setaffinity(0, self.cpus)
+        self.assertEqual(GLXBob.SchedulingPolicy().apply(), {'cpus': None, 'policy': None, 'nice': None})
+
+    def test_apply_fallback(self):
+        """SchedulingPolicy: Test 'apply()' skip the refused settings and apply the others"""
+        scheduling_policy = GLXBob.SchedulingPolicy(cpus=(1 << 20,), nice=self.nice, policy=GLXBob.SCHED_FIFO)
+        with mock.patch.object(os, 'sched_setscheduler', side_effect=PermissionError(1, 'Operation not permitted')):
+            self.assertEqual(scheduling_policy.apply(), {'cpus': None, 'policy': None, 'nice': self.nice})
+        self.assertEqual(tuple(sorted(os.sched_getaffinity(0))), self.cpus)
+        self.assertEqual(os.sched_getscheduler(0), os.SCHED_OTHER)
+
+    def test_mainloop_scheduling_policy(self):
+        """SchedulingPolicy: Test 'MainLoop.run()' apply the scheduling policy of the loop"""
+        mainloop = GLXBob.MainLoop()
+        scheduling_policy = GLXBob.SchedulingPolicy(cpus=self.cpus[:1])
+        mainloop.set_scheduling_policy(scheduling_policy)
+        self.assertEqual(mainloop.get_scheduling_policy(), scheduling_policy)
+        affinities = list()
+
+        def frame():
+            affinities.append(tuple(os.sched_getaffinity(0)))
+            mainloop.quit()
+
+        mainloop.idle_add(frame)
+        try:
+            self.assertRaises(SystemExit, mainloop.run)
+        finally:
+            os.sched_setaffinity(0, self.cpus)
+        self.assertEqual(affinities, [self.cpus[:1]])
+
+    def test_process_executor_scheduling_policy(self):
+        """SchedulingPolicy: Test the workers of a 'ProcessExecutor' apply it scheduling policy"""
+        scheduling_policy = GLXBob.SchedulingPolicy(nice=min(self.nice + 5, 19))
+        process_executor = GLXBob.ProcessExecutor(max_workers=1, scheduling_policy=scheduling_policy)
+        self.assertEqual(process_executor.get_scheduling_policy(), scheduling_policy)
+        try:
+            self.assertEqual(process_executor.submit(worker_niceness, ()).result(timeout=30), min(self.nice + 5, 19))
+        finally:
+            process_executor.shutdown()
+
+    def test_raise_parameters(self):
+        """SchedulingPolicy: Test raise TypeError and ValueError when the policy use wrong parameters"""
+        self.assertRaises(ValueError, GLXBob.SchedulingPolicy, cpus=())
+        self.assertRaises(TypeError, GLXBob.SchedulingPolicy, nice=1.0)
+        self.assertRaises(ValueError, GLXBob.SchedulingPolicy, policy='deadline')
+        self.assertRaises(TypeError, GLXBob.SchedulingPolicy, priority='10')
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test SchedulingPolicy Class script\n')
+    sys.stdout.write('---------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+
+
+class FakeHost(object):
+    # A host it oversleep each sleep of a fixed overshoot
+    def __init__(self, overshoot):
+        self.overshoot = overshoot
+        self.now = 0.0
+        self.sleeps = list()
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, duration):
+        self.sleeps.append(duration)
+        self.now += duration + self.overshoot
+
+
+# Unittest
+class TestSleepCalibrator(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.host = FakeHost(0.0005)
+        self.sleep_calibrator = GLXBob.SleepCalibrator(
+            durations=(0.001, 0.01),
+            samples=3,
+            smoothing=0.5,
+            clock=self.host.clock,
+            sleep_function=self.host.sleep
+        )
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_calibrate(self):
+        """SleepCalibrator: Test 'calibrate()' measure the overshoot of each duration"""
+        self.assertFalse(self.sleep_calibrator.is_calibrated())
+        self.assertEqual(self.sleep_calibrator.get_model(), [])
+        self.assertEqual(self.sleep_calibrator.get_overshoot(0.005), 0.0)
+        model = self.sleep_calibrator.calibrate()
+        self.assertTrue(self.sleep_calibrator.is_calibrated())
+        self.assertEqual([duration for duration, _ in model], [0.001, 0.01])
+        for _, overshoot in model:
+            self.assertAlmostEqual(overshoot, 0.0005)
+        self.assertEqual(len(self.host.sleeps), 6)
+        self.assertAlmostEqual(self.sleep_calibrator.get_distribution()[0.01]['max'], 0.0005)
+
+    def test_sleep_compensated(self):
+        """SleepCalibrator: Test 'sleep()' subtract the expected overshoot and the sleep is on time"""
+        self.assertAlmostEqual(self.sleep_calibrator.sleep(0.005), 0.0005)
+        self.sleep_calibrator.calibrate()
+        del self.host.sleeps[:]
+        self.assertAlmostEqual(self.sleep_calibrator.sleep(0.005), 0.0)
+        self.assertAlmostEqual(self.host.sleeps[0], 0.0045)
+        self.assertEqual(self.sleep_calibrator.sleep(0.0), 0.0)
+        self.assertEqual(self.sleep_calibrator.sleep(0.0001), 0.0)
+        self.assertEqual(self.sleep_calibrator.get_sleeps(), 2)
+
+    def test_live_recalibration(self):
+        """SleepCalibrator: Test the measured overshoots update the model when the host change"""
+        self.sleep_calibrator.calibrate()
+        self.host.overshoot = 0.002
+        errors = [self.sleep_calibrator.sleep(0.01) for _ in range(20)]
+        self.assertAlmostEqual(errors[0], 0.0015)
+        self.assertAlmostEqual(errors[-1], 0.0, places=6)
+        self.assertAlmostEqual(self.sleep_calibrator.get_overshoot(0.01), 0.002, places=6)
+
+    def test_get_set_model(self):
+        """SleepCalibrator: Test 'set_model()' and the interpolation of 'get_overshoot()'"""
+        self.sleep_calibrator.set_model([(0.01, 0.002), (0.001, 0.001)])
+        self.assertEqual(self.sleep_calibrator.get_model(), [(0.001, 0.001), (0.01, 0.002)])
+        self.assertAlmostEqual(self.sleep_calibrator.get_overshoot(0.0055), 0.0015)
+        self.assertEqual(self.sleep_calibrator.get_overshoot(0.0001), 0.001)
+        self.assertEqual(self.sleep_calibrator.get_overshoot(1.0), 0.002)
+        self.assertRaises(ValueError, self.sleep_calibrator.set_model, [])
+
+    def test_mainloop_calibrate(self):
+        """SleepCalibrator: Test 'MainLoop.run()' calibrate the sleep calibrator of the timer"""
+        mainloop = GLXBob.MainLoop()
+        mainloop.get_timer().set_sleep_calibrator(self.sleep_calibrator)
+        self.assertEqual(mainloop.get_timer().get_sleep_calibrator(), self.sleep_calibrator)
+        mainloop.idle_add(mainloop.quit)
+        self.assertRaises(SystemExit, mainloop.run)
+        self.assertTrue(self.sleep_calibrator.is_calibrated())
+        mainloop.get_timer().set_sleep_calibrator()
+        self.assertIsNone(mainloop.get_timer().get_sleep_calibrator())
+
+    def test_timer_sleep(self):
+        """SleepCalibrator: Test 'Timer.tick()' sleep with the sleep calibrator"""
+        timer = GLXBob.Timer()
+        timer.set_sleep_calibrator(self.sleep_calibrator)
+        timer.set_fps(100.0)
+        if timer.tick():
+            self.assertEqual(self.sleep_calibrator.get_sleeps(), 1)
+        else:
+            self.assertEqual(self.sleep_calibrator.get_sleeps(), 0)
+
+    def test_raise_parameters(self):
+        """SleepCalibrator: Test raise TypeError and ValueError when the calibrator use wrong parameters"""
+        self.assertRaises(TypeError, GLXBob.SleepCalibrator, samples=1.0)
+        self.assertRaises(TypeError, GLXBob.SleepCalibrator, smoothing=1)
+        self.assertRaises(ValueError, GLXBob.SleepCalibrator, durations=())
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test SleepCalibrator Class script\n')
+    sys.stdout.write('--------------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)
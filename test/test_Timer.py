@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+import tempfile
+import threading
 from random import randint, sample
 from time import time
 import sys
@@ -222,6 +224,100 @@ class TestTimer(unittest.TestCase):
         """Timer: Test raise TypeError when _set_be_fast_multiplicator() use a wrong type"""
         self.assertRaises(TypeError, self.timer._set_be_fast_multiplicator, str('Hello World!'))
 
+    def test_tick_after_frame_max(self):
+        """Timer: Test 'tick()' analyze the fps memory after frame_max frames"""
+        self.timer.set_fps(2000.0)
+        for _ in range(self.timer._get_frame_max() * 2 + 1):
+            self.assertIn(self.timer.tick(), (True, False))
+        self.assertLessEqual(self.timer._get_frame(), self.timer._get_frame_max())
+
+    def test_get_set_pacer(self):
+        """Timer: Test 'set_pacer()' and 'get_pacer()' method's, and 'tick()' wait with the pacer"""
+        pacer = GLXBob.Pacer()
+        self.timer.set_pacer(pacer)
+        self.assertEqual(self.timer.get_pacer(), pacer)
+        self.timer.set_fps(200.0)
+        start = pacer.get_time()
+        for _ in range(5):
+            self.timer.tick()
+        # 5 frames of about 5 milliseconds
+        self.assertGreaterEqual(pacer.get_time() - start, 0.02)
+        self.timer.set_pacer()
+        self.assertIsNone(self.timer.get_pacer())
+        pacer.close()
+
+    def test_export_import_state(self):
+        """Timer: Test 'export_state()' and 'import_state()' restore the learned state of a workload"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'timer.json')
+            self.assertFalse(self.timer.import_state(path, 'render'))
+            self.timer.set_sleep_calibrator(GLXBob.SleepCalibrator())
+            self.timer.get_sleep_calibrator().set_model([(0.001, 0.0002), (0.01, 0.0004)])
+            self.timer.set_fps(142.5)
+            self.timer._set_be_fast(True)
+            self.timer._set_be_fast_multiplicator(20)
+            self.timer._set_fps_memory([142.5, 142.4, 142.6])
+            self.timer.export_state(path, 'render')
+            GLXBob.Timer(fps=30.0).export_state(path, 'batch')
+
+            timer = GLXBob.Timer()
+            timer.set_sleep_calibrator(GLXBob.SleepCalibrator())
+            self.assertTrue(timer.import_state(path, 'render'))
+            self.assertEqual(timer.get_fps(), 142.5)
+            self.assertTrue(timer._get_be_fast())
+            self.assertEqual(timer._get_be_fast_multiplicator(), 20)
+            self.assertEqual(timer._get_fps_memory(), [142.5, 142.4, 142.6])
+            self.assertTrue(timer.get_sleep_calibrator().is_calibrated())
+            self.assertEqual(timer.get_sleep_calibrator().get_model(), [(0.001, 0.0002), (0.01, 0.0004)])
+            # The other workloads are kept
+            self.assertTrue(timer.import_state(path, 'batch'))
+            self.assertEqual(timer.get_fps(), 30.0)
+            self.assertFalse(timer.import_state(path, 'unknown'))
+            self.assertEqual(sorted(os.listdir(directory)), ['timer.json', 'timer.json.lock'])
+            # A new file is readable by the other users, a existing file keep it mode
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+            os.chmod(path, 0o600)
+            timer.export_state(path, 'render')
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+    def test_export_state_concurrent(self):
+        """Timer: Test the concurrent 'export_state()' keep every workload"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'timer.json')
+
+            def export(index):
+                for _ in range(20):
+                    GLXBob.Timer(fps=float(index + 10)).export_state(path, 'worker-' + str(index))
+
+            threads = [threading.Thread(target=export, args=(index,)) for index in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            timer = GLXBob.Timer()
+            for index in range(4):
+                self.assertTrue(timer.import_state(path, 'worker-' + str(index)))
+                self.assertEqual(timer.get_fps(), float(index + 10))
+
+    def test_import_state_invalid(self):
+        """Timer: Test 'import_state()' ignore a unreadable state and 'set_state()' clamp the fps"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'timer.json')
+            with open(path, 'w') as destination:
+                destination.write('{truncated')
+            self.assertFalse(self.timer.import_state(path))
+            with open(path, 'w') as destination:
+                destination.write('{"version": 1, "workloads": {"default": {"fps": "fast"}}}')
+            self.assertFalse(self.timer.import_state(path))
+            self.assertEqual(self.timer.get_fps(), 60.0)
+        self.timer.set_fps_max(100.0)
+        self.timer.set_state({'fps': 500.0})
+        self.assertEqual(self.timer.get_fps(), 100.0)
+        self.assertRaises(TypeError, self.timer.set_state, [])
+        self.assertRaises(ValueError, self.timer.set_state, {})
+        self.assertRaises(TypeError, self.timer.export_state, 'timer.json', None)
+        self.assertRaises(TypeError, self.timer.import_state, 'timer.json', 1)
+
 # Run test if call directly
 if __name__ == '__main__':
     sys.stdout.write('Galaxie-Bob Unit Test Timer Class script\n')
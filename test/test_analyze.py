@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import tempfile
+import subprocess
+import sys
+import os
+# Require when you haven't GLXBob as default Package
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(current_dir))
+import GLXBob
+from GLXBob.FrameTrace import EVENT_NONE, EVENT_GOAL, EVENT_UP, EVENT_DOWN
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from GLXBob import analyze
+
+
+# Unittest
+@unittest.skipIf(numpy is None, 'require NumPy')
+class TestAnalyze(unittest.TestCase):
+    def setUp(self):
+        # Before the test start
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'frames.trace')
+        # 1000 frames at 100 fps, the frames 500 to 502 and 900 are late by 5 milliseconds
+        writer = GLXBob.FrameTraceWriter(self.path)
+        time = 0.0
+        for frame in range(1000):
+            late = 500 <= frame <= 502 or frame == 900
+            time += 0.015 if late else 0.01
+            event = EVENT_NONE
+            if frame % 100 == 99:
+                event = (EVENT_UP, EVENT_DOWN, EVENT_GOAL)[min(frame // 300, 2)]
+            writer.write(time, -0.005 if late else 0.001, 100.0, 0.0, event, late)
+        writer.close()
+        sys.stdout.write(str(self.shortDescription() + ' ... '))
+
+    def tearDown(self):
+        # When the test is finish
+        self.directory.cleanup()
+        sys.stdout.write('OK\n')
+        sys.stdout.flush()
+
+    def test_load_trace(self):
+        """analyze: Test 'load_trace()' map the records as a NumPy array"""
+        records = analyze.load_trace(self.path)
+        self.assertEqual(len(records), 1000)
+        self.assertAlmostEqual(float(records['time'][0]), 0.01)
+        self.assertEqual(int(records['late'].sum()), 4)
+        empty = os.path.join(self.directory.name, 'empty.trace')
+        GLXBob.FrameTraceWriter(empty).close()
+        self.assertEqual(len(analyze.load_trace(empty)), 0)
+
+    def test_summarize(self):
+        """analyze: Test 'summarize()' fps, jitter, overruns and convergence events"""
+        summary = analyze.summarize(analyze.load_trace(self.path), window=100)
+        self.assertEqual(summary['frames'], 1000)
+        self.assertEqual(summary['late'], 4)
+        self.assertEqual(summary['overruns'], {'count': 2, 'longest': 3, 'mean': 2.0})
+        self.assertAlmostEqual(summary['jitter_ms']['p50'], 0.0, places=6)
+        self.assertAlmostEqual(summary['jitter_ms']['max'], 5.0, places=6)
+        self.assertAlmostEqual(summary['fps']['max'], 100.0, places=6)
+        self.assertLess(summary['fps']['min'], 100.0)
+        self.assertEqual(summary['events'], {'goal': 4, 'up': 3, 'down': 3, 'first_goal': 699, 'up_down': 1})
+        self.assertIn('overruns: 2 runs, longest 3 frames', analyze.format_summary(summary))
+
+    def test_sliding_fps_and_overrun_runs(self):
+        """analyze: Test 'sliding_fps()' and 'overrun_runs()'"""
+        self.assertEqual(analyze.sliding_fps(numpy.arange(5) * 0.5, 2).tolist(), [2.0, 2.0, 2.0])
+        self.assertEqual(len(analyze.sliding_fps(numpy.arange(2), 2)), 0)
+        starts, lengths = analyze.overrun_runs(numpy.array([1, 1, 0, 0, 1, 0, 1, 1, 1]))
+        self.assertEqual(starts.tolist(), [0, 4, 6])
+        self.assertEqual(lengths.tolist(), [2, 1, 3])
+
+    def test_window_summary_csv(self):
+        """analyze: Test 'window_summary()' and 'write_csv()' write a row by window"""
+        columns = analyze.window_summary(analyze.load_trace(self.path), window=250)
+        self.assertEqual(columns['window'].tolist(), [0, 1, 2])
+        # The window N hold the frames N * 250 + 1 to (N + 1) * 250, the first frame have no jitter
+        self.assertEqual(columns['late_ratio'].tolist(), [0.0, 1 / 250.0, 2 / 250.0])
+        csv = os.path.join(self.directory.name, 'summary.csv')
+        with open(csv, 'w') as destination:
+            analyze.write_csv(columns, destination)
+        with open(csv) as source:
+            lines = source.read().splitlines()
+        self.assertEqual(lines[0], ','.join(analyze.CSV_COLUMNS))
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[1].startswith('0,0.010000,250,100.000,100.000,'))
+
+    def test_command(self):
+        """analyze: Test the 'python -m GLXBob.analyze' command"""
+        csv = os.path.join(self.directory.name, 'summary.csv')
+        output = subprocess.check_output(
+            [sys.executable, '-m', 'GLXBob.analyze', self.path, '--window', '100', '--csv', csv],
+            cwd=os.path.dirname(current_dir),
+            universal_newlines=True
+        )
+        self.assertIn('frames: 1000', output)
+        self.assertTrue(os.path.exists(csv))
+        self.assertEqual(analyze.main([os.path.join(self.directory.name, 'missing.trace')]), 1)
+
+
+# Run test if call directly
+if __name__ == '__main__':
+    sys.stdout.write('Galaxie-Bob Unit Test analyze module script\n')
+    sys.stdout.write('-------------------------------------------\n')
+    sys.stdout.flush()
+    unittest.main(verbosity=0)